@@ -4,6 +4,7 @@ from .agent import (
     Agent,
     CallToolsNode,
     EndStrategy,
+    IncrementalHistoryProcessor,
     InstrumentationSettings,
     ModelRequestNode,
     UserPromptNode,
@@ -130,6 +131,7 @@ __all__ = (
     'UserPromptNode',
     'capture_run_messages',
     'InstrumentationSettings',
+    'IncrementalHistoryProcessor',
     # embeddings
     'Embedder',
     'EmbeddingModel',
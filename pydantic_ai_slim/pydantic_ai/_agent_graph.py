@@ -4,6 +4,7 @@ import asyncio
 import dataclasses
 import inspect
 import uuid
+from abc import ABC, abstractmethod
 from asyncio import Task
 from collections import defaultdict, deque
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
@@ -11,6 +12,7 @@ from contextlib import asynccontextmanager, contextmanager
 from contextvars import ContextVar
 from copy import deepcopy
 from dataclasses import field, replace
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeGuard, cast
 
 from opentelemetry.trace import Tracer
@@ -54,6 +56,7 @@ __all__ = (
     'build_run_context',
     'capture_run_messages',
     'HistoryProcessor',
+    'IncrementalHistoryProcessor',
 )
 
 
@@ -82,6 +85,44 @@ Can optionally accept a `RunContext` as a parameter.
 """
 
 
+class IncrementalHistoryProcessor(ABC, Generic[DepsT]):
+    """A history processor that only processes the messages that were added since it last ran.
+
+    Regular history processors are called with the whole message history before every model request. When an
+    instance of this class is used as a history processor, it's instead called with its own output from the
+    previous model request in the same agent run, and the messages that have been added since.
+
+    When its previous output can't be reused, e.g. on the first model request of a run or when the history was
+    changed in another way by another processor, it's called with an empty previous output and all messages.
+    """
+
+    @abstractmethod
+    async def process_new_messages(
+        self,
+        ctx: RunContext[DepsT],
+        previous_output: list[_messages.ModelMessage],
+        new_messages: list[_messages.ModelMessage],
+    ) -> list[_messages.ModelMessage]:
+        """Process the messages that were added since the previous call.
+
+        Args:
+            ctx: The run context.
+            previous_output: The messages this processor returned the previous time it was called in this run,
+                or an empty list if they can't be reused.
+            new_messages: The messages that were added to the message history since then.
+
+        Returns:
+            The processed message history, typically `previous_output` followed by the processed new messages.
+        """
+        raise NotImplementedError
+
+    async def __call__(
+        self, ctx: RunContext[DepsT], messages: list[_messages.ModelMessage]
+    ) -> list[_messages.ModelMessage]:
+        """Process a whole message history, like a regular history processor."""
+        return await self.process_new_messages(ctx, [], messages)
+
+
 @dataclasses.dataclass(kw_only=True)
 class GraphAgentState:
     """State kept across the execution of the agent graph."""
@@ -152,6 +193,10 @@ class GraphAgentDeps(Generic[DepsT, OutputDataT]):
     tracer: Tracer
     instrumentation_settings: InstrumentationSettings | None
 
+    message_history_cache: _MessageHistoryCache = dataclasses.field(
+        default_factory=lambda: _MessageHistoryCache(), repr=False
+    )
+
 
 class AgentNode(BaseNode[GraphAgentState, GraphAgentDeps[DepsT, Any], result.FinalResult[NodeRunEndT]]):
     """The base class for all agent nodes.
@@ -518,7 +563,9 @@ class ModelRequestNode(AgentNode[DepsT, NodeRunEndT]):
         ctx.deps.tool_manager = await ctx.deps.tool_manager.for_run_step(run_context)
 
         original_history = ctx.state.message_history[:]
-        message_history = await _process_message_history(original_history, ctx.deps.history_processors, run_context)
+        message_history = await _process_message_history(
+            original_history, ctx.deps.history_processors, run_context, ctx.deps.message_history_cache
+        )
         # `ctx.state.message_history` is the same list used by `capture_run_messages`, so we should replace its contents, not the reference
         ctx.state.message_history[:] = message_history
         # Update the new message index to ensure `result.new_messages()` returns the correct messages
@@ -527,7 +574,7 @@ class ModelRequestNode(AgentNode[DepsT, NodeRunEndT]):
         # Merge possible consecutive trailing `ModelRequest`s into one, with tool call parts before user parts,
         # but don't store it in the message history on state. This is just for the benefit of model classes that want clear user/assistant boundaries.
         # See `tests/test_tools.py::test_parallel_tool_return_with_deferred` for an example where this is necessary
-        message_history = _clean_message_history(message_history)
+        message_history = ctx.deps.message_history_cache.clean(message_history)
 
         model_request_parameters = await _prepare_request_parameters(ctx)
 
@@ -1340,9 +1387,18 @@ def build_agent_graph(
     UserPromptNode[DepsT, OutputT],
     result.FinalResult[OutputT],
 ]:
-    """Build the execution [Graph][pydantic_graph.Graph] for a given agent."""
+    """Build the execution [Graph][pydantic_graph.Graph] for a given agent.
+
+    The output type only parameterizes the graph for type checking, so graphs are cached by name and deps type and
+    reused across runs rather than rebuilt each time.
+    """
+    return _build_agent_graph(name or 'Agent', deps_type)
+
+
+@lru_cache(maxsize=256)
+def _build_agent_graph(name: str, deps_type: type[Any]) -> Graph[Any, Any, Any, Any]:
     g = GraphBuilder(
-        name=name or 'Agent',
+        name=name,
         state_type=GraphAgentState,
         deps_type=GraphAgentDeps[DepsT, OutputT],
         input_type=UserPromptNode[DepsT, OutputT],
@@ -1366,12 +1422,15 @@ async def _process_message_history(
     messages: list[_messages.ModelMessage],
     processors: Sequence[HistoryProcessor[DepsT]],
     run_context: RunContext[DepsT],
+    cache: _MessageHistoryCache | None = None,
 ) -> list[_messages.ModelMessage]:
     """Process message history through a sequence of processors."""
-    for processor in processors:
+    for index, processor in enumerate(processors):
         takes_ctx = is_takes_ctx(processor)
 
-        if is_async_callable(processor):
+        if isinstance(processor, IncrementalHistoryProcessor) and cache is not None:
+            messages = await cache.process(index, processor, run_context, messages)
+        elif is_async_callable(processor):
             if takes_ctx:
                 messages = await processor(run_context, messages)
             else:
@@ -1401,46 +1460,136 @@ def _clean_message_history(messages: list[_messages.ModelMessage]) -> list[_mess
     """Clean the message history by merging consecutive messages of the same type."""
     clean_messages: list[_messages.ModelMessage] = []
     for message in messages:
-        last_message = clean_messages[-1] if len(clean_messages) > 0 else None
+        _append_clean_message(clean_messages, message)
+    return clean_messages
 
-        if isinstance(message, _messages.ModelRequest):
-            if (
-                last_message
-                and isinstance(last_message, _messages.ModelRequest)
-                # Requests can only be merged if they have the same instructions
-                and (
-                    not last_message.instructions
-                    or not message.instructions
-                    or last_message.instructions == message.instructions
-                )
-            ):
-                parts = [*last_message.parts, *message.parts]
-                parts.sort(
-                    # Tool return parts always need to be at the start
-                    key=lambda x: 0 if isinstance(x, _messages.ToolReturnPart | _messages.RetryPromptPart) else 1
-                )
-                merged_message = _messages.ModelRequest(
-                    parts=parts,
-                    instructions=last_message.instructions or message.instructions,
-                    timestamp=message.timestamp or last_message.timestamp,
-                )
-                clean_messages[-1] = merged_message
+
+def _append_clean_message(clean_messages: list[_messages.ModelMessage], message: _messages.ModelMessage) -> bool:
+    """Append a message to a cleaned message history, merging it into the last message if possible.
+
+    Returns:
+        Whether the message was merged into the last message.
+    """
+    last_message = clean_messages[-1] if len(clean_messages) > 0 else None
+    if isinstance(message, _messages.ModelRequest):
+        if (
+            last_message
+            and isinstance(last_message, _messages.ModelRequest)
+            # Requests can only be merged if they have the same instructions
+            and (
+                not last_message.instructions
+                or not message.instructions
+                or last_message.instructions == message.instructions
+            )
+        ):
+            parts = [*last_message.parts, *message.parts]
+            parts.sort(
+                # Tool return parts always need to be at the start
+                key=lambda x: 0 if isinstance(x, _messages.ToolReturnPart | _messages.RetryPromptPart) else 1
+            )
+            merged_message = _messages.ModelRequest(
+                parts=parts,
+                instructions=last_message.instructions or message.instructions,
+                timestamp=message.timestamp or last_message.timestamp,
+            )
+            clean_messages[-1] = merged_message
+            return True
+    elif isinstance(message, _messages.ModelResponse):  # pragma: no branch
+        if (
+            last_message
+            and isinstance(last_message, _messages.ModelResponse)
+            # Responses can only be merged if they didn't really come from an API
+            and last_message.provider_response_id is None
+            and last_message.provider_name is None
+            and last_message.model_name is None
+            and message.provider_response_id is None
+            and message.provider_name is None
+            and message.model_name is None
+        ):
+            merged_message = replace(last_message, parts=[*last_message.parts, *message.parts])
+            clean_messages[-1] = merged_message
+            return True
+    clean_messages.append(message)
+    return False
+
+
+def _starts_with(messages: list[_messages.ModelMessage], prefix: list[_messages.ModelMessage]) -> bool:
+    """Check whether a message history starts with the same message objects as another."""
+    return len(messages) >= len(prefix) and all(a is b for a, b in zip(messages, prefix))
+
+
+@dataclasses.dataclass
+class _MessageHistoryCache:
+    """Results of processing and cleaning the message history, reused by the next model request of an agent run.
+
+    The message history at each model request is usually the (processed) history of the previous request with a
+    response and a new request appended, so only those new messages need to be processed and cleaned.
+    """
+
+    processor_results: dict[int, tuple[list[_messages.ModelMessage], list[_messages.ModelMessage]]] = field(
+        default_factory=dict
+    )
+    """The last input and output of each incremental history processor, by its index in the list of processors."""
+
+    cleaned_input: list[_messages.ModelMessage] = field(default_factory=list)
+    """The messages that were last cleaned."""
+    clean_messages: list[_messages.ModelMessage] = field(default_factory=list)
+    """The result of cleaning `cleaned_input`."""
+    merged_parts: dict[int, tuple[_messages.ModelRequestPart | _messages.ModelResponsePart, ...]] = field(
+        default_factory=dict
+    )
+    """The parts of the messages in `cleaned_input` that were merged into other messages, by index.
+
+    Merged messages are new objects, so these are checked to make sure the original messages weren't modified since.
+    """
+    clean_message_starts: list[int] = field(default_factory=list)
+    """The index in `cleaned_input` of the first message that each message in `clean_messages` was made from."""
+
+    async def process(
+        self,
+        index: int,
+        processor: IncrementalHistoryProcessor[DepsT],
+        run_context: RunContext[DepsT],
+        messages: list[_messages.ModelMessage],
+    ) -> list[_messages.ModelMessage]:
+        previous_output: list[_messages.ModelMessage] = []
+        new_messages = messages
+        if previous := self.processor_results.get(index):
+            previous_input, previous_output = previous
+            # The message history is replaced by the processed history, so the input usually starts with the
+            # previous output, unless there are other processors after this one that didn't change it.
+            if _starts_with(messages, previous_output):
+                new_messages = messages[len(previous_output) :]
+            elif _starts_with(messages, previous_input):
+                new_messages = messages[len(previous_input) :]
             else:
-                clean_messages.append(message)
-        elif isinstance(message, _messages.ModelResponse):  # pragma: no branch
-            if (
-                last_message
-                and isinstance(last_message, _messages.ModelResponse)
-                # Responses can only be merged if they didn't really come from an API
-                and last_message.provider_response_id is None
-                and last_message.provider_name is None
-                and last_message.model_name is None
-                and message.provider_response_id is None
-                and message.provider_name is None
-                and message.model_name is None
-            ):
-                merged_message = replace(last_message, parts=[*last_message.parts, *message.parts])
-                clean_messages[-1] = merged_message
+                previous_output = []
+
+        output = await processor.process_new_messages(run_context, previous_output[:], new_messages)
+        # Copies are stored as the lists may be modified by the next processors
+        self.processor_results[index] = (messages[:], output[:])
+        return output
+
+    def clean(self, messages: list[_messages.ModelMessage]) -> list[_messages.ModelMessage]:
+        """Clean the message history like `_clean_message_history`, reusing the result of the previous call."""
+        if not self._can_resume(messages):
+            self.cleaned_input = []
+            self.clean_messages = []
+            self.merged_parts = {}
+            self.clean_message_starts = []
+
+        for message_index in range(len(self.cleaned_input), len(messages)):
+            message = messages[message_index]
+            if _append_clean_message(self.clean_messages, message):
+                for merged_index in range(self.clean_message_starts[-1], message_index + 1):
+                    merged_message = messages[merged_index]
+                    self.merged_parts.setdefault(merged_index, tuple(merged_message.parts))
             else:
-                clean_messages.append(message)
-    return clean_messages
+                self.clean_message_starts.append(message_index)
+        self.cleaned_input = messages[:]
+        return self.clean_messages[:]
+
+    def _can_resume(self, messages: list[_messages.ModelMessage]) -> bool:
+        return _starts_with(messages, self.cleaned_input) and all(
+            tuple(self.cleaned_input[index].parts) == parts for index, parts in self.merged_parts.items()
+        )
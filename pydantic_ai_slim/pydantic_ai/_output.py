@@ -949,17 +949,26 @@ class OutputToolset(AbstractToolset[AgentDepsT]):
         self._tool_defs = tool_defs
         self.max_retries = max_retries
         self.output_validators = output_validators or []
+        self._cached_tools: tuple[int, dict[str, ToolsetTool[AgentDepsT]]] | None = None
 
     @property
     def id(self) -> str | None:
         return '<output>'  # pragma: no cover
 
+    @property
+    def has_static_tools(self) -> bool:
+        return True
+
     @property
     def label(self) -> str:
         return "the agent's output tools"
 
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
-        return {
+        # `max_retries` is set by the agent after the toolset is built
+        if self._cached_tools is not None and self._cached_tools[0] == self.max_retries:
+            return self._cached_tools[1]
+
+        tools: dict[str, ToolsetTool[AgentDepsT]] = {
             tool_def.name: ToolsetTool(
                 toolset=self,
                 tool_def=tool_def,
@@ -968,6 +977,8 @@ class OutputToolset(AbstractToolset[AgentDepsT]):
             )
             for tool_def in self._tool_defs
         }
+        self._cached_tools = (self.max_retries, tools)
+        return tools
 
     async def call_tool(
         self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
@@ -61,6 +61,12 @@ class ModelResponsePartsManager:
     """A list of parts (text or tool calls) that make up the current state of the model's response."""
     _vendor_id_to_part_index: dict[VendorId, int] = field(default_factory=dict[VendorId, int], init=False)
     """Maps a vendor's "part" ID (if provided) to the index in `_parts` where that part resides."""
+    _pending_chunks: dict[int, list[str]] = field(default_factory=dict[int, list[str]], init=False)
+    """Maps a part index to streamed text, thinking or tool call args chunks that have not yet been joined into the part.
+
+    Joining each delta into a new part as it arrives would make streaming a long response quadratic in its length,
+    so plain content deltas are buffered here and only joined when the part is read.
+    """
 
     def get_parts(self) -> list[ModelResponsePart]:
         """Return only model response parts that are complete (i.e., not ToolCallPartDelta's).
@@ -68,6 +74,8 @@ class ModelResponsePartsManager:
         Returns:
             A list of ModelResponsePart objects. ToolCallPartDelta objects are excluded.
         """
+        for part_index in list(self._pending_chunks):
+            self._materialize_part(part_index)
         return [p for p in self._parts if not isinstance(p, ToolCallPartDelta)]
 
     def get_part_by_vendor_id(self, vendor_id: VendorId) -> ManagedPart | None:
@@ -81,7 +89,7 @@ class ModelResponsePartsManager:
         """
         part_index = self._vendor_id_to_part_index.get(vendor_id)
         if part_index is not None:
-            return self._parts[part_index]
+            return self._materialize_part(part_index)
         return None
 
     def handle_text_delta(
@@ -169,7 +177,12 @@ class ModelResponsePartsManager:
                 provider_name=self._resolve_provider_name(existing_text_part, provider_name),
                 provider_details=provider_details,
             )
-            self._parts[part_index] = part_delta.apply(existing_text_part)
+            if part_delta.provider_name is None and part_delta.provider_details is None:
+                self._append_pending_chunk(part_index, content)
+            else:
+                existing_text_part = self._materialize_part(part_index)
+                assert isinstance(existing_text_part, TextPart)
+                self._parts[part_index] = part_delta.apply(existing_text_part)
             yield PartDeltaEvent(index=part_index, delta=part_delta)
 
     def handle_thinking_delta(
@@ -252,7 +265,7 @@ class ModelResponsePartsManager:
                 provider_name=self._resolve_provider_name(existing_thinking_part, provider_name),
                 provider_details=provider_details,
             )
-            self._parts[part_index] = part_delta.apply(existing_thinking_part)
+            self._apply_thinking_delta(part_index, part_delta)
             yield PartDeltaEvent(index=part_index, delta=part_delta)
 
     def handle_tool_call_delta(
@@ -337,8 +350,21 @@ class ModelResponsePartsManager:
                 provider_name=self._resolve_provider_name(existing_part, provider_name),
                 provider_details=provider_details,
             )
-            updated_part = delta.apply(existing_part)
-            self._parts[part_index] = updated_part
+            if (
+                isinstance(existing_part, ToolCallPart | BuiltinToolCallPart)
+                and isinstance(args, str)
+                and not isinstance(existing_part.args, dict)
+                and tool_name is None
+                and tool_call_id is None
+                and delta.provider_name is None
+                and provider_details is None
+            ):
+                # Plain args string delta for an existing tool call: buffer it instead of rebuilding the part
+                self._append_pending_chunk(part_index, args)
+                updated_part = existing_part
+            else:
+                updated_part = delta.apply(self._materialize_part(part_index))
+                self._parts[part_index] = updated_part
             if isinstance(updated_part, ToolCallPart | BuiltinToolCallPart):
                 if isinstance(existing_part, ToolCallPartDelta):
                     # We just upgraded a delta to a full part, so emit a PartStartEvent
@@ -394,6 +420,7 @@ class ModelResponsePartsManager:
             maybe_part_index = self._vendor_id_to_part_index.get(vendor_part_id)
             if maybe_part_index is not None and isinstance(self._parts[maybe_part_index], ToolCallPart):
                 new_part_index = maybe_part_index
+                self._pending_chunks.pop(new_part_index, None)
                 self._parts[new_part_index] = new_part
             else:
                 new_part_index = self._append_part(new_part)
@@ -425,6 +452,7 @@ class ModelResponsePartsManager:
             maybe_part_index = self._vendor_id_to_part_index.get(vendor_part_id)
             if maybe_part_index is not None and isinstance(self._parts[maybe_part_index], type(part)):
                 new_part_index = maybe_part_index
+                self._pending_chunks.pop(new_part_index, None)
                 self._parts[new_part_index] = part
             else:
                 new_part_index = self._append_part(part)
@@ -444,6 +472,37 @@ class ModelResponsePartsManager:
             self._vendor_id_to_part_index[vendor_part_id] = new_index
         return new_index
 
+    def _append_pending_chunk(self, part_index: int, chunk: str) -> None:
+        """Buffer a content (or tool call args) chunk to be joined into the part at `part_index` when it is next read."""
+        self._pending_chunks.setdefault(part_index, []).append(chunk)
+
+    def _materialize_part(self, part_index: int) -> ManagedPart:
+        """Join any buffered chunks into the part at `part_index` and return the up-to-date part."""
+        part = self._parts[part_index]
+        chunks = self._pending_chunks.pop(part_index, None)
+        if chunks:
+            if isinstance(part, TextPart | ThinkingPart):
+                part = replace(part, content=part.content + ''.join(chunks))
+            elif isinstance(part, ToolCallPart | BuiltinToolCallPart):  # pragma: no branch
+                assert not isinstance(part.args, dict), 'Buffered args chunks can only be applied to string args'
+                part = replace(part, args=(part.args or '') + ''.join(chunks))
+            self._parts[part_index] = part
+        return part
+
+    def _apply_thinking_delta(self, part_index: int, part_delta: ThinkingPartDelta) -> None:
+        """Apply a thinking delta, buffering it if it only carries content."""
+        if (
+            part_delta.content_delta is not None
+            and part_delta.signature_delta is None
+            and part_delta.provider_name is None
+            and part_delta.provider_details is None
+        ):
+            self._append_pending_chunk(part_index, part_delta.content_delta)
+        else:
+            existing_part = self._materialize_part(part_index)
+            assert isinstance(existing_part, ThinkingPart)
+            self._parts[part_index] = part_delta.apply(existing_part)
+
     def _latest_part_if_of_type(self, *part_types: type[PartT]) -> tuple[PartT, int] | None:
         """Get the latest part and its index if it's an instance of the given type(s)."""
         if self._parts:
@@ -476,7 +535,7 @@ class ModelResponsePartsManager:
             provider_name=self._resolve_provider_name(existing_part, provider_name),
             provider_details=provider_details,
         )
-        self._parts[part_index] = part_delta.apply(existing_part)
+        self._apply_thinking_delta(part_index, part_delta)
         yield PartDeltaEvent(index=part_index, delta=part_delta)
 
     def _handle_embedded_thinking_end(self, vendor_part_id: VendorId) -> None:
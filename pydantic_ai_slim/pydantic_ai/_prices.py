@@ -0,0 +1,121 @@
+"""Cached lookups of providers and models in the [genai-prices](https://github.com/pydantic/genai-prices) data.
+
+Usage and cost are calculated for every model response, while the providers and models they're looked up for rarely
+change, so the results of these lookups (including failed ones) are remembered until the data snapshot is replaced.
+"""
+
+from __future__ import annotations as _annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Literal
+
+from genai_prices import calc_price as _calc_price, types as genai_types
+from genai_prices.data_snapshot import DataSnapshot, get_snapshot
+
+MAX_CACHED_LOOKUPS = 4096
+"""The maximum number of lookups of each kind to remember, after which they're forgotten and looked up again."""
+
+
+@dataclass
+class _SnapshotLookups:
+    snapshot: DataSnapshot
+    usage_providers: dict[tuple[str, str, str], tuple[genai_types.Provider, ...]] = field(default_factory=dict)
+    price_providers: dict[tuple[str | None, str | None, str], Literal['url', 'id'] | LookupError] = field(
+        default_factory=dict
+    )
+
+
+_lookups: _SnapshotLookups | None = None
+
+
+def _get_lookups() -> _SnapshotLookups:
+    global _lookups
+    snapshot = get_snapshot()
+    lookups = _lookups
+    if lookups is None or lookups.snapshot is not snapshot:
+        lookups = _lookups = _SnapshotLookups(snapshot)
+    return lookups
+
+
+def find_usage_providers(provider: str, provider_url: str, provider_fallback: str) -> tuple[genai_types.Provider, ...]:
+    """Find the providers to try to extract usage with, matching the provider URL, ID and fallback ID in that order."""
+    lookups = _get_lookups()
+    key = (provider, provider_url, provider_fallback)
+    providers = lookups.usage_providers.get(key)
+    if providers is None:
+        found: list[genai_types.Provider] = []
+        for provider_id, provider_api_url in [(None, provider_url), (provider, None), (provider_fallback, None)]:
+            try:
+                provider_obj = lookups.snapshot.find_provider(None, provider_id, provider_api_url)
+            except LookupError:
+                continue
+            if all(provider_obj is not p for p in found):
+                found.append(provider_obj)
+
+        if len(lookups.usage_providers) >= MAX_CACHED_LOOKUPS:
+            lookups.usage_providers.clear()
+        providers = lookups.usage_providers[key] = tuple(found)
+    return providers
+
+
+def calc_price(
+    usage: genai_types.AbstractUsage,
+    model_name: str,
+    *,
+    provider_id: str | None,
+    provider_api_url: str | None,
+    genai_request_timestamp: datetime | None,
+) -> genai_types.PriceCalculation:
+    """Calculate the price of a request, matching on the provider URL first as it's more specific, then the provider ID.
+
+    Raises:
+        LookupError: If the model can't be found for either, which is remembered so it fails fast next time.
+    """
+    lookups = _get_lookups()
+    key = (provider_api_url, provider_id, model_name)
+    match = lookups.price_providers.get(key)
+    if isinstance(match, LookupError):
+        raise LookupError(*match.args)
+
+    if match is None:
+        if provider_api_url:
+            try:
+                price = _calc_price(
+                    usage,
+                    model_name,
+                    provider_api_url=provider_api_url,
+                    genai_request_timestamp=genai_request_timestamp,
+                )
+            except LookupError:
+                pass
+            else:
+                _remember_price_provider(lookups, key, 'url')
+                return price
+
+        try:
+            price = _calc_price(
+                usage, model_name, provider_id=provider_id, genai_request_timestamp=genai_request_timestamp
+            )
+        except LookupError as e:
+            # A new error is stored so the cache doesn't keep the traceback's frames alive
+            _remember_price_provider(lookups, key, LookupError(*e.args))
+            raise
+        _remember_price_provider(lookups, key, 'id')
+        return price
+    elif match == 'url':
+        return _calc_price(
+            usage, model_name, provider_api_url=provider_api_url, genai_request_timestamp=genai_request_timestamp
+        )
+    else:
+        return _calc_price(usage, model_name, provider_id=provider_id, genai_request_timestamp=genai_request_timestamp)
+
+
+def _remember_price_provider(
+    lookups: _SnapshotLookups,
+    key: tuple[str | None, str | None, str],
+    match: Literal['url', 'id'] | LookupError,
+) -> None:
+    if len(lookups.price_providers) >= MAX_CACHED_LOOKUPS:
+        lookups.price_providers.clear()
+    lookups.price_providers[key] = match
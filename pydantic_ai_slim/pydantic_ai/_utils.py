@@ -4,8 +4,10 @@ import asyncio
 import functools
 import inspect
 import re
+import threading
 import time
 import uuid
+from collections import deque
 from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator
 from contextlib import asynccontextmanager, contextmanager, suppress
 from contextvars import ContextVar
@@ -279,6 +281,101 @@ def sync_async_iterator(async_iter: AsyncIterator[T]) -> Iterator[T]:
             break
 
 
+@asynccontextmanager
+async def iterate_in_thread(iterable: Iterable[T]) -> AsyncIterator[AsyncIterator[T]]:
+    """Iterate over a blocking iterable, like a streamed response from a sync HTTP client, in a dedicated thread.
+
+    The thread reads ahead and buffers items, which are then received in batches: the event loop is only woken up
+    when it's waiting for the next item, rather than every item needing its own trip to the thread pool.
+
+    When the context exits, the thread stops at the next item it reads. To stop it from being blocked waiting for that
+    item, the underlying resource should be closed after exiting the context.
+    """
+    if _disable_threads.get():
+        yield _iterate_inline(iterable)
+        return
+
+    reader = _ThreadedIteratorReader(iterable, asyncio.get_running_loop())
+    threading.Thread(target=reader.read, name='pydantic-ai-iterate-in-thread', daemon=True).start()
+    try:
+        yield reader
+    finally:
+        reader.stop()
+
+
+async def _iterate_inline(iterable: Iterable[T]) -> AsyncIterator[T]:
+    for item in iterable:
+        yield item
+
+
+class _ThreadedIteratorReader(Generic[T]):
+    """Async iterator over items read from a blocking iterable by a thread, see `iterate_in_thread`."""
+
+    def __init__(self, iterable: Iterable[T], loop: asyncio.AbstractEventLoop):
+        self._iterable = iterable
+        self._loop = loop
+        self._lock = threading.Lock()
+        # Items read by the thread and not yet received, protected by the lock
+        self._buffer: deque[T] = deque()
+        # Items received by the event loop and not yet returned, only used by the event loop
+        self._batch: deque[T] = deque()
+        self._waiter: asyncio.Event | None = None
+        self._done = False
+        self._error: BaseException | None = None
+        self._stopped = False
+
+    def read(self) -> None:
+        """Read all items from the iterable, run in the thread."""
+        error: BaseException | None = None
+        try:
+            for item in self._iterable:
+                with self._lock:
+                    if self._stopped:
+                        return
+                    self._buffer.append(item)
+                    waiter, self._waiter = self._waiter, None
+                if waiter is not None:
+                    self._wake(waiter)
+        except BaseException as e:
+            error = e
+
+        with self._lock:
+            self._done = True
+            self._error = error
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._wake(waiter)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            self._buffer.clear()
+
+    def _wake(self, waiter: asyncio.Event) -> None:
+        try:
+            self._loop.call_soon_threadsafe(waiter.set)
+        except RuntimeError:  # pragma: no cover
+            # The event loop was closed while the thread was reading
+            pass
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        while not self._batch:
+            with self._lock:
+                if self._buffer:
+                    self._batch, self._buffer = self._buffer, self._batch
+                    break
+                if self._done:
+                    if self._error is not None:
+                        raise self._error
+                    raise StopAsyncIteration
+                waiter = self._waiter = asyncio.Event()
+            await waiter.wait()
+        return self._batch.popleft()
+
+
 def now_utc() -> datetime:
     return datetime.now(tz=timezone.utc)
 
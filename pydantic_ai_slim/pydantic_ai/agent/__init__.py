@@ -30,6 +30,7 @@ from .._agent_graph import (
     CallToolsNode,
     EndStrategy,
     HistoryProcessor,
+    IncrementalHistoryProcessor,
     ModelRequestNode,
     UserPromptNode,
     build_run_context,
@@ -87,6 +88,7 @@ __all__ = (
     'ModelRequestNode',
     'UserPromptNode',
     'InstrumentationSettings',
+    'IncrementalHistoryProcessor',
     'ParallelExecutionMode',
     'WrapperAgent',
     'AbstractAgent',
@@ -98,6 +100,9 @@ T = TypeVar('T')
 S = TypeVar('S')
 NoneType = type(None)
 
+_MAX_RUN_OUTPUT_SCHEMAS = 64
+"""The maximum number of schemas built for per-run `output_type`s that an agent keeps for reuse."""
+
 
 @dataclasses.dataclass(init=False)
 class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
@@ -147,6 +152,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
 
     _deps_type: type[AgentDepsT] = dataclasses.field(repr=False)
     _output_schema: _output.OutputSchema[OutputDataT] = dataclasses.field(repr=False)
+    _run_output_schemas: dict[Any, _output.OutputSchema[Any]] = dataclasses.field(repr=False)
     _output_validators: list[_output.OutputValidator[AgentDepsT, OutputDataT]] = dataclasses.field(repr=False)
     _instructions: list[str | _system_prompt.SystemPromptFunc[AgentDepsT]] = dataclasses.field(repr=False)
     _system_prompts: tuple[str, ...] = dataclasses.field(repr=False)
@@ -343,6 +349,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         _utils.validate_empty_kwargs(_deprecated_kwargs)
 
         self._output_schema = _output.OutputSchema[OutputDataT].build(output_type)
+        self._run_output_schemas = {}
         self._output_validators = []
 
         self._instructions = self._normalize_instructions(instructions)
@@ -806,7 +813,7 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
             # Store the last instructions here for convenience
             last_instructions = InstrumentedModel._get_instructions(message_history)  # pyright: ignore[reportPrivateUsage]
             attrs: dict[str, Any] = {
-                'pydantic_ai.all_messages': json.dumps(settings.messages_to_otel_messages(list(message_history))),
+                'pydantic_ai.all_messages': settings.otel_messages_json(list(message_history)),
                 **settings.system_instructions_attributes(last_instructions),
             }
 
@@ -1563,7 +1570,18 @@ class Agent(AbstractAgent[AgentDepsT, OutputDataT]):
         if output_type is not None:
             if self._output_validators:
                 raise exceptions.UserError('Cannot set a custom run `output_type` when the agent has output validators')
-            schema = _output.OutputSchema.build(output_type)
+            # Building an output schema is expensive, so we reuse the one built for an equal run `output_type`
+            key = tuple(output_type) if isinstance(output_type, list) else output_type
+            try:
+                schema = self._run_output_schemas.get(key)
+            except TypeError:
+                # Unhashable output spec, so it can't be cached
+                return _output.OutputSchema.build(output_type)
+            if schema is None:
+                schema = _output.OutputSchema.build(output_type)
+                if len(self._run_output_schemas) >= _MAX_RUN_OUTPUT_SCHEMAS:
+                    self._run_output_schemas.pop(next(iter(self._run_output_schemas)))
+                self._run_output_schemas[key] = schema
         else:
             schema = self._output_schema
 
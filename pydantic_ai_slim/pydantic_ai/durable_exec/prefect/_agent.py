@@ -35,6 +35,7 @@ from pydantic_ai.tools import (
     ToolFuncEither,
 )
 
+from ._cache_policies import hashing_message_history
 from ._model import PrefectModel
 from ._toolset import prefectify_toolset
 from ._types import TaskConfig, default_task_config
@@ -169,7 +170,10 @@ class PrefectAgent(WrapperAgent[AgentDepsT, OutputDataT]):
     @contextmanager
     def _prefect_overrides(self) -> Iterator[None]:
         # Override with PrefectModel and PrefectMCPServer in the toolsets.
-        with super().override(model=self._model, toolsets=self._toolsets, tools=[]):
+        with (
+            super().override(model=self._model, toolsets=self._toolsets, tools=[]),
+            hashing_message_history(),
+        ):
             yield
 
     @overload
@@ -1,10 +1,15 @@
-from dataclasses import fields, is_dataclass
+import hashlib
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import Any, TypeGuard
 
 from prefect.cache_policies import INPUTS, RUN_ID, TASK_SOURCE, CachePolicy
 from prefect.context import TaskRunContext
+from prefect.utilities.hashing import hash_objects
 
-from pydantic_ai import ToolsetTool
+from pydantic_ai import ModelMessage, ModelRequest, ModelResponse, ToolsetTool
 from pydantic_ai.tools import RunContext
 
 
@@ -24,6 +29,10 @@ def _is_toolset_tool(obj: Any) -> TypeGuard[ToolsetTool]:
     return isinstance(obj, ToolsetTool)
 
 
+def _is_message_history(obj: Any) -> TypeGuard[list[ModelMessage]]:
+    return _is_list(obj) and len(obj) > 0 and all(isinstance(item, ModelRequest | ModelResponse) for item in obj)
+
+
 def _replace_run_context(
     inputs: dict[str, Any],
 ) -> Any:
@@ -75,11 +84,95 @@ def _replace_toolsets(
     return inputs
 
 
+def _message_digest(message: ModelMessage) -> str:
+    """Hash a single message, excluding timestamps."""
+    digest = hash_objects(_strip_timestamps(message), raise_on_failure=True)
+    assert digest is not None
+    return digest
+
+
+@dataclass
+class _HashedMessage:
+    message: ModelMessage
+    # Parts can be added to a message after it was hashed, in which case it needs to be hashed again
+    part_count: int
+    digest: str
+    rolling_hash: str
+
+
+@dataclass
+class _MessageHistoryHashes:
+    """Rolling hashes of the message history of an agent run, so that each message is only hashed once."""
+
+    # The most recently hashed message history, which later histories in the run usually extend
+    history: list[_HashedMessage] = field(default_factory=list[_HashedMessage])
+    # Digests of all hashed messages by ID, along with the message to keep the ID from being reused
+    digests_by_id: dict[int, tuple[ModelMessage, int, str]] = field(default_factory=dict)
+
+    def hash(self, messages: Sequence[ModelMessage]) -> str:
+        """Get the rolling hash of a message history, only hashing the messages that weren't seen before."""
+        common = 0
+        for hashed, message in zip(self.history, messages):
+            if hashed.message is not message or hashed.part_count != len(message.parts):
+                break
+            common += 1
+        del self.history[common:]
+
+        rolling_hash = self.history[-1].rolling_hash if self.history else ''
+        for message in messages[common:]:
+            part_count = len(message.parts)
+            cached = self.digests_by_id.get(id(message))
+            if cached is not None and cached[0] is message and cached[1] == part_count:
+                digest = cached[2]
+            else:
+                digest = _message_digest(message)
+                self.digests_by_id[id(message)] = (message, part_count, digest)
+
+            rolling_hash = hashlib.sha256(f'{rolling_hash}:{digest}'.encode()).hexdigest()
+            self.history.append(_HashedMessage(message, part_count, digest, rolling_hash))
+        return rolling_hash
+
+
+_message_history_hashes: ContextVar[_MessageHistoryHashes | None] = ContextVar(
+    '_prefect_message_history_hashes', default=None
+)
+
+
+@contextmanager
+def hashing_message_history() -> Iterator[None]:
+    """Context manager to keep the rolling hashes of message histories for the cache keys of tasks in an agent run."""
+    if _message_history_hashes.get() is not None:
+        yield
+        return
+
+    token = _message_history_hashes.set(_MessageHistoryHashes())
+    try:
+        yield
+    finally:
+        _message_history_hashes.reset(token)
+
+
+def _replace_message_histories(
+    inputs: dict[str, Any],
+) -> Any:
+    """Replace message histories with their rolling hash, which excludes timestamps."""
+    for key, value in inputs.items():
+        if _is_message_history(value):
+            # Outside of an agent run, there are no earlier hashes to build on
+            hashes = _message_history_hashes.get() or _MessageHistoryHashes()
+            inputs[key] = hashes.hash(value)
+
+    return inputs
+
+
 class PrefectAgentInputs(CachePolicy):
     """Cache policy designed to handle input hashing for PrefectAgent cache keys.
 
     Computes a cache key based on inputs, ignoring nested 'timestamp' fields
     and serializing RunContext objects to only include hashable fields.
+
+    Message histories are replaced with a rolling hash of their messages, which is built on
+    incrementally within an agent run so that each message is only hashed once.
     """
 
     def compute_key(
@@ -95,7 +188,8 @@ class PrefectAgentInputs(CachePolicy):
 
         inputs_without_toolsets = _replace_toolsets(inputs)
         inputs_with_hashable_context = _replace_run_context(inputs_without_toolsets)
-        filtered_inputs = _strip_timestamps(inputs_with_hashable_context)
+        inputs_with_hashed_messages = _replace_message_histories(inputs_with_hashable_context)
+        filtered_inputs = _strip_timestamps(inputs_with_hashed_messages)
 
         return INPUTS.compute_key(task_ctx, filtered_inputs, flow_parameters, **kwargs)
 
@@ -15,6 +15,7 @@ from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner
 from ...exceptions import UserError
 from ._agent import TemporalAgent
 from ._logfire import LogfirePlugin
+from ._message_store import FileMessageStore, MessageStore
 from ._run_context import TemporalRunContext
 from ._toolset import TemporalWrapperToolset
 from ._workflow import PydanticAIWorkflow
@@ -27,6 +28,8 @@ __all__ = [
     'TemporalRunContext',
     'TemporalWrapperToolset',
     'PydanticAIWorkflow',
+    'MessageStore',
+    'FileMessageStore',
 ]
 
 # We need eagerly import the anyio backends or it will happens inside workflow code and temporal has issues
@@ -40,6 +40,7 @@ from pydantic_ai.tools import (
     ToolFuncEither,
 )
 
+from ._message_store import MessageStore
 from ._model import TemporalModel, TemporalProviderFactory
 from ._run_context import TemporalRunContext
 from ._toolset import TemporalWrapperToolset, temporalize_toolset
@@ -66,6 +67,7 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
         toolset_activity_config: dict[str, ActivityConfig] | None = None,
         tool_activity_config: dict[str, dict[str, ActivityConfig | Literal[False]]] | None = None,
         run_context_type: type[TemporalRunContext[AgentDepsT]] = TemporalRunContext[AgentDepsT],
+        message_store: MessageStore | None = None,
         temporalize_toolset_func: Callable[
             [
                 AbstractToolset[AgentDepsT],
@@ -106,6 +108,10 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
             run_context_type: The `TemporalRunContext` subclass to use to serialize and deserialize the run context for use inside a Temporal activity.
                 By default, only the `deps`, `run_id`, `metadata`, `retries`, `tool_call_id`, `tool_name`, `tool_call_approved`, `retry`, `max_retries`, `run_step`, `usage`, and `partial_output` attributes will be available.
                 To make another attribute available, create a `TemporalRunContext` subclass with a custom `serialize_run_context` class method that returns a dictionary that includes the attribute.
+            message_store: Optional store to offload the message history from the payloads of model request activities to, like [`FileMessageStore`][pydantic_ai.durable_exec.temporal.FileMessageStore].
+                By default, every model request activity receives the full message history, so the size of the workflow's event history grows quadratically with the length of the conversation.
+                With a message store, messages that were sent to an earlier model request activity in the same agent run are only referenced by their hash, and the activity stores new messages and loads earlier ones from the store, caching them on the worker.
+                The store needs to be accessible from all workers that run the agent's activities.
             temporalize_toolset_func: Optional function to use to prepare "leaf" toolsets (i.e. those that implement their own tool listing and calling) for Temporal by wrapping them in a `TemporalWrapperToolset` that moves methods that require IO to Temporal activities.
                 If not provided, only `FunctionToolset` and `MCPServer` will be prepared for Temporal.
                 The function takes the toolset, the activity name prefix, the toolset-specific activity config, the tool-specific activity configs and the run context type.
@@ -172,6 +178,7 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
             event_stream_handler=self.event_stream_handler,
             models=models,
             provider_factory=provider_factory,
+            message_store=message_store,
         )
         activities.extend(temporal_model.temporal_activities)
         self._temporal_model = temporal_model
@@ -271,6 +278,7 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
         with (
             super().override(model=self._temporal_model, toolsets=self._toolsets, tools=[]),
             self._temporal_model.using_model(model),
+            self._temporal_model.offloading_messages(),
             _utils.disable_threads(),
         ):
             temporal_active_token = self._temporal_overrides_active.set(True)
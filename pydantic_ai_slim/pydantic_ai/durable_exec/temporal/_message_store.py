@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic_ai import _utils
+
+
+class MessageStore(ABC):
+    """Content-addressed storage for messages offloaded from the payloads of Temporal model request activities.
+
+    See [`TemporalAgent`][pydantic_ai.durable_exec.temporal.TemporalAgent]'s `message_store` argument for more information.
+    """
+
+    @abstractmethod
+    async def store(self, key: str, data: bytes) -> None:
+        """Store data under a key.
+
+        The key is a hash of the data, so if data is already stored under the key, it doesn't need to be stored again.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def load(self, key: str) -> bytes | None:
+        """Load the data stored under a key, or return `None` if there is none."""
+        raise NotImplementedError
+
+
+@dataclass
+class FileMessageStore(MessageStore):
+    """A message store that stores each message as a file in a directory.
+
+    The directory needs to be shared by all workers that run the agent's activities, for example on a network file system,
+    or there should only be one worker.
+    """
+
+    directory: Path
+    """The directory to store messages in, which will be created if it doesn't exist."""
+
+    async def store(self, key: str, data: bytes) -> None:
+        await _utils.run_in_executor(self._store_sync, key, data)
+
+    async def load(self, key: str) -> bytes | None:
+        return await _utils.run_in_executor(self._load_sync, key)
+
+    def _path(self, key: str) -> Path:
+        # Messages are spread over subdirectories so no single directory holds too many files
+        return self.directory / key[:2] / f'{key}.json'
+
+    def _store_sync(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        if path.exists():
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partially written message
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{key}.')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _load_sync(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
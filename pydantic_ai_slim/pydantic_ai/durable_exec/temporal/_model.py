@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import functools
+import hashlib
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Callable, Iterator, Mapping
 from contextlib import asynccontextmanager, contextmanager
 from contextvars import ContextVar
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, cast
 
@@ -12,7 +15,7 @@ from pydantic import ConfigDict, with_config
 from temporalio import activity, workflow
 from temporalio.workflow import ActivityConfig
 
-from pydantic_ai import ModelMessage, ModelResponse, ModelResponseStreamEvent, models
+from pydantic_ai import ModelMessage, ModelMessagesTypeAdapter, ModelResponse, ModelResponseStreamEvent, models
 from pydantic_ai._run_context import get_current_run_context
 from pydantic_ai.agent import EventStreamHandler
 from pydantic_ai.exceptions import UserError
@@ -23,8 +26,12 @@ from pydantic_ai.settings import ModelSettings
 from pydantic_ai.tools import AgentDepsT, RunContext
 from pydantic_ai.usage import RequestUsage
 
+from ._message_store import MessageStore
 from ._run_context import TemporalRunContext
 
+MESSAGE_CACHE_SIZE = 1024
+"""The number of messages loaded from the message store that are cached by each worker."""
+
 
 @dataclass
 @with_config(ConfigDict(arbitrary_types_allowed=True))
@@ -35,6 +42,45 @@ class _RequestParams:
     model_request_parameters: ModelRequestParameters
     serialized_run_context: Any
     model_id: str | None = None
+    # When messages are offloaded to the message store, `messages` is empty and the messages are identified by their
+    # hashes, with only those that weren't sent to an earlier activity in the agent run included in `new_messages`.
+    message_hashes: list[str] | None = None
+    new_messages: dict[str, ModelMessage] = field(default_factory=dict[str, ModelMessage])
+
+
+@dataclass
+class _SentMessages:
+    """The messages sent to model request activities during an agent run in a workflow."""
+
+    hashes: set[str] = field(default_factory=set[str])
+    # Hashes of message objects by ID, along with the message to keep the ID from being reused and the number of parts
+    # to notice parts being added to it
+    hashes_by_id: dict[int, tuple[ModelMessage, int, str]] = field(default_factory=dict)
+
+    def offload(self, messages: list[ModelMessage]) -> tuple[list[str], dict[str, ModelMessage]]:
+        """Get the hashes of the messages and the messages that haven't been sent yet."""
+        message_hashes: list[str] = []
+        new_messages: dict[str, ModelMessage] = {}
+        for message in messages:
+            cached = self.hashes_by_id.get(id(message))
+            if cached is not None and cached[0] is message and cached[1] == len(message.parts):
+                message_hash = cached[2]
+            else:
+                message_hash = _message_hash(message)
+                self.hashes_by_id[id(message)] = (message, len(message.parts), message_hash)
+
+            message_hashes.append(message_hash)
+            if message_hash not in self.hashes:
+                new_messages[message_hash] = message
+        return message_hashes, new_messages
+
+
+def _dump_message(message: ModelMessage) -> bytes:
+    return ModelMessagesTypeAdapter.dump_json([message])
+
+
+def _message_hash(message: ModelMessage) -> str:
+    return hashlib.sha256(_dump_message(message)).hexdigest()
 
 
 TemporalProviderFactory = Callable[[RunContext[AgentDepsT], str], Provider[Any]]
@@ -85,6 +131,7 @@ class TemporalModel(WrapperModel):
         event_stream_handler: EventStreamHandler[Any] | None = None,
         models: Mapping[str, Model] | None = None,
         provider_factory: TemporalProviderFactory | None = None,
+        message_store: MessageStore | None = None,
     ):
         # Build models_by_id registry from wrapped model and models parameter
         self._models_by_id: dict[str, Model] = {}
@@ -109,13 +156,16 @@ class TemporalModel(WrapperModel):
         self.event_stream_handler = event_stream_handler
         self._model_id_var: ContextVar[str | None] = ContextVar('_temporal_model_id', default=None)
         self._provider_factory = provider_factory
+        self.message_store = message_store
+        self._sent_messages_var: ContextVar[_SentMessages | None] = ContextVar('_temporal_sent_messages', default=None)
+        self._message_cache: OrderedDict[str, ModelMessage] = OrderedDict()
 
         @activity.defn(name=f'{activity_name_prefix}__model_request')
         async def request_activity(params: _RequestParams, deps: Any | None = None) -> ModelResponse:
             run_context = self.run_context_type.deserialize_run_context(params.serialized_run_context, deps=deps)
             model_for_request = self._resolve_model_id(params.model_id, run_context)
             return await model_for_request.request(
-                params.messages,
+                await self._load_messages(params),
                 cast(ModelSettings | None, params.model_settings),
                 params.model_request_parameters,
             )
@@ -130,7 +180,7 @@ class TemporalModel(WrapperModel):
             run_context = self.run_context_type.deserialize_run_context(params.serialized_run_context, deps=deps)
             model_for_request = self._resolve_model_id(params.model_id, run_context)
             async with model_for_request.request_stream(
-                params.messages,
+                await self._load_messages(params),
                 cast(ModelSettings | None, params.model_settings),
                 params.model_request_parameters,
                 run_context,
@@ -153,6 +203,87 @@ class TemporalModel(WrapperModel):
     def temporal_activities(self) -> list[Callable[..., Any]]:
         return [self.request_activity, self.request_stream_activity]
 
+    @contextmanager
+    def offloading_messages(self) -> Iterator[None]:
+        """Context manager to keep track of the messages sent to model request activities during an agent run in a workflow.
+
+        Messages that were already sent are then only referenced by their hash if a message store is set.
+        """
+        if self.message_store is None or self._sent_messages_var.get() is not None:
+            yield
+            return
+
+        token = self._sent_messages_var.set(_SentMessages())
+        try:
+            yield
+        finally:
+            self._sent_messages_var.reset(token)
+
+    def _request_params(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        serialized_run_context: Any,
+        model_id: str | None,
+    ) -> tuple[_RequestParams, Callable[[], None]]:
+        """Build the params for a model request activity, and a function to call once the activity has succeeded."""
+        params = _RequestParams(
+            messages=messages,
+            model_settings=cast(dict[str, Any] | None, model_settings),
+            model_request_parameters=model_request_parameters,
+            serialized_run_context=serialized_run_context,
+            model_id=model_id,
+        )
+        if self.message_store is None or (sent_messages := self._sent_messages_var.get()) is None:
+            return params, lambda: None
+
+        message_hashes, new_messages = sent_messages.offload(messages)
+        params.messages = []
+        params.message_hashes = message_hashes
+        params.new_messages = new_messages
+        # The new messages have only been stored once the activity has succeeded, so until then they'll be sent again
+        return params, lambda: sent_messages.hashes.update(new_messages)
+
+    async def _load_messages(self, params: _RequestParams) -> list[ModelMessage]:
+        """Reassemble the messages for a model request activity, storing the new ones in the message store."""
+        if params.message_hashes is None:
+            return params.messages
+
+        store = self.message_store
+        if store is None:
+            raise UserError('Messages were offloaded to a message store, but no `message_store` is set on the agent.')
+
+        await asyncio.gather(
+            *(
+                store.store(message_hash, _dump_message(message))
+                for message_hash, message in params.new_messages.items()
+            )
+        )
+
+        messages: list[ModelMessage] = []
+        for message_hash in params.message_hashes:
+            message = params.new_messages.get(message_hash)
+            if message is None:
+                message = self._message_cache.get(message_hash)
+            if message is None:
+                data = await store.load(message_hash)
+                if data is None:
+                    raise UserError(
+                        f'Message {message_hash!r} was not found in the message store. '
+                        "The message store needs to be shared by all workers that run the agent's activities."
+                    )
+                message = ModelMessagesTypeAdapter.validate_json(data)[0]
+            self._cache_message(message_hash, message)
+            messages.append(message)
+        return messages
+
+    def _cache_message(self, message_hash: str, message: ModelMessage) -> None:
+        self._message_cache[message_hash] = message
+        self._message_cache.move_to_end(message_hash, last=True)
+        while len(self._message_cache) > MESSAGE_CACHE_SIZE:
+            self._message_cache.popitem(last=False)
+
     async def request(
         self,
         messages: list[ModelMessage],
@@ -175,20 +306,16 @@ class TemporalModel(WrapperModel):
 
         model_name = model_id or f'{self.system}:{self.model_name}'
         activity_config: ActivityConfig = {'summary': f'request model: {model_name}', **self.activity_config}
-        return await workflow.execute_activity(
+        params, on_success = self._request_params(
+            messages, model_settings, model_request_parameters, serialized_run_context, model_id
+        )
+        response = await workflow.execute_activity(
             activity=self.request_activity,
-            args=[
-                _RequestParams(
-                    messages=messages,
-                    model_settings=cast(dict[str, Any] | None, model_settings),
-                    model_request_parameters=model_request_parameters,
-                    serialized_run_context=serialized_run_context,
-                    model_id=model_id,
-                ),
-                deps,
-            ],
+            args=[params, deps],
             **activity_config,
         )
+        on_success()
+        return response
 
     @asynccontextmanager
     async def request_stream(
@@ -220,20 +347,15 @@ class TemporalModel(WrapperModel):
         serialized_run_context = self.run_context_type.serialize_run_context(run_context)
         model_name = model_id or f'{self.system}:{self.model_name}'
         activity_config: ActivityConfig = {'summary': f'request model: {model_name} (stream)', **self.activity_config}
+        params, on_success = self._request_params(
+            messages, model_settings, model_request_parameters, serialized_run_context, model_id
+        )
         response = await workflow.execute_activity(
             activity=self.request_stream_activity,
-            args=[
-                _RequestParams(
-                    messages=messages,
-                    model_settings=cast(dict[str, Any] | None, model_settings),
-                    model_request_parameters=model_request_parameters,
-                    serialized_run_context=serialized_run_context,
-                    model_id=model_id,
-                ),
-                run_context.deps,
-            ],
+            args=[params, run_context.deps],
             **activity_config,
         )
+        on_success()
         yield TemporalStreamedResponse(model_request_parameters, response)
 
     def _validate_model_request_parameters(self, model_request_parameters: ModelRequestParameters) -> None:
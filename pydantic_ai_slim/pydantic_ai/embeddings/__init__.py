@@ -1,9 +1,10 @@
 from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from contextvars import ContextVar
-from dataclasses import dataclass
-from typing import Any, ClassVar, Literal, get_args
+from dataclasses import dataclass, replace
+from typing import Any, ClassVar, Literal, cast, get_args
 
+import anyio
 from typing_extensions import TypeAliasType
 
 from pydantic_ai import _utils
@@ -11,10 +12,12 @@ from pydantic_ai.exceptions import UserError
 from pydantic_ai.models import OpenAIChatCompatibleProvider, OpenAIResponsesCompatibleProvider
 from pydantic_ai.models.instrumented import InstrumentationSettings
 from pydantic_ai.providers import Provider, infer_provider
+from pydantic_ai.usage import RequestUsage
 
 from .base import EmbeddingModel
+from .cache import EmbeddingCache, InMemoryEmbeddingCache, SQLiteEmbeddingCache, embedding_cache_key
 from .instrumented import InstrumentedEmbeddingModel, instrument_embedding_model
-from .result import EmbeddingResult, EmbedInputType
+from .result import EmbeddingResult, EmbedInputType, _concat_embeddings, _is_numpy_array, _to_numpy_embeddings
 from .settings import EmbeddingSettings, merge_embedding_settings
 from .test import TestEmbeddingModel
 from .wrapper import WrapperEmbeddingModel
@@ -24,6 +27,9 @@ __all__ = [
     'EmbeddingModel',
     'EmbeddingSettings',
     'EmbeddingResult',
+    'EmbeddingCache',
+    'InMemoryEmbeddingCache',
+    'SQLiteEmbeddingCache',
     'merge_embedding_settings',
     'KnownEmbeddingModelName',
     'infer_embedding_model',
@@ -165,6 +171,13 @@ class Embedder:
     See the [Debugging and Monitoring guide](https://ai.pydantic.dev/logfire/) for more info.
     """
 
+    cache: EmbeddingCache | None
+    """Cache used to reuse previously computed embeddings.
+
+    When set, only inputs whose embeddings aren't cached are sent to the model, and the result's usage only
+    reflects those. See [`EmbeddingCache`][pydantic_ai.embeddings.EmbeddingCache].
+    """
+
     _instrument_default: ClassVar[InstrumentationSettings | bool] = False
 
     def __init__(
@@ -174,6 +187,7 @@ class Embedder:
         settings: EmbeddingSettings | None = None,
         defer_model_check: bool = True,
         instrument: InstrumentationSettings | bool | None = None,
+        cache: EmbeddingCache | None = None,
     ) -> None:
         """Initialize an Embedder.
 
@@ -191,10 +205,15 @@ class Embedder:
                 or pass an [`InstrumentationSettings`][pydantic_ai.models.instrumented.InstrumentationSettings]
                 instance to customize. If `None`, uses the value from
                 [`Embedder.instrument_all()`][pydantic_ai.embeddings.Embedder.instrument_all].
+            cache: Optional [`EmbeddingCache`][pydantic_ai.embeddings.EmbeddingCache] used to reuse embeddings
+                previously computed for the same model, dimensions, input type and text, like
+                [`InMemoryEmbeddingCache`][pydantic_ai.embeddings.InMemoryEmbeddingCache] or
+                [`SQLiteEmbeddingCache`][pydantic_ai.embeddings.SQLiteEmbeddingCache].
         """
         self._model = model if defer_model_check else infer_embedding_model(model)
         self._settings = settings
         self.instrument = instrument
+        self.cache = cache
 
         self._override_model: ContextVar[EmbeddingModel | None] = ContextVar('_override_model', default=None)
 
@@ -312,7 +331,15 @@ class Embedder:
         """
         model = self._get_model()
         settings = merge_embedding_settings(self._settings, settings)
-        return await model.embed(inputs, input_type=input_type, settings=settings)
+        if self.cache is None:
+            result = await _embed_in_batches(model, inputs, input_type, settings)
+        else:
+            result = await _embed_cached(model, self.cache, inputs, input_type, settings)
+
+        numpy_embeddings = (merge_embedding_settings(model.settings, settings) or {}).get('numpy_embeddings', False)
+        if numpy_embeddings and not _is_numpy_array(result.embeddings):
+            result = replace(result, embeddings=_to_numpy_embeddings(result.embeddings))
+        return result
 
     async def max_input_tokens(self) -> int | None:
         """Get the maximum number of tokens the model can accept as input.
@@ -382,3 +409,121 @@ class Embedder:
             instrument = self._instrument_default
 
         return instrument_embedding_model(model_, instrument)
+
+
+async def _embed_cached(
+    model: EmbeddingModel,
+    cache: EmbeddingCache,
+    inputs: str | Sequence[str],
+    input_type: EmbedInputType,
+    settings: EmbeddingSettings | None,
+) -> EmbeddingResult:
+    """Embed only the inputs whose embeddings aren't cached yet, and merge them with the cached ones."""
+    inputs_list = [inputs] if isinstance(inputs, str) else list(inputs)
+    dimensions = (merge_embedding_settings(model.settings, settings) or {}).get('dimensions')
+    keys = [
+        embedding_cache_key(
+            provider_name=model.system,
+            model_name=model.model_name,
+            dimensions=dimensions,
+            input_type=input_type,
+            text=text,
+        )
+        for text in inputs_list
+    ]
+    cached = await cache.get(keys)
+
+    # Each distinct text that isn't cached is only embedded once
+    missing = {key: text for key, text, embedding in zip(keys, inputs_list, cached) if embedding is None}
+    if not missing:
+        return EmbeddingResult(
+            embeddings=cast(list[Sequence[float]], cached),
+            inputs=inputs_list,
+            input_type=input_type,
+            model_name=model.model_name,
+            provider_name=model.system,
+        )
+
+    result = await _embed_in_batches(model, list(missing.values()), input_type, settings)
+    embedded = dict(zip(missing, result.embeddings))
+    await cache.set(embedded)
+    return replace(
+        result,
+        embeddings=[embedding if embedding is not None else embedded[key] for key, embedding in zip(keys, cached)],
+        inputs=inputs_list,
+    )
+
+
+async def _embed_in_batches(
+    model: EmbeddingModel, inputs: str | Sequence[str], input_type: EmbedInputType, settings: EmbeddingSettings | None
+) -> EmbeddingResult:
+    """Embed inputs using as many concurrent requests as needed to stay within the model's per-request limits."""
+    # Limits may be set on the embedder, the model, or per call
+    limits = merge_embedding_settings(model.settings, settings) or {}
+    batches = _split_into_batches(inputs, model, limits)
+    if len(batches) <= 1:
+        return await model.embed(inputs, input_type=input_type, settings=settings)
+
+    semaphore = anyio.Semaphore(limits.get('max_concurrency', 5))
+    results: list[EmbeddingResult | None] = [None] * len(batches)
+
+    async def embed_batch(index: int, batch: list[str]) -> None:
+        async with semaphore:
+            results[index] = await model.embed(batch, input_type=input_type, settings=settings)
+
+    async with anyio.create_task_group() as tg:
+        for i, batch in enumerate(batches):
+            tg.start_soon(embed_batch, i, batch)
+
+    return _combine_results([result for result in results if result is not None])
+
+
+def _split_into_batches(
+    inputs: str | Sequence[str], model: EmbeddingModel, settings: EmbeddingSettings
+) -> list[list[str]]:
+    """Split inputs into batches that fit within the model's per-request input count and token limits.
+
+    Token counts are estimated using the UTF-8 byte length of each input, which is an upper bound for the byte-level
+    tokenizers used by embedding models and avoids having to tokenize (or make a request) for every input.
+    """
+    inputs_list = [inputs] if isinstance(inputs, str) else list(inputs)
+    max_size = settings.get('max_batch_size', model.max_batch_size)
+    max_tokens = settings.get('max_batch_tokens', model.max_batch_tokens)
+    if max_size is None and max_tokens is None:
+        return [inputs_list]
+
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    batch_tokens = 0
+    for text in inputs_list:
+        tokens = len(text.encode()) if max_tokens is not None else 0
+        if batch and (
+            (max_size is not None and len(batch) >= max_size)
+            or (max_tokens is not None and batch_tokens + tokens > max_tokens)
+        ):
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _combine_results(results: list[EmbeddingResult]) -> EmbeddingResult:
+    """Combine the results of embedding consecutive batches of inputs into a single result."""
+    first = results[0]
+    usage = RequestUsage()
+    for result in results:
+        usage.incr(result.usage)
+
+    return EmbeddingResult(
+        embeddings=_concat_embeddings([result.embeddings for result in results]),
+        inputs=[text for result in results for text in result.inputs],
+        input_type=first.input_type,
+        model_name=first.model_name,
+        provider_name=first.provider_name,
+        timestamp=first.timestamp,
+        usage=usage,
+    )
@@ -92,6 +92,16 @@ class EmbeddingModel(ABC):
 
         return inputs, settings
 
+    @property
+    def max_batch_size(self) -> int | None:
+        """The maximum number of inputs that can be embedded in a single request, or `None` if unknown."""
+        return None
+
+    @property
+    def max_batch_tokens(self) -> int | None:
+        """The maximum total number of tokens across all inputs in a single request, or `None` if unknown."""
+        return None
+
     async def max_input_tokens(self) -> int | None:
         """Get the maximum number of tokens that can be input to the model.
 
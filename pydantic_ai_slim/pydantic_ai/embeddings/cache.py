@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from pydantic_ai import _utils
+
+from .result import EmbedInputType
+
+__all__ = 'EmbeddingCache', 'InMemoryEmbeddingCache', 'SQLiteEmbeddingCache', 'embedding_cache_key'
+
+# SQLite limits the number of parameters in a single statement to 999 on older versions
+_SQLITE_MAX_PARAMS = 900
+
+
+def embedding_cache_key(
+    *, provider_name: str, model_name: str, dimensions: int | None, input_type: EmbedInputType, text: str
+) -> str:
+    """Build the key used to cache the embedding of a text.
+
+    The text is hashed using SHA-256, so keys have a bounded size and don't contain the text itself.
+    """
+    text_hash = hashlib.sha256(text.encode()).hexdigest()
+    return f'{provider_name}:{model_name}:{dimensions or ""}:{input_type}:{text_hash}'
+
+
+class EmbeddingCache(ABC):
+    """Abstract base class for caches of embeddings, used by [`Embedder`][pydantic_ai.embeddings.Embedder].
+
+    Keys are built by [`embedding_cache_key`][pydantic_ai.embeddings.cache.embedding_cache_key] and identify the
+    model, dimensions, input type and text that the embedding was generated for.
+    """
+
+    @abstractmethod
+    async def get(self, keys: Sequence[str]) -> list[Sequence[float] | None]:
+        """Get the cached embeddings for the given keys, with `None` for keys that aren't cached."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set(self, entries: Mapping[str, Sequence[float]]) -> None:
+        """Store the given embeddings by key."""
+        raise NotImplementedError()
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """An in-memory cache that evicts the least recently used embeddings once `max_size` is reached."""
+
+    max_size: int | None
+    """The maximum number of embeddings to keep, or `None` for no limit."""
+
+    def __init__(self, max_size: int | None = 10_000):
+        """Initialize an in-memory embedding cache.
+
+        Args:
+            max_size: The maximum number of embeddings to keep, or `None` for no limit.
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Sequence[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, keys: Sequence[str]) -> list[Sequence[float] | None]:
+        return [self._get(key) for key in keys]
+
+    async def set(self, entries: Mapping[str, Sequence[float]]) -> None:
+        for key, embedding in entries.items():
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all embeddings from the cache."""
+        self._entries.clear()
+
+    def _get(self, key: str) -> Sequence[float] | None:
+        embedding = self._entries.get(key)
+        if embedding is not None:
+            self._entries.move_to_end(key)
+        return embedding
+
+
+class SQLiteEmbeddingCache(EmbeddingCache):
+    """A cache that persists embeddings to a SQLite database on disk, so they can be reused across processes.
+
+    Embeddings are stored as packed 64-bit floats. The most recently used embeddings are also kept in memory,
+    so repeated lookups don't need to hit the database. Database access runs in a worker thread.
+    """
+
+    path: Path
+    """The path of the SQLite database file."""
+
+    def __init__(self, path: str | Path, *, memory_cache_size: int = 1024):
+        """Initialize a SQLite embedding cache.
+
+        Args:
+            path: The path of the SQLite database file. It will be created if it doesn't exist.
+            memory_cache_size: The number of recently used embeddings to also keep in memory, or `0` to disable.
+        """
+        self.path = Path(path)
+        self._memory = InMemoryEmbeddingCache(memory_cache_size) if memory_cache_size else None
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def get(self, keys: Sequence[str]) -> list[Sequence[float] | None]:
+        results: list[Sequence[float] | None] = (
+            await self._memory.get(keys) if self._memory is not None else [None] * len(keys)
+        )
+        missing = [key for key, result in zip(keys, results) if result is None]
+        if not missing:
+            return results
+
+        stored = await _utils.run_in_executor(self._select, missing)
+        if self._memory is not None and stored:
+            await self._memory.set(stored)
+        return [result if result is not None else stored.get(key) for key, result in zip(keys, results)]
+
+    async def set(self, entries: Mapping[str, Sequence[float]]) -> None:
+        if not entries:
+            return
+        if self._memory is not None:
+            await self._memory.set(entries)
+        await _utils.run_in_executor(self._insert, entries)
+
+    def close(self) -> None:
+        """Close the database connection. It will be reopened if the cache is used again."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)')
+            self._connection = connection
+        return self._connection
+
+    def _select(self, keys: list[str]) -> dict[str, Sequence[float]]:
+        stored: dict[str, Sequence[float]] = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                chunk = keys[start : start + _SQLITE_MAX_PARAMS]
+                placeholders = ', '.join('?' * len(chunk))
+                rows = connection.execute(
+                    f'SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})', chunk
+                ).fetchall()
+                for key, blob in rows:
+                    stored[key] = array('d', blob).tolist()
+        return stored
+
+    def _insert(self, entries: Mapping[str, Sequence[float]]) -> None:
+        rows = [(key, array('d', embedding).tobytes()) for key, embedding in entries.items()]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany('INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)', rows)
@@ -201,6 +201,11 @@ class CohereEmbeddingModel(EmbeddingModel):
             provider_response_id=response.id,
         )
 
+    @property
+    def max_batch_size(self) -> int | None:
+        # https://docs.cohere.com/reference/embed
+        return 96
+
     async def max_input_tokens(self) -> int | None:
         return _MAX_INPUT_TOKENS.get(self.model_name)
 
@@ -1,3 +1,4 @@
+import base64
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Literal, cast
@@ -9,13 +10,13 @@ from pydantic_ai.usage import RequestUsage
 
 from . import OpenAIEmbeddingsCompatibleProvider
 from .base import EmbeddingModel, EmbedInputType
-from .result import EmbeddingResult
+from .result import EmbeddingResult, _import_numpy, _to_numpy_embeddings
 from .settings import EmbeddingSettings
 
 try:
     import tiktoken
     from openai import APIConnectionError, APIStatusError, AsyncOpenAI
-    from openai.types import EmbeddingModel as LatestOpenAIEmbeddingModelNames
+    from openai.types import Embedding, EmbeddingModel as LatestOpenAIEmbeddingModelNames
     from openai.types.create_embedding_response import Usage
 
     from pydantic_ai.models.openai import OMIT
@@ -120,12 +121,16 @@ class OpenAIEmbeddingModel(EmbeddingModel):
     ) -> EmbeddingResult:
         inputs, settings = self.prepare_embed(inputs, settings)
         settings = cast(OpenAIEmbeddingSettings, settings)
+        numpy_embeddings = settings.get('numpy_embeddings', False)
 
         try:
             response = await self._client.embeddings.create(
                 input=inputs,
                 model=self.model_name,
                 dimensions=settings.get('dimensions') or OMIT,
+                # Base64 encoded embeddings can be decoded straight into a NumPy array,
+                # but OpenAI-compatible APIs don't necessarily support them
+                encoding_format='base64' if numpy_embeddings and self.system == 'openai' else OMIT,
                 extra_headers=settings.get('extra_headers'),
                 extra_body=settings.get('extra_body'),
             )
@@ -136,7 +141,11 @@ class OpenAIEmbeddingModel(EmbeddingModel):
         except APIConnectionError as e:  # pragma: no cover
             raise ModelAPIError(model_name=self.model_name, message=e.message) from e
 
-        embeddings = [item.embedding for item in response.data]
+        embeddings: Sequence[Sequence[float]]
+        if numpy_embeddings:
+            embeddings = _numpy_embeddings(response.data)
+        else:
+            embeddings = [item.embedding for item in response.data]
 
         return EmbeddingResult(
             embeddings=embeddings,
@@ -147,6 +156,22 @@ class OpenAIEmbeddingModel(EmbeddingModel):
             provider_name=self.system,
         )
 
+    @property
+    def max_batch_size(self) -> int | None:
+        if self.system != 'openai':
+            return None
+
+        # https://platform.openai.com/docs/api-reference/embeddings/create
+        return 2048
+
+    @property
+    def max_batch_tokens(self) -> int | None:
+        if self.system != 'openai':
+            return None
+
+        # https://platform.openai.com/docs/api-reference/embeddings/create
+        return 300_000
+
     async def max_input_tokens(self) -> int | None:
         if self.system != 'openai':
             return None
@@ -190,3 +215,15 @@ def _map_usage(
         api_flavor='embeddings',
         details=details,
     )
+
+
+def _numpy_embeddings(data: list[Embedding]) -> Sequence[Sequence[float]]:
+    """Build a 2-D `float32` array from the response, decoding base64 encoded embeddings without intermediate lists."""
+    if not data or not all(isinstance(item.embedding, str) for item in data):
+        return _to_numpy_embeddings([item.embedding for item in data])
+
+    np = _import_numpy()
+    buffer = bytearray()
+    for item in data:
+        buffer += base64.b64decode(cast(str, item.embedding))
+    return np.frombuffer(buffer, dtype=np.float32).reshape(len(data), -1)
@@ -1,13 +1,17 @@
 from collections.abc import Sequence
 from dataclasses import KW_ONLY, dataclass, field
 from datetime import datetime
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from genai_prices import calc_price, types as genai_types
 
 from pydantic_ai._utils import now_utc as _now_utc
 from pydantic_ai.usage import RequestUsage
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 EmbedInputType = Literal['query', 'document']
 """The type of input to the embedding model.
 
@@ -54,6 +58,8 @@ class EmbeddingResult:
     """The computed embedding vectors, one per input text.
 
     Each embedding is a sequence of floats representing the text in vector space.
+    When the [`numpy_embeddings`][pydantic_ai.embeddings.EmbeddingSettings.numpy_embeddings] setting is enabled,
+    this is a 2-D `float32` NumPy array with one row per input.
     """
 
     _: KW_ONLY
@@ -118,3 +124,81 @@ class EmbeddingResult:
             provider_id=self.provider_name,
             genai_request_timestamp=self.timestamp,
         )
+
+    def similarity(self, other: 'EmbeddingResult | Sequence[Sequence[float]]') -> 'npt.NDArray[np.float32]':
+        """Calculate the cosine similarity between each of these embeddings and each of the other embeddings.
+
+        Requires `numpy` to be installed.
+
+        Args:
+            other: The embeddings to compare against, typically the result of embedding documents.
+
+        Returns:
+            A 2-D array with a row for each of these embeddings and a column for each of the other embeddings.
+        """
+        np = _import_numpy()
+        other_embeddings = other.embeddings if isinstance(other, EmbeddingResult) else other
+        return _normalize_rows(np, self.embeddings) @ _normalize_rows(np, other_embeddings).T
+
+    def top_k(self, other: 'EmbeddingResult | Sequence[Sequence[float]]', k: int) -> list[list[tuple[int, float]]]:
+        """Find the `k` most similar of the other embeddings for each of these embeddings, by cosine similarity.
+
+        Requires `numpy` to be installed.
+
+        Args:
+            other: The embeddings to search, typically the result of embedding documents.
+            k: The number of most similar embeddings to return for each of these embeddings.
+
+        Returns:
+            For each of these embeddings, a list of up to `k` `(index, score)` tuples of the most similar
+            other embeddings, ordered from most to least similar.
+        """
+        np = _import_numpy()
+        scores = self.similarity(other)
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            return [[] for _ in range(scores.shape[0])]
+
+        # Partitioning avoids sorting all scores when only the top `k` are needed
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        indices = np.take_along_axis(candidates, order, axis=1)
+        top_scores = np.take_along_axis(candidate_scores, order, axis=1)
+        return [
+            [(int(index), float(score)) for index, score in zip(row_indices, row_scores)]
+            for row_indices, row_scores in zip(indices, top_scores)
+        ]
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as _import_error:
+        raise ImportError('Please install `numpy` to use NumPy embeddings, e.g. `pip install numpy`') from _import_error
+    return np
+
+
+def _is_numpy_array(value: Any) -> bool:
+    return type(value).__name__ == 'ndarray' and type(value).__module__ == 'numpy'
+
+
+def _to_numpy_embeddings(embeddings: Sequence[Sequence[float]]) -> 'npt.NDArray[np.float32]':
+    """Convert embeddings to a 2-D `float32` NumPy array, without copying if they already are one."""
+    np = _import_numpy()
+    if len(embeddings) == 0:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def _concat_embeddings(parts: Sequence[Sequence[Sequence[float]]]) -> Sequence[Sequence[float]]:
+    """Concatenate the embeddings of consecutive batches, keeping them as a NumPy array if they all are."""
+    if parts and all(_is_numpy_array(part) for part in parts):
+        return _import_numpy().concatenate(parts)
+    return [embedding for part in parts for embedding in part]
+
+
+def _normalize_rows(np: Any, embeddings: Sequence[Sequence[float]]) -> 'npt.NDArray[np.float32]':
+    array = _to_numpy_embeddings(embeddings)
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    return np.divide(array, norms, out=np.zeros_like(array), where=norms != 0)
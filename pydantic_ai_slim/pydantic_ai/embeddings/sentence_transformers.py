@@ -146,7 +146,11 @@ class SentenceTransformerEmbeddingModel(EmbeddingModel):
             truncate_dim=dimensions,
             **{'batch_size': batch_size} if batch_size is not None else {},  # type: ignore[reportArgumentType]
         )
-        embeddings = np_embeddings.tolist()
+        embeddings: Sequence[Sequence[float]] = (
+            np.asarray(np_embeddings, dtype=np.float32)
+            if settings.get('numpy_embeddings', False)
+            else np_embeddings.tolist()
+        )
 
         return EmbeddingResult(
             embeddings=embeddings,
@@ -48,6 +48,40 @@ class EmbeddingSettings(TypedDict, total=False):
     * VoyageAI
     """
 
+    max_batch_size: int
+    """The maximum number of inputs to send to the model in a single request.
+
+    When given more inputs than fit in a single request, [`Embedder`][pydantic_ai.embeddings.Embedder] splits them
+    into batches that are embedded concurrently, and combines the results in order.
+    Defaults to the model's [`max_batch_size`][pydantic_ai.embeddings.EmbeddingModel.max_batch_size], if known.
+    """
+
+    max_batch_tokens: int
+    """The maximum total number of tokens across all inputs to send to the model in a single request.
+
+    Token counts are estimated using the UTF-8 byte length of each input, which is an upper bound for
+    the byte-level tokenizers used by embedding models.
+    Defaults to the model's [`max_batch_tokens`][pydantic_ai.embeddings.EmbeddingModel.max_batch_tokens], if known.
+    """
+
+    max_concurrency: int
+    """The maximum number of batches to embed concurrently when inputs are split into multiple requests.
+
+    Defaults to 5.
+    """
+
+    numpy_embeddings: bool
+    """Whether to return the embeddings as a 2-D `float32` NumPy array rather than lists of floats.
+
+    This uses 4 bytes per value rather than the ~32 bytes of a Python float in a list, which adds up when embedding
+    many inputs, and lets [`EmbeddingResult.similarity()`][pydantic_ai.embeddings.EmbeddingResult.similarity]
+    avoid a conversion.
+    Requires `numpy` to be installed.
+
+    Supported by all models when using [`Embedder`][pydantic_ai.embeddings.Embedder]. OpenAI and
+    Sentence Transformers models build the array directly from the response, without intermediate lists.
+    """
+
     extra_headers: dict[str, str]
     """Extra headers to send to the model.
 
@@ -82,6 +82,21 @@ _MAX_INPUT_TOKENS: dict[VoyageAIEmbeddingModelName, int] = {
 }
 
 
+# https://docs.voyageai.com/reference/embeddings-api
+_MAX_BATCH_TOKENS: dict[VoyageAIEmbeddingModelName, int] = {
+    'voyage-4-large': 120_000,
+    'voyage-4': 320_000,
+    'voyage-4-lite': 1_000_000,
+    'voyage-3-large': 120_000,
+    'voyage-3.5': 320_000,
+    'voyage-3.5-lite': 1_000_000,
+    'voyage-code-3': 120_000,
+    'voyage-finance-2': 120_000,
+    'voyage-law-2': 120_000,
+    'voyage-code-2': 120_000,
+}
+
+
 @dataclass(init=False)
 class VoyageAIEmbeddingModel(EmbeddingModel):
     """VoyageAI embedding model implementation.
@@ -180,6 +195,15 @@ class VoyageAIEmbeddingModel(EmbeddingModel):
             provider_name=self.system,
         )
 
+    @property
+    def max_batch_size(self) -> int | None:
+        # https://docs.voyageai.com/reference/embeddings-api
+        return 1000
+
+    @property
+    def max_batch_tokens(self) -> int | None:
+        return _MAX_BATCH_TOKENS.get(self.model_name)
+
     async def max_input_tokens(self) -> int | None:
         return _MAX_INPUT_TOKENS.get(self.model_name)
 
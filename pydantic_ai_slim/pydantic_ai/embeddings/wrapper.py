@@ -68,5 +68,13 @@ class WrapperEmbeddingModel(EmbeddingModel):
     def base_url(self) -> str | None:
         return self.wrapped.base_url
 
+    @property
+    def max_batch_size(self) -> int | None:
+        return self.wrapped.max_batch_size
+
+    @property
+    def max_batch_tokens(self) -> int | None:
+        return self.wrapped.max_batch_tokens
+
     def __getattr__(self, item: str):
         return getattr(self.wrapped, item)  # pragma: no cover
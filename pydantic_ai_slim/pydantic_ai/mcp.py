@@ -354,6 +354,16 @@ class MCPServer(AbstractToolset[Any], ABC):
     Set to `False` for servers that change resources dynamically without sending notifications.
     """
 
+    pool_size: int
+    """The number of sessions to open with the server, to handle many concurrent requests.
+
+    Each request is sent using the session with the fewest requests in progress. For
+    [`MCPServerStdio`][pydantic_ai.mcp.MCPServerStdio], each session runs its own server subprocess.
+
+    The cached lists of tools and resources are shared by all sessions, and are invalidated when the server
+    sends a notification over any of them, so all sessions should be to servers with the same tools and resources.
+    """
+
     _id: str | None
 
     _enter_lock: Lock = field(compare=False)
@@ -368,7 +378,9 @@ class MCPServer(AbstractToolset[Any], ABC):
     _instructions: str | None
 
     _cached_tools: list[mcp_types.Tool] | None
+    _cached_toolset_tools: tuple[list[mcp_types.Tool], dict[str, ToolsetTool[Any]]] | None
     _cached_resources: list[Resource] | None
+    _sessions: list[_PooledSession]
 
     # TODO (v2): enforce the arguments to be passed as keyword arguments only
     def __init__(
@@ -388,7 +400,11 @@ class MCPServer(AbstractToolset[Any], ABC):
         *,
         id: str | None = None,
         client_info: mcp_types.Implementation | None = None,
+        pool_size: int = 1,
     ):
+        if pool_size < 1:
+            raise ValueError(f'`pool_size` must be at least 1, got {pool_size}.')
+
         self.tool_prefix = tool_prefix
         self.log_level = log_level
         self.log_handler = log_handler
@@ -402,6 +418,7 @@ class MCPServer(AbstractToolset[Any], ABC):
         self.cache_tools = cache_tools
         self.cache_resources = cache_resources
         self.client_info = client_info
+        self.pool_size = pool_size
 
         self._id = id or tool_prefix
 
@@ -412,7 +429,9 @@ class MCPServer(AbstractToolset[Any], ABC):
         self._running_count = 0
         self._exit_stack = None
         self._cached_tools = None
+        self._cached_toolset_tools = None
         self._cached_resources = None
+        self._sessions = []
 
     @abstractmethod
     @asynccontextmanager
@@ -483,15 +502,15 @@ class MCPServer(AbstractToolset[Any], ABC):
 
         Set `cache_tools=False` for servers that change tools without sending notifications.
         """
-        async with self:
+        async with self._session() as client:
             if self.cache_tools:
                 if self._cached_tools is not None:
                     return self._cached_tools
-                result = await self._client.list_tools()
+                result = await client.list_tools()
                 self._cached_tools = result.tools
                 return result.tools
             else:
-                result = await self._client.list_tools()
+                result = await client.list_tools()
                 return result.tools
 
     async def direct_call_tool(
@@ -513,9 +532,9 @@ class MCPServer(AbstractToolset[Any], ABC):
         Raises:
             ModelRetry: If the tool call fails.
         """
-        async with self:  # Ensure server is running
+        async with self._session() as client:  # Ensure server is running
             try:
-                result = await self._client.send_request(
+                result = await client.send_request(
                     mcp_types.ClientRequest(
                         mcp_types.CallToolRequest(
                             method='tools/call',
@@ -569,8 +588,18 @@ class MCPServer(AbstractToolset[Any], ABC):
         else:
             return await self.direct_call_tool(name, tool_args)
 
+    @property
+    def has_static_tools(self) -> bool:
+        """Whether the tools are cached, in which case they're reused until the server notifies that they've changed."""
+        return self.cache_tools
+
     async def get_tools(self, ctx: RunContext[Any]) -> dict[str, ToolsetTool[Any]]:
-        return {
+        mcp_tools = await self.list_tools()
+        # The cached list of tools is replaced when the server notifies that the tools have changed
+        if self._cached_toolset_tools is not None and self._cached_toolset_tools[0] is mcp_tools:
+            return self._cached_toolset_tools[1]
+
+        tools = {
             name: self.tool_for_tool_def(
                 ToolDefinition(
                     name=name,
@@ -583,9 +612,12 @@ class MCPServer(AbstractToolset[Any], ABC):
                     },
                 ),
             )
-            for mcp_tool in await self.list_tools()
+            for mcp_tool in mcp_tools
             if (name := f'{self.tool_prefix}_{mcp_tool.name}' if self.tool_prefix else mcp_tool.name)
         }
+        if self.cache_tools:
+            self._cached_toolset_tools = (mcp_tools, tools)
+        return tools
 
     def tool_for_tool_def(self, tool_def: ToolDefinition) -> ToolsetTool[Any]:
         return ToolsetTool(
@@ -607,19 +639,19 @@ class MCPServer(AbstractToolset[Any], ABC):
         Raises:
             MCPError: If the server returns an error.
         """
-        async with self:
+        async with self._session() as client:
             if not self.capabilities.resources:
                 return []
             try:
                 if self.cache_resources:
                     if self._cached_resources is not None:
                         return self._cached_resources
-                    result = await self._client.list_resources()
+                    result = await client.list_resources()
                     resources = [Resource.from_mcp_sdk(r) for r in result.resources]
                     self._cached_resources = resources
                     return resources
                 else:
-                    result = await self._client.list_resources()
+                    result = await client.list_resources()
                     return [Resource.from_mcp_sdk(r) for r in result.resources]
             except mcp_exceptions.McpError as e:
                 raise MCPError.from_mcp_sdk(e) from e
@@ -630,11 +662,11 @@ class MCPServer(AbstractToolset[Any], ABC):
         Raises:
             MCPError: If the server returns an error.
         """
-        async with self:  # Ensure server is running
+        async with self._session() as client:  # Ensure server is running
             if not self.capabilities.resources:
                 return []
             try:
-                result = await self._client.list_resource_templates()
+                result = await client.list_resource_templates()
             except mcp_exceptions.McpError as e:
                 raise MCPError.from_mcp_sdk(e) from e
         return [ResourceTemplate.from_mcp_sdk(t) for t in result.resourceTemplates]
@@ -663,9 +695,9 @@ class MCPServer(AbstractToolset[Any], ABC):
             MCPError: If the server returns an error.
         """
         resource_uri = uri if isinstance(uri, str) else uri.uri
-        async with self:  # Ensure server is running
+        async with self._session() as client:  # Ensure server is running
             try:
-                result = await self._client.read_resource(AnyUrl(resource_uri))
+                result = await client.read_resource(AnyUrl(resource_uri))
             except mcp_exceptions.McpError as e:
                 raise MCPError.from_mcp_sdk(e) from e
 
@@ -687,31 +719,62 @@ class MCPServer(AbstractToolset[Any], ABC):
             if self._running_count == 0:
                 async with AsyncExitStack() as exit_stack:
                     self._read_stream, self._write_stream = await exit_stack.enter_async_context(self.client_streams())
-
-                    client = ClientSession(
-                        read_stream=self._read_stream,
-                        write_stream=self._write_stream,
-                        sampling_callback=self._sampling_callback if self.allow_sampling else None,
-                        elicitation_callback=self.elicitation_callback,
-                        logging_callback=self.log_handler,
-                        read_timeout_seconds=timedelta(seconds=self.read_timeout),
-                        message_handler=self._handle_notification,
-                        client_info=self.client_info,
-                    )
-                    self._client = await exit_stack.enter_async_context(client)
-
-                    with anyio.fail_after(self.timeout):
-                        result = await self._client.initialize()
-                        self._server_info = result.serverInfo
-                        self._server_capabilities = ServerCapabilities.from_mcp_sdk(result.capabilities)
-                        self._instructions = result.instructions
-                        if log_level := self.log_level:
-                            await self._client.set_logging_level(log_level)
-
+                    self._client, result = await self._start_session(exit_stack, self._read_stream, self._write_stream)
+                    self._server_info = result.serverInfo
+                    self._server_capabilities = ServerCapabilities.from_mcp_sdk(result.capabilities)
+                    self._instructions = result.instructions
+                    sessions = [_PooledSession(self._client)]
+
+                    # Additional sessions are started one by one, as their contexts must be exited in this task
+                    for _ in range(self.pool_size - 1):
+                        read_stream, write_stream = await exit_stack.enter_async_context(self.client_streams())
+                        client, _ = await self._start_session(exit_stack, read_stream, write_stream)
+                        sessions.append(_PooledSession(client))
+
+                    self._sessions = sessions
                     self._exit_stack = exit_stack.pop_all()
             self._running_count += 1
         return self
 
+    async def _start_session(
+        self,
+        exit_stack: AsyncExitStack,
+        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        write_stream: MemoryObjectSendStream[SessionMessage],
+    ) -> tuple[ClientSession, mcp_types.InitializeResult]:
+        client = ClientSession(
+            read_stream=read_stream,
+            write_stream=write_stream,
+            sampling_callback=self._sampling_callback if self.allow_sampling else None,
+            elicitation_callback=self.elicitation_callback,
+            logging_callback=self.log_handler,
+            read_timeout_seconds=timedelta(seconds=self.read_timeout),
+            message_handler=self._handle_notification,
+            client_info=self.client_info,
+        )
+        client = await exit_stack.enter_async_context(client)
+
+        with anyio.fail_after(self.timeout):
+            result = await client.initialize()
+            if log_level := self.log_level:
+                await client.set_logging_level(log_level)
+        return client, result
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[ClientSession]:
+        """Ensure the server is running, and use the session with the fewest requests in progress."""
+        async with self:
+            if len(self._sessions) <= 1:
+                yield self._client
+                return
+
+            session = min(self._sessions, key=lambda s: s.active_requests)
+            session.active_requests += 1
+            try:
+                yield session.client
+            finally:
+                session.active_requests -= 1
+
     async def __aexit__(self, *args: Any) -> bool | None:
         if self._running_count == 0:
             raise ValueError('MCPServer.__aexit__ called more times than __aenter__')
@@ -720,7 +783,9 @@ class MCPServer(AbstractToolset[Any], ABC):
             if self._running_count == 0 and self._exit_stack is not None:
                 await self._exit_stack.aclose()
                 self._exit_stack = None
+                self._sessions = []
                 self._cached_tools = None
+                self._cached_toolset_tools = None
                 self._cached_resources = None
 
     @property
@@ -761,6 +826,7 @@ class MCPServer(AbstractToolset[Any], ABC):
         if isinstance(message, mcp_types.ServerNotification):  # pragma: no branch
             if isinstance(message.root, mcp_types.ToolListChangedNotification):
                 self._cached_tools = None
+                self._cached_toolset_tools = None
             elif isinstance(message.root, mcp_types.ResourceListChangedNotification):
                 self._cached_resources = None
 
@@ -811,6 +877,14 @@ class MCPServer(AbstractToolset[Any], ABC):
         return isinstance(value, MCPServer) and self.id == value.id and self.tool_prefix == value.tool_prefix
 
 
+@dataclass
+class _PooledSession:
+    """A session in the pool of an [`MCPServer`][pydantic_ai.mcp.MCPServer]."""
+
+    client: ClientSession
+    active_requests: int = 0
+
+
 class MCPServerStdio(MCPServer):
     """Runs an MCP server in a subprocess and communicates with it over stdin/stdout.
 
@@ -864,6 +938,7 @@ class MCPServerStdio(MCPServer):
     elicitation_callback: ElicitationFnT | None = None
     cache_tools: bool
     cache_resources: bool
+    pool_size: int
 
     def __init__(
         self,
@@ -886,6 +961,7 @@ class MCPServerStdio(MCPServer):
         cache_resources: bool = True,
         id: str | None = None,
         client_info: mcp_types.Implementation | None = None,
+        pool_size: int = 1,
     ):
         """Build a new MCP server.
 
@@ -910,6 +986,8 @@ class MCPServerStdio(MCPServer):
                 See [`MCPServer.cache_resources`][pydantic_ai.mcp.MCPServer.cache_resources].
             id: An optional unique ID for the MCP server. An MCP server needs to have an ID in order to be used in a durable execution environment like Temporal, in which case the ID will be used to identify the server's activities within the workflow.
             client_info: Information describing the MCP client implementation.
+            pool_size: The number of server subprocesses to start and open sessions with.
+                See [`MCPServer.pool_size`][pydantic_ai.mcp.MCPServer.pool_size].
         """
         self.command = command
         self.args = args
@@ -931,6 +1009,7 @@ class MCPServerStdio(MCPServer):
             cache_resources,
             id=id,
             client_info=client_info,
+            pool_size=pool_size,
         )
 
     @classmethod
@@ -1031,6 +1110,7 @@ class _MCPServerHTTP(MCPServer):
     elicitation_callback: ElicitationFnT | None = None
     cache_tools: bool
     cache_resources: bool
+    pool_size: int
 
     def __init__(
         self,
@@ -1052,6 +1132,7 @@ class _MCPServerHTTP(MCPServer):
         cache_tools: bool = True,
         cache_resources: bool = True,
         client_info: mcp_types.Implementation | None = None,
+        pool_size: int = 1,
         **_deprecated_kwargs: Any,
     ):
         """Build a new MCP server.
@@ -1076,6 +1157,8 @@ class _MCPServerHTTP(MCPServer):
             cache_resources: Whether to cache the list of resources.
                 See [`MCPServer.cache_resources`][pydantic_ai.mcp.MCPServer.cache_resources].
             client_info: Information describing the MCP client implementation.
+            pool_size: The number of sessions to open with the server.
+                See [`MCPServer.pool_size`][pydantic_ai.mcp.MCPServer.pool_size].
         """
         if 'sse_read_timeout' in _deprecated_kwargs:
             if read_timeout is not None:
@@ -1110,6 +1193,7 @@ class _MCPServerHTTP(MCPServer):
             cache_resources=cache_resources,
             id=id,
             client_info=client_info,
+            pool_size=pool_size,
         )
 
     def __repr__(self) -> str:  # pragma: no cover
@@ -16,13 +16,13 @@ from urllib.parse import urlparse
 
 import pydantic
 import pydantic_core
-from genai_prices import calc_price, types as genai_types
+from genai_prices import types as genai_types
 from opentelemetry._logs import LogRecord
 from opentelemetry.util.types import AnyValue
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 from typing_extensions import TypeAliasType, deprecated
 
-from . import _otel_messages, _utils
+from . import _otel_messages, _prices, _utils
 from ._utils import generate_tool_call_id as _generate_tool_call_id, now_utc as _now_utc
 from .exceptions import UnexpectedModelBehavior
 from .usage import RequestUsage
@@ -553,12 +553,25 @@ class BinaryContent:
     @property
     def data_uri(self) -> str:
         """Convert the `BinaryContent` to a data URI."""
-        return f'data:{self.media_type};base64,{self.base64}'
+        # Memoized like `base64`, keyed on the data and media type in case either is reassigned
+        cached = self.__dict__.get('_data_uri_cache')
+        if cached is not None and cached[0] is self.data and cached[1] == self.media_type:
+            return cached[2]
+        data_uri = f'data:{self.media_type};base64,{self.base64}'
+        self.__dict__['_data_uri_cache'] = (self.data, self.media_type, data_uri)
+        return data_uri
 
     @property
     def base64(self) -> str:
         """Return the binary data as a base64-encoded string. Default encoding is UTF-8."""
-        return base64.b64encode(self.data).decode()
+        # Messages are mapped to the model's format on every request, so the encoding is memoized to avoid
+        # re-encoding large files for every request in a conversation
+        cached = self.__dict__.get('_base64_cache')
+        if cached is not None and cached[0] is self.data:
+            return cached[1]
+        encoded = base64.b64encode(self.data).decode()
+        self.__dict__['_base64_cache'] = (self.data, encoded)
+        return encoded
 
     @property
     def is_audio(self) -> bool:
@@ -1391,20 +1404,11 @@ class ModelResponse:
         """
         assert self.model_name, 'Model name is required to calculate price'
         # Try matching on provider_api_url first as this is more specific, then fall back to provider_id.
-        if self.provider_url:
-            try:
-                return calc_price(
-                    self.usage,
-                    self.model_name,
-                    provider_api_url=self.provider_url,
-                    genai_request_timestamp=self.timestamp,
-                )
-            except LookupError:
-                pass
-        return calc_price(
+        return _prices.calc_price(
             self.usage,
             self.model_name,
             provider_id=self.provider_name,
+            provider_api_url=self.provider_url,
             genai_request_timestamp=self.timestamp,
         )
 
@@ -7,20 +7,26 @@ specific LLM being used.
 from __future__ import annotations as _annotations
 
 import base64
+import hashlib
+import json
+import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from functools import cache, cached_property
+from pathlib import Path
 from typing import Any, Generic, Literal, TypeVar, get_args, overload
 
 import httpx
 from typing_extensions import TypeAliasType, TypedDict
 
 from .. import _utils
-from .._json_schema import JsonSchemaTransformer
+from .._json_schema import JsonSchema, JsonSchemaTransformer
 from .._output import OutputObjectDefinition, StructuredTextOutputSchema
 from .._parts_manager import ModelResponsePartsManager
 from .._run_context import RunContext
@@ -1251,6 +1257,273 @@ class DownloadedItem(TypedDict, Generic[DataT]):
     """
 
 
+@dataclass(frozen=True)
+class DownloadCacheInfo:
+    """Statistics for the cache of file content downloaded by [`download_item`][pydantic_ai.models.download_item]."""
+
+    hits: int
+    """The number of downloads served from the cache without a request."""
+    revalidations: int
+    """The number of cached downloads that were confirmed unchanged by a conditional request."""
+    misses: int
+    """The number of downloads that had to fetch the content."""
+    max_bytes: int
+    """The maximum total size of the content kept in memory."""
+    currbytes: int
+    """The total size of the content currently kept in memory."""
+
+
+@dataclass
+class _CachedDownload:
+    data: bytes
+    content_type: str | None
+    etag: str | None
+    last_modified: str | None
+    fresh_until: float
+    """The `time.time()` until which the content can be used without revalidating it."""
+    _base64: str | None = field(default=None, repr=False)
+
+    @property
+    def base64(self) -> str:
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.data).decode('utf-8')
+        return self._base64
+
+
+class _DownloadCache:
+    """A cache of downloaded file content, bounded by total size in bytes and keyed by URL.
+
+    Content is used without a request while it's fresh according to the response's `Cache-Control: max-age`, or the
+    cache's `ttl` otherwise, and then revalidated using its `ETag` or `Last-Modified` header if it had one.
+    Content evicted from memory is spilled to `disk_path`, if set, from where it's evicted oldest first.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, disk_path: Path | None = None, max_disk_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self.max_disk_bytes = max_disk_bytes
+        self._cache: OrderedDict[str, _CachedDownload] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+
+    async def get(self, url: str) -> _CachedDownload | None:
+        with self._lock:
+            cached = self._cache.get(url)
+            if cached is not None:
+                self._cache.move_to_end(url)
+                return cached
+        if self.disk_path is None:
+            return None
+        cached = await _utils.run_in_executor(self._read_from_disk, url)
+        if cached is not None:
+            await self.put(url, cached)
+        return cached
+
+    async def put(self, url: str, download: _CachedDownload) -> None:
+        spilled: list[tuple[str, _CachedDownload]] = []
+        if len(download.data) > self.max_bytes:
+            spilled.append((url, download))
+        else:
+            with self._lock:
+                if (previous := self._cache.pop(url, None)) is not None:
+                    self._size -= len(previous.data)
+                self._cache[url] = download
+                self._size += len(download.data)
+                while self._size > self.max_bytes:
+                    evicted_url, evicted = self._cache.popitem(last=False)
+                    self._size -= len(evicted.data)
+                    spilled.append((evicted_url, evicted))
+        if self.disk_path is not None and spilled:
+            await _utils.run_in_executor(self._write_to_disk, spilled)
+
+    def record(self, *, hit: bool = False, revalidated: bool = False) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            elif revalidated:
+                self._revalidations += 1
+            else:
+                self._misses += 1
+
+    def cache_info(self) -> DownloadCacheInfo:
+        with self._lock:
+            return DownloadCacheInfo(
+                hits=self._hits,
+                revalidations=self._revalidations,
+                misses=self._misses,
+                max_bytes=self.max_bytes,
+                currbytes=self._size,
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._size = 0
+            self._hits = 0
+            self._revalidations = 0
+            self._misses = 0
+        if self.disk_path is not None and self.disk_path.is_dir():
+            for path in self.disk_path.glob('*.download'):
+                path.unlink(missing_ok=True)
+
+    def _disk_file(self, url: str) -> Path:
+        assert self.disk_path is not None
+        return self.disk_path / f'{hashlib.sha256(url.encode()).hexdigest()}.download'
+
+    def _read_from_disk(self, url: str) -> _CachedDownload | None:
+        try:
+            raw = self._disk_file(url).read_bytes()
+        except OSError:
+            return None
+        header, _, data = raw.partition(b'\n')
+        metadata = json.loads(header)
+        if metadata.pop('url') != url:  # pragma: no cover
+            return None
+        return _CachedDownload(data=data, **metadata)
+
+    def _write_to_disk(self, downloads: list[tuple[str, _CachedDownload]]) -> None:
+        assert self.disk_path is not None
+        self.disk_path.mkdir(parents=True, exist_ok=True)
+        written: set[Path] = set()
+        for url, download in downloads:
+            metadata = {
+                'url': url,
+                'content_type': download.content_type,
+                'etag': download.etag,
+                'last_modified': download.last_modified,
+                'fresh_until': download.fresh_until,
+            }
+            path = self._disk_file(url)
+            path.write_bytes(json.dumps(metadata).encode() + b'\n' + download.data)
+            written.add(path)
+
+        # Evict the oldest files first, but never the ones just written unless they don't fit by themselves
+        files = sorted(
+            ((path.stat(), path) for path in self.disk_path.glob('*.download')),
+            key=lambda item: (item[1] in written, item[0].st_mtime_ns),
+        )
+        disk_bytes = sum(stat.st_size for stat, _ in files)
+        for stat, path in files:
+            if disk_bytes <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            disk_bytes -= stat.st_size
+
+
+_download_cache: _DownloadCache | None = _DownloadCache(max_bytes=64 * 1024 * 1024, ttl=300)
+
+
+def configure_download_cache(
+    *,
+    max_bytes: int = 64 * 1024 * 1024,
+    ttl: float = 300,
+    disk_path: str | Path | None = None,
+    max_disk_bytes: int = 1024 * 1024 * 1024,
+) -> None:
+    """Configure the cache of file content downloaded by [`download_item`][pydantic_ai.models.download_item].
+
+    Models download [`FileUrl`][pydantic_ai.messages.FileUrl] content they can't pass to the API by URL, on every
+    request that includes it in the message history. The cache lets later requests reuse the content (and its
+    base64 encoding), and replaces any existing cache.
+
+    Args:
+        max_bytes: The maximum total size of the content kept in memory, after which the least recently used content
+            is evicted. Set to `0` to disable the cache.
+        ttl: The number of seconds that content is used without a request, if the response had an `ETag` or
+            `Last-Modified` header but didn't specify `Cache-Control: max-age`. After that, content is revalidated
+            using a conditional request. Content from responses with neither a validator nor `max-age` isn't cached.
+        disk_path: A directory to spill content evicted from memory to, so it can be reused across processes.
+        max_disk_bytes: The maximum total size of the content spilled to disk, after which the oldest is deleted.
+    """
+    global _download_cache
+    if max_bytes <= 0:
+        _download_cache = None
+    else:
+        _download_cache = _DownloadCache(
+            max_bytes=max_bytes,
+            ttl=ttl,
+            disk_path=Path(disk_path) if disk_path is not None else None,
+            max_disk_bytes=max_disk_bytes,
+        )
+
+
+def download_cache_info() -> DownloadCacheInfo | None:
+    """Return statistics for the cache of downloaded file content, or `None` if it's disabled."""
+    return _download_cache.cache_info() if _download_cache is not None else None
+
+
+def download_cache_clear() -> None:
+    """Clear the cache of downloaded file content and reset its statistics."""
+    if _download_cache is not None:
+        _download_cache.cache_clear()
+
+
+def _fresh_until(response: httpx.Response, ttl: float, revalidatable: bool) -> float | None:
+    """Return until when the response's content can be used without revalidating it, or `None` if it can't be cached.
+
+    Content is only given a freshness lifetime of `ttl` seconds if the response didn't specify `max-age` and the
+    content can be revalidated, as otherwise it could be served long after it has changed.
+    """
+    cache_control: dict[str, str] = {}
+    for directive in response.headers.get('cache-control', '').split(','):
+        name, _, value = directive.strip().partition('=')
+        cache_control[name.lower()] = value
+    if 'no-store' in cache_control:
+        return None
+    try:
+        max_age = int(cache_control['max-age'])
+    except (KeyError, ValueError):
+        max_age = None
+    if not revalidatable:
+        return time.time() + max_age if max_age is not None and 'no-cache' not in cache_control else None
+    if 'no-cache' in cache_control:
+        return 0
+    return time.time() + (max_age if max_age is not None else ttl)
+
+
+async def _fetch(item: FileUrl) -> _CachedDownload:
+    """Fetch the item's content, reusing or revalidating cached content if possible."""
+    cache = _download_cache
+    cached = await cache.get(item.url) if cache is not None else None
+    if cache is not None and cached is not None and cached.fresh_until > time.time():
+        cache.record(hit=True)
+        return cached
+
+    headers: dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+
+    client = cached_async_http_client()
+    response = await client.get(item.url, follow_redirects=True, headers=headers)
+    if cache is not None and cached is not None and response.status_code == 304:
+        cache.record(revalidated=True)
+        cached.fresh_until = _fresh_until(response, cache.ttl, revalidatable=True) or 0
+        return cached
+
+    response.raise_for_status()
+    download = _CachedDownload(
+        data=response.content,
+        content_type=response.headers.get('content-type'),
+        etag=response.headers.get('etag'),
+        last_modified=response.headers.get('last-modified'),
+        fresh_until=0,
+    )
+    if cache is not None:
+        cache.record()
+        revalidatable = download.etag is not None or download.last_modified is not None
+        if (fresh_until := _fresh_until(response, cache.ttl, revalidatable)) is not None:
+            download.fresh_until = fresh_until
+            await cache.put(item.url, download)
+    return download
+
+
 @overload
 async def download_item(
     item: FileUrl,
@@ -1295,11 +1568,9 @@ async def download_item(
     elif isinstance(item, VideoUrl) and item.is_youtube:
         raise UserError('Downloading YouTube videos is not supported.')
 
-    client = cached_async_http_client()
-    response = await client.get(item.url, follow_redirects=True)
-    response.raise_for_status()
+    download = await _fetch(item)
 
-    if content_type := response.headers.get('content-type'):
+    if content_type := download.content_type:
         content_type = content_type.split(';')[0]
         if content_type == 'application/octet-stream':
             content_type = None
@@ -1310,9 +1581,9 @@ async def download_item(
     if type_format == 'extension':
         data_type = item.format
 
-    data = response.content
+    data = download.data
     if data_format in ('base64', 'base64_uri'):
-        data = base64.b64encode(data).decode('utf-8')
+        data = download.base64
         if data_format == 'base64_uri':
             data = f'data:{media_type};base64,{data}'
         return DownloadedItem[str](data=data, data_type=data_type)
@@ -1330,27 +1601,118 @@ def get_user_agent() -> str:
     return f'pydantic-ai/{__version__}'
 
 
+@dataclass(frozen=True)
+class JsonSchemaTransformCacheInfo:
+    """Statistics for the cache of JSON schemas transformed by [`Model.customize_request_parameters`][pydantic_ai.models.Model.customize_request_parameters]."""
+
+    hits: int
+    """The number of tool definitions and output objects whose transformed schema was reused."""
+    misses: int
+    """The number of tool definitions and output objects whose schema had to be transformed."""
+    maxsize: int
+    """The maximum number of transformed schemas kept in the cache."""
+    currsize: int
+    """The number of transformed schemas currently in the cache."""
+
+
+_JsonSchemaTransformCacheKey = tuple[type[JsonSchemaTransformer], bool | None, str]
+
+
+class _JsonSchemaTransformCache:
+    """A bounded LRU cache of transformed JSON schemas, keyed by transformer class, strictness and schema content.
+
+    Tool and output schemas rarely change between requests, but walking them with the profile's transformer on every
+    request is expensive for agents with many tools.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._cache: OrderedDict[_JsonSchemaTransformCacheKey, tuple[JsonSchema, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def transform(
+        self, transformer: type[JsonSchemaTransformer], schema: JsonSchema, strict: bool | None
+    ) -> tuple[JsonSchema, bool]:
+        """Return the transformed schema and whether it is strict-compatible, transforming it on a cache miss."""
+        try:
+            key = (transformer, strict, json.dumps(schema))
+        except (TypeError, ValueError):
+            # Not JSON serializable, so we can't key on its content
+            return self._transform(transformer, schema, strict)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        result = self._transform(transformer, schema, strict)
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> JsonSchemaTransformCacheInfo:
+        with self._lock:
+            return JsonSchemaTransformCacheInfo(
+                hits=self._hits, misses=self._misses, maxsize=self.maxsize, currsize=len(self._cache)
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @staticmethod
+    def _transform(
+        transformer: type[JsonSchemaTransformer], schema: JsonSchema, strict: bool | None
+    ) -> tuple[JsonSchema, bool]:
+        schema_transformer = transformer(schema, strict=strict)
+        return schema_transformer.walk(), schema_transformer.is_strict_compatible
+
+
+_json_schema_transform_cache = _JsonSchemaTransformCache(maxsize=1024)
+
+
+def json_schema_transform_cache_info() -> JsonSchemaTransformCacheInfo:
+    """Return hit/miss statistics for the cache of transformed tool and output JSON schemas."""
+    return _json_schema_transform_cache.cache_info()
+
+
+def json_schema_transform_cache_clear() -> None:
+    """Clear the cache of transformed tool and output JSON schemas, and reset its statistics."""
+    _json_schema_transform_cache.cache_clear()
+
+
 def _customize_tool_def(transformer: type[JsonSchemaTransformer], tool_def: ToolDefinition):
     """Customize the tool definition using the given transformer.
 
     If the tool definition has `strict` set to None, the strictness will be inferred from the transformer.
     """
-    schema_transformer = transformer(tool_def.parameters_json_schema, strict=tool_def.strict)
-    parameters_json_schema = schema_transformer.walk()
+    parameters_json_schema, is_strict_compatible = _json_schema_transform_cache.transform(
+        transformer, tool_def.parameters_json_schema, tool_def.strict
+    )
     return replace(
         tool_def,
         parameters_json_schema=parameters_json_schema,
-        strict=schema_transformer.is_strict_compatible if tool_def.strict is None else tool_def.strict,
+        strict=is_strict_compatible if tool_def.strict is None else tool_def.strict,
     )
 
 
 def _customize_output_object(transformer: type[JsonSchemaTransformer], output_object: OutputObjectDefinition):
-    schema_transformer = transformer(output_object.json_schema, strict=output_object.strict)
-    json_schema = schema_transformer.walk()
+    json_schema, is_strict_compatible = _json_schema_transform_cache.transform(
+        transformer, output_object.json_schema, output_object.strict
+    )
     return replace(
         output_object,
         json_schema=json_schema,
-        strict=schema_transformer.is_strict_compatible if output_object.strict is None else output_object.strict,
+        strict=is_strict_compatible if output_object.strict is None else output_object.strict,
     )
 
 
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import functools
-import typing
-from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import count
-from typing import TYPE_CHECKING, Any, Generic, Literal, cast, overload
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 from urllib.parse import parse_qs, urlparse
 
 import anyio.to_thread
@@ -51,7 +50,6 @@ from pydantic_ai.tools import ToolDefinition
 
 if TYPE_CHECKING:
     from botocore.client import BaseClient
-    from botocore.eventstream import EventStream
     from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
     from mypy_boto3_bedrock_runtime.literals import StopReasonType
     from mypy_boto3_bedrock_runtime.type_defs import (
@@ -153,7 +151,6 @@ See [the Bedrock docs](https://docs.aws.amazon.com/bedrock/latest/userguide/mode
 """
 
 P = ParamSpec('P')
-T = typing.TypeVar('T')
 
 _FINISH_REASON_MAP: dict[StopReasonType, FinishReason] = {
     'content_filtered': 'content_filter',
@@ -373,14 +370,21 @@ class BedrockConverseModel(Model):
         )
         settings = cast(BedrockModelSettings, model_settings or {})
         response = await self._messages_create(messages, True, settings, model_request_parameters)
-        yield BedrockStreamedResponse(
-            model_request_parameters=model_request_parameters,
-            _model_name=self.model_name,
-            _event_stream=response['stream'],
-            _provider_name=self._provider.name,
-            _provider_url=self.base_url,
-            _provider_response_id=response.get('ResponseMetadata', {}).get('RequestId', None),
-        )
+        # The event stream is read by a single thread for the whole response, rather than a thread per event
+        event_stream = response['stream']
+        try:
+            async with _utils.iterate_in_thread(event_stream) as events:
+                yield BedrockStreamedResponse(
+                    model_request_parameters=model_request_parameters,
+                    _model_name=self.model_name,
+                    _event_stream=events,
+                    _provider_name=self._provider.name,
+                    _provider_url=self.base_url,
+                    _provider_response_id=response.get('ResponseMetadata', {}).get('RequestId', None),
+                )
+        finally:
+            # Unblock the thread if it's waiting for the next event
+            event_stream.close()
 
     async def _process_response(self, response: ConverseResponseTypeDef) -> ModelResponse:
         items: list[ModelResponsePart] = []
@@ -948,7 +952,7 @@ class BedrockStreamedResponse(StreamedResponse):
     """Implementation of `StreamedResponse` for Bedrock models."""
 
     _model_name: BedrockModelName
-    _event_stream: EventStream[ConverseStreamOutputTypeDef]
+    _event_stream: AsyncIterator[ConverseStreamOutputTypeDef]
     _provider_name: str
     _provider_url: str
     _timestamp: datetime = field(default_factory=_utils.now_utc)
@@ -970,7 +974,7 @@ class BedrockStreamedResponse(StreamedResponse):
         # We accumulate the deltas here and yield the complete return part once the content block ends
         builtin_tool_returns: dict[int, BuiltinToolReturnPart] = {}
 
-        async for chunk in _AsyncIteratorWrapper(self._event_stream):
+        async for chunk in self._event_stream:
             match chunk:
                 case {'messageStart': _}:
                     continue
@@ -1109,22 +1113,3 @@ class BedrockStreamedResponse(StreamedResponse):
             cache_read_tokens=cache_read_tokens,
             cache_write_tokens=cache_write_tokens,
         )
-
-
-class _AsyncIteratorWrapper(Generic[T]):
-    """Wrap a synchronous iterator in an async iterator."""
-
-    def __init__(self, sync_iterator: Iterable[T]):
-        self.sync_iterator = iter(sync_iterator)
-
-    def __aiter__(self):
-        return self
-
-    async def __anext__(self) -> T:
-        try:
-            return await anyio.to_thread.run_sync(next, self.sync_iterator)
-        except RuntimeError as e:
-            if type(e.__cause__) is StopIteration:
-                raise StopAsyncIteration
-            else:
-                raise e  # pragma: lax no cover
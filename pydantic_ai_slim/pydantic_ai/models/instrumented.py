@@ -3,9 +3,11 @@ from __future__ import annotations
 import itertools
 import json
 import warnings
-from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any, Literal, cast
 from urllib.parse import urlparse
 
@@ -17,7 +19,7 @@ from opentelemetry._logs import (
     get_logger_provider,
 )
 from opentelemetry.metrics import MeterProvider, get_meter_provider
-from opentelemetry.trace import Span, SpanKind, Tracer, TracerProvider, get_tracer_provider
+from opentelemetry.trace import Link, Span, SpanContext, SpanKind, Tracer, TracerProvider, get_tracer_provider
 from opentelemetry.util.types import AttributeValue
 from pydantic import TypeAdapter
 
@@ -62,6 +64,10 @@ ANY_ADAPTER = TypeAdapter[Any](Any)
 # https://opentelemetry.io/docs/specs/semconv/gen-ai/gen-ai-metrics/#metric-gen_aiclienttokenusage
 TOKEN_HISTOGRAM_BOUNDARIES = (1, 4, 16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
 
+# The number of model response timestamps (and responses per timestamp) that
+# `InstrumentationSettings(incremental_messages=True)` remembers the spans of.
+MAX_RECORDED_RESPONSES = 1024
+
 
 def instrument_model(model: Model, instrument: InstrumentationSettings | bool) -> Model:
     """Instrument a model with OpenTelemetry/logfire."""
@@ -93,6 +99,11 @@ class InstrumentationSettings:
     include_binary_content: bool = True
     include_content: bool = True
     version: Literal[1, 2, 3] = DEFAULT_INSTRUMENTATION_VERSION
+    cache_messages: bool = False
+    incremental_messages: bool = False
+
+    _otel_message_cache: dict[int, _CachedOtelMessage] = field(repr=False, compare=False)
+    _recorded_responses: dict[tuple[str | None, datetime], list[_RecordedResponse]] = field(repr=False, compare=False)
 
     def __init__(
         self,
@@ -104,6 +115,8 @@ class InstrumentationSettings:
         version: Literal[1, 2, 3] = DEFAULT_INSTRUMENTATION_VERSION,
         event_mode: Literal['attributes', 'logs'] = 'attributes',
         logger_provider: LoggerProvider | None = None,
+        cache_messages: bool = False,
+        incremental_messages: bool = False,
     ):
         """Create instrumentation options.
 
@@ -132,6 +145,18 @@ class InstrumentationSettings:
                 If not provided, the global logger provider is used.
                 Calling `logfire.configure()` sets the global logger provider, so most users don't need this.
                 This is only used if `event_mode='logs'` and `version=1`.
+            cache_messages: Whether to cache the serialized form of each message, so that messages which were already
+                sent in a previous request of the same conversation aren't converted and serialized again.
+                Messages are cached by identity for as long as they are alive, so this assumes that messages
+                aren't modified in place after being sent to the model.
+                This is only used if `version` is 2 or higher.
+            incremental_messages: Whether to only record the messages that are new since the previous request
+                in the `gen_ai.input.messages` attribute of model request spans, instead of the whole conversation.
+                When a request continues from the response of a previous request that was instrumented with these
+                settings, the span is linked to the previous request's span, and the previous span's ID is stored
+                in the `pydantic_ai.previous_request.span_id` attribute.
+                Otherwise, all messages are recorded as usual.
+                This is only used if `version` is 2 or higher.
         """
         from pydantic_ai import __version__
 
@@ -154,6 +179,10 @@ class InstrumentationSettings:
             version = 1
 
         self.version = version
+        self.cache_messages = cache_messages
+        self.incremental_messages = incremental_messages
+        self._otel_message_cache = {}
+        self._recorded_responses = {}
 
         # As specified in the OpenTelemetry GenAI metrics spec:
         # https://opentelemetry.io/docs/specs/semconv/gen-ai/gen-ai-metrics/#metric-gen_aiclienttokenusage
@@ -239,6 +268,61 @@ class InstrumentationSettings:
                 result.append(otel_message)
         return result
 
+    def otel_messages_json(self, messages: list[ModelMessage]) -> str:
+        """Convert a list of model messages to OpenTelemetry chat messages, serialized as a JSON array.
+
+        If `cache_messages` is enabled, the serialized form of each message is reused from previous calls.
+        """
+        if not self.cache_messages:
+            return json.dumps(self.messages_to_otel_messages(messages))
+        # This is the same as `json.dumps` of the whole list with the default separators
+        return '[' + ', '.join(item for message in messages for item in self._otel_message_json(message)) + ']'
+
+    def _otel_message_json(self, message: ModelMessage) -> list[str]:
+        key = id(message)
+        cached = self._otel_message_cache.get(key)
+        # Messages are cached by identity, but the parts of a message in the history may be replaced,
+        # e.g. when dynamic system prompts are reevaluated.
+        if cached is not None and cached.parts is message.parts and cached.num_parts == len(message.parts):
+            return cached.items
+
+        items = [json.dumps(otel_message) for otel_message in self.messages_to_otel_messages([message])]
+        if cached is None:
+            # The entry is removed when the message is garbage collected, before its `id` can be reused.
+            weakref.finalize(message, self._otel_message_cache.pop, key, None)
+        self._otel_message_cache[key] = _CachedOtelMessage(message.parts, len(message.parts), items)
+        return items
+
+    def previous_request(self, input_messages: list[ModelMessage]) -> tuple[SpanContext, int] | None:
+        """Find the previous request that the input messages of a request continue from, if `incremental_messages` is enabled.
+
+        Returns:
+            The span context of the previous request, and the number of input messages that were already recorded
+            in it, or `None` if the messages don't continue from a request instrumented with these settings.
+        """
+        if not self.incremental_messages or self.version == 1:
+            return None
+        for index in range(len(input_messages) - 1, -1, -1):
+            message = input_messages[index]
+            if isinstance(message, ModelResponse):
+                # Timestamps often only have a resolution of a second, so concurrent conversations can have
+                # responses with the same key.
+                candidates = [
+                    recorded
+                    for recorded in self._recorded_responses.get(_recorded_response_key(message), ())
+                    if recorded.message_count == index + 1
+                ]
+                for recorded in candidates:
+                    if recorded.parts is message.parts:
+                        return recorded.span_context, recorded.message_count
+                # Streamed responses are rebuilt by `StreamedResponse.get()`, so they can only be compared by their
+                # parts, which is ambiguous if another conversation had an identical response.
+                matches = [recorded for recorded in candidates if recorded.parts == message.parts]
+                if len(matches) == 1:
+                    return matches[0].span_context, matches[0].message_count
+                return None
+        return None
+
     def handle_messages(
         self,
         input_messages: list[ModelMessage],
@@ -266,16 +350,26 @@ class InstrumentationSettings:
                 }
             self._emit_events(span, events)
         else:
-            output_messages = self.messages_to_otel_messages([response])
-            assert len(output_messages) == 1
-            output_message = output_messages[0]
+            output_messages_json = self.otel_messages_json([response])
 
             instructions = InstrumentedModel._get_instructions(input_messages, parameters)  # pyright: ignore [reportPrivateUsage]
             system_instructions_attributes = self.system_instructions_attributes(instructions)
 
+            previous_messages_attributes: dict[str, AttributeValue] = {}
+            previous_request = self.previous_request(input_messages)
+            if self.incremental_messages:
+                self._record_response(response, span.get_span_context(), len(input_messages) + 1)
+            if previous_request:
+                previous_span_context, previous_message_count = previous_request
+                input_messages = input_messages[previous_message_count:]
+                previous_messages_attributes['pydantic_ai.previous_request.span_id'] = format(
+                    previous_span_context.span_id, '016x'
+                )
+
             attributes: dict[str, AttributeValue] = {
-                'gen_ai.input.messages': json.dumps(self.messages_to_otel_messages(input_messages)),
-                'gen_ai.output.messages': json.dumps([output_message]),
+                'gen_ai.input.messages': self.otel_messages_json(input_messages),
+                'gen_ai.output.messages': output_messages_json,
+                **previous_messages_attributes,
                 **system_instructions_attributes,
                 'logfire.json_schema': json.dumps(
                     {
@@ -295,6 +389,15 @@ class InstrumentationSettings:
             }
             span.set_attributes(attributes)
 
+    def _record_response(self, response: ModelResponse, span_context: SpanContext, message_count: int) -> None:
+        key = _recorded_response_key(response)
+        recorded = self._recorded_responses.pop(key, [])
+        recorded.append(_RecordedResponse(response.parts, span_context, message_count))
+        self._recorded_responses[key] = recorded[-MAX_RECORDED_RESPONSES:]
+        if len(self._recorded_responses) > MAX_RECORDED_RESPONSES:
+            # Forget the oldest response, whose conversation is the least likely to be continued
+            del self._recorded_responses[next(iter(self._recorded_responses))]
+
     def system_instructions_attributes(self, instructions: str | None) -> dict[str, str]:
         if instructions and self.include_content:
             return {
@@ -339,6 +442,29 @@ class InstrumentationSettings:
                 self.cost_histogram.record(cost, token_attributes)
 
 
+@dataclass
+class _CachedOtelMessage:
+    """The serialized OpenTelemetry chat messages of a model message."""
+
+    parts: Sequence[Any]
+    num_parts: int
+    items: list[str]
+
+
+@dataclass
+class _RecordedResponse:
+    """The span of the request that produced a model response, used to record messages incrementally."""
+
+    parts: Sequence[Any]
+    span_context: SpanContext
+    message_count: int
+    """The number of messages in the conversation up to and including the response."""
+
+
+def _recorded_response_key(response: ModelResponse) -> tuple[str | None, datetime]:
+    return response.provider_response_id, response.timestamp
+
+
 GEN_AI_SYSTEM_ATTRIBUTE = 'gen_ai.system'
 GEN_AI_REQUEST_MODEL_ATTRIBUTE = 'gen_ai.request.model'
 GEN_AI_PROVIDER_NAME_ATTRIBUTE = 'gen_ai.provider.name'
@@ -456,10 +582,14 @@ class InstrumentedModel(WrapperModel):
                 if isinstance(value := model_settings.get(key), float | int):
                     attributes[f'gen_ai.request.{key}'] = value
 
+        links: list[Link] = []
+        if previous_request := self.instrumentation_settings.previous_request(messages):
+            links.append(Link(previous_request[0]))
+
         record_metrics: Callable[[], None] | None = None
         try:
             with self.instrumentation_settings.tracer.start_as_current_span(
-                span_name, attributes=attributes, kind=SpanKind.CLIENT
+                span_name, attributes=attributes, kind=SpanKind.CLIENT, links=links
             ) as span:
 
                 def finish(response: ModelResponse, parameters: ModelRequestParameters):
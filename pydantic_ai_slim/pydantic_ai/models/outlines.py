@@ -10,8 +10,10 @@ from collections.abc import AsyncIterable, AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal, cast
 
+import anyio
 from typing_extensions import assert_never
 
 from .. import UnexpectedModelBehavior, _utils
@@ -87,18 +89,36 @@ class OutlinesModel(Model):
         provider: Literal['outlines'] | Provider[OutlinesBaseModel] = 'outlines',
         profile: ModelProfileSpec | None = None,
         settings: ModelSettings | None = None,
+        max_batch_size: int = 1,
+        batch_wait: float = 0.01,
     ):
         """Initialize an Outlines model.
 
+        Generation with a synchronous (local) Outlines model runs in a worker thread so it doesn't block the event
+        loop, one generation at a time.
+
         Args:
             model: The Outlines model used for the model.
             provider: The provider to use for OutlinesModel. Can be either the string 'outlines' or an
                 instance of `Provider[OutlinesBaseModel]`. If not provided, the other parameters will be used.
             profile: The model profile to use. Defaults to a profile picked by the provider.
             settings: Default model settings for this model instance.
+            max_batch_size: The maximum number of concurrent requests with the same output type and settings to
+                coalesce into a single batched generation call. Only supported by Transformers and vLLM offline
+                models. Defaults to 1, meaning requests are not batched.
+            batch_wait: How long in seconds to wait for more requests to join a batch before generating it, when
+                `max_batch_size` is greater than 1.
         """
+        if max_batch_size > 1 and not isinstance(model, Transformers | VLLMOffline):
+            raise UserError('Request batching is only supported for Transformers and vLLM offline Outlines models.')
+
         self.model: OutlinesBaseModel | OutlinesAsyncBaseModel = model
         self._model_name: str = 'outlines-model'
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait
+        # Local models generally can't run several generations at once, so they're run one at a time
+        self._generation_lock = anyio.Lock()
+        self._pending_batches: dict[str, _GenerationBatch] = {}
 
         if isinstance(provider, str):
             provider = infer_provider(provider)
@@ -115,6 +135,8 @@ class OutlinesModel(Model):
         provider: Literal['outlines'] | Provider[OutlinesBaseModel] = 'outlines',
         profile: ModelProfileSpec | None = None,
         settings: ModelSettings | None = None,
+        max_batch_size: int = 1,
+        batch_wait: float = 0.01,
     ):
         """Create an Outlines model from a Hugging Face model and tokenizer.
 
@@ -129,9 +151,19 @@ class OutlinesModel(Model):
                 instance of `Provider[OutlinesBaseModel]`. If not provided, the other parameters will be used.
             profile: The model profile to use. Defaults to a profile picked by the provider.
             settings: Default model settings for this model instance.
+            max_batch_size: The maximum number of concurrent compatible requests to coalesce into a single batched
+                generation call. Defaults to 1, meaning requests are not batched.
+            batch_wait: How long in seconds to wait for more requests to join a batch before generating it.
         """
         outlines_model: OutlinesBaseModel = from_transformers(hf_model, hf_tokenizer_or_processor)
-        return cls(outlines_model, provider=provider, profile=profile, settings=settings)
+        return cls(
+            outlines_model,
+            provider=provider,
+            profile=profile,
+            settings=settings,
+            max_batch_size=max_batch_size,
+            batch_wait=batch_wait,
+        )
 
     @classmethod
     def from_llamacpp(  # pragma: lax no cover
@@ -219,6 +251,8 @@ class OutlinesModel(Model):
         provider: Literal['outlines'] | Provider[OutlinesBaseModel] = 'outlines',
         profile: ModelProfileSpec | None = None,
         settings: ModelSettings | None = None,
+        max_batch_size: int = 1,
+        batch_wait: float = 0.01,
     ):
         """Create an Outlines model from a vLLM offline inference model.
 
@@ -228,9 +262,19 @@ class OutlinesModel(Model):
                 instance of `Provider[OutlinesBaseModel]`. If not provided, the other parameters will be used.
             profile: The model profile to use. Defaults to a profile picked by the provider.
             settings: Default model settings for this model instance.
+            max_batch_size: The maximum number of concurrent compatible requests to coalesce into a single batched
+                generation call. Defaults to 1, meaning requests are not batched.
+            batch_wait: How long in seconds to wait for more requests to join a batch before generating it.
         """
         outlines_model: OutlinesBaseModel | OutlinesAsyncBaseModel = from_vllm_offline(vllm_model)
-        return cls(outlines_model, provider=provider, profile=profile, settings=settings)
+        return cls(
+            outlines_model,
+            provider=provider,
+            profile=profile,
+            settings=settings,
+            max_batch_size=max_batch_size,
+            batch_wait=batch_wait,
+        )
 
     @property
     def model_name(self) -> str:
@@ -258,8 +302,13 @@ class OutlinesModel(Model):
         response: str
         if isinstance(self.model, OutlinesAsyncBaseModel):
             response = await self.model(prompt, output_type, None, **inference_kwargs)
+        elif self.max_batch_size > 1:
+            response = await self._generate_batched(prompt, output_type, inference_kwargs)
         else:
-            response = self.model(prompt, output_type, None, **inference_kwargs)
+            async with self._generation_lock:
+                response = await _utils.run_in_executor(
+                    partial(self.model, prompt, output_type, None, **inference_kwargs)
+                )
         return self._process_response(response)
 
     @asynccontextmanager
@@ -282,14 +331,65 @@ class OutlinesModel(Model):
         if isinstance(self.model, OutlinesAsyncBaseModel):
             response = self.model.stream(prompt, output_type, None, **inference_kwargs)
             yield await self._process_streamed_response(response, model_request_parameters)
-        else:  # pragma: lax no cover
-            response = self.model.stream(prompt, output_type, None, **inference_kwargs)
+        else:
+            async with self._generation_lock:
+                response = self.model.stream(prompt, output_type, None, **inference_kwargs)
 
-            async def async_response():
-                for chunk in response:
-                    yield chunk
+                async def async_response():
+                    # Each chunk is generated in a worker thread so the event loop isn't blocked in between
+                    while (chunk := await _utils.run_in_executor(next, response, None)) is not None:
+                        yield chunk
 
-            yield await self._process_streamed_response(async_response(), model_request_parameters)
+                yield await self._process_streamed_response(async_response(), model_request_parameters)
+
+    async def _generate_batched(
+        self, prompt: Chat, output_type: JsonSchema | None, inference_kwargs: dict[str, Any]
+    ) -> str:
+        """Generate a response, coalescing concurrent requests with the same output type and settings into a batch.
+
+        The first request to arrive waits up to `batch_wait` seconds for others to join its batch (or for the batch to
+        fill up), and then generates the whole batch in a worker thread.
+        """
+        assert isinstance(self.model, OutlinesBaseModel)
+        key = repr((output_type.schema if output_type else None, sorted(inference_kwargs.items())))
+
+        batch = self._pending_batches.get(key)
+        if batch is not None:
+            index = batch.add(prompt)
+            if len(batch.prompts) >= self.max_batch_size:
+                del self._pending_batches[key]
+                batch.full.set()
+            await batch.done.wait()
+            return batch.result(index)
+
+        batch = self._pending_batches[key] = _GenerationBatch()
+        batch.add(prompt)
+        # The other requests in the batch depend on this one to generate it, so it can't be cancelled halfway
+        with anyio.CancelScope(shield=True):
+            try:
+                with anyio.move_on_after(self.batch_wait):
+                    await batch.full.wait()
+                if self._pending_batches.get(key) is batch:
+                    del self._pending_batches[key]
+
+                async with self._generation_lock:
+                    if len(batch.prompts) == 1:
+                        responses = [
+                            await _utils.run_in_executor(
+                                partial(self.model, prompt, output_type, None, **inference_kwargs)
+                            )
+                        ]
+                    else:
+                        responses = await _utils.run_in_executor(
+                            partial(self.model.batch, batch.prompts, output_type, None, **inference_kwargs)
+                        )
+                batch.responses = responses
+            except Exception as e:
+                batch.error = e
+                raise
+            finally:
+                batch.done.set()
+        return batch.result(0)
 
     async def _build_generation_arguments(
         self,
@@ -526,6 +626,27 @@ class OutlinesModel(Model):
         )
 
 
+@dataclass
+class _GenerationBatch:
+    """Prompts for concurrent requests that will be generated in a single batched call."""
+
+    prompts: list[Chat] = field(default_factory=list[Chat])
+    full: anyio.Event = field(default_factory=anyio.Event)
+    done: anyio.Event = field(default_factory=anyio.Event)
+    responses: list[str] | None = None
+    error: Exception | None = None
+
+    def add(self, prompt: Chat) -> int:
+        self.prompts.append(prompt)
+        return len(self.prompts) - 1
+
+    def result(self, index: int) -> str:
+        if self.error is not None:
+            raise self.error
+        assert self.responses is not None
+        return self.responses[index]
+
+
 @dataclass
 class OutlinesStreamedResponse(StreamedResponse):
     """Implementation of `StreamedResponse` for Outlines models."""
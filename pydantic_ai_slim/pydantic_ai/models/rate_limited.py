@@ -0,0 +1,189 @@
+from __future__ import annotations as _annotations
+
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import anyio
+
+from .._run_context import RunContext
+from ..messages import ModelMessage, ModelResponse
+from ..settings import ModelSettings
+from ..usage import RequestUsage
+from . import KnownModelName, Model, ModelRequestParameters, StreamedResponse
+from .wrapper import WrapperModel
+
+__all__ = ('RateLimitedModel', 'RateLimitedModelSettings')
+
+
+class RateLimitedModelSettings(ModelSettings, total=False):
+    """Settings used to configure a [`RateLimitedModel`][pydantic_ai.models.rate_limited.RateLimitedModel].
+
+    These are read from the wrapped model's settings when the `RateLimitedModel` is created, for any limit not passed
+    to its constructor. As the limits are shared by all requests made through the model, they are not read per request.
+
+    ALL FIELDS MUST BE `rate_limit_` PREFIXED SO YOU CAN MERGE THEM WITH OTHER MODELS.
+    """
+
+    rate_limit_max_concurrency: int
+    """The maximum number of requests that may be in flight at once."""
+
+    rate_limit_requests_per_minute: float
+    """The maximum number of requests that may be started per minute."""
+
+    rate_limit_tokens_per_minute: float
+    """The maximum number of tokens (input and output) that may be used per minute."""
+
+
+@dataclass
+class _TokenBucket:
+    """A token bucket that refills continuously at `per_minute / 60` per second, up to `per_minute`.
+
+    The balance may go negative when actual usage exceeds what was reserved, in which case later callers wait for it
+    to recover. Callers are admitted in FIFO order, so a large reservation can't be starved by smaller ones.
+    """
+
+    per_minute: float
+    _balance: float = field(init=False)
+    _updated_at: float = field(init=False)
+    _lock: anyio.Lock = field(init=False, default_factory=anyio.Lock)
+
+    def __post_init__(self):
+        self._balance = self.per_minute
+        self._updated_at = time.monotonic()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` is available (or the bucket is full) and take it from the bucket."""
+        # Even an empty reservation needs the balance to have recovered, and a reservation larger than the bucket
+        # could never be satisfied, so it only needs a full bucket
+        needed = min(max(amount, 1), self.per_minute)
+        async with self._lock:
+            while (balance := self._refill()) < needed:
+                await anyio.sleep((needed - balance) * 60 / self.per_minute)
+            self._balance -= amount
+
+    def consume(self, amount: float) -> None:
+        """Take `amount` from the bucket without waiting, or give it back if negative."""
+        self._refill()
+        self._balance = min(self._balance - amount, self.per_minute)
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._balance = min(self._balance + (now - self._updated_at) * self.per_minute / 60, self.per_minute)
+        self._updated_at = now
+        return self._balance
+
+
+@dataclass(init=False)
+class RateLimitedModel(WrapperModel):
+    """Model which limits the concurrency, request rate and token rate of requests to the wrapped model.
+
+    The limits are shared by all agent runs using this model instance, and waiting requests are admitted in the order
+    they arrived. Token usage is taken from each response's [`RequestUsage`][pydantic_ai.usage.RequestUsage] once it
+    completes; set `count_tokens_before_request` to also reserve the input tokens up front using the wrapped model's
+    [`count_tokens`][pydantic_ai.models.Model.count_tokens], if supported.
+    """
+
+    max_concurrency: int | None
+    """The maximum number of requests that may be in flight at once."""
+    requests_per_minute: float | None
+    """The maximum number of requests that may be started per minute."""
+    tokens_per_minute: float | None
+    """The maximum number of tokens (input and output) that may be used per minute."""
+    count_tokens_before_request: bool
+    """Whether to reserve the request's input tokens using `count_tokens` before making it."""
+
+    _concurrency_limiter: anyio.Semaphore | None = field(repr=False)
+    _request_bucket: _TokenBucket | None = field(repr=False)
+    _token_bucket: _TokenBucket | None = field(repr=False)
+
+    def __init__(
+        self,
+        wrapped: Model | KnownModelName,
+        *,
+        max_concurrency: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        count_tokens_before_request: bool = False,
+    ):
+        """Initialize a rate limited model.
+
+        Args:
+            wrapped: The model or model name to wrap.
+            max_concurrency: The maximum number of requests that may be in flight at once.
+                Defaults to the wrapped model's `rate_limit_max_concurrency` setting.
+            requests_per_minute: The maximum number of requests that may be started per minute.
+                Defaults to the wrapped model's `rate_limit_requests_per_minute` setting.
+            tokens_per_minute: The maximum number of tokens (input and output) that may be used per minute.
+                Defaults to the wrapped model's `rate_limit_tokens_per_minute` setting.
+            count_tokens_before_request: Whether to reserve the request's input tokens using the wrapped model's
+                `count_tokens` before making it, rather than only accounting for them once the response arrives.
+                This makes an additional request for models that count tokens using their API, and is only
+                supported by models that implement `count_tokens`.
+        """
+        super().__init__(wrapped)
+        settings = cast(RateLimitedModelSettings, self.wrapped.settings or {})
+        self.max_concurrency = max_concurrency or settings.get('rate_limit_max_concurrency')
+        self.requests_per_minute = requests_per_minute or settings.get('rate_limit_requests_per_minute')
+        self.tokens_per_minute = tokens_per_minute or settings.get('rate_limit_tokens_per_minute')
+        self.count_tokens_before_request = count_tokens_before_request
+
+        self._concurrency_limiter = anyio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        self._request_bucket = _TokenBucket(self.requests_per_minute) if self.requests_per_minute else None
+        self._token_bucket = _TokenBucket(self.tokens_per_minute) if self.tokens_per_minute else None
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        async with self._limit(messages, model_settings, model_request_parameters) as record_usage:
+            response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+            record_usage(response.usage)
+            return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        async with self._limit(messages, model_settings, model_request_parameters) as record_usage:
+            async with self.wrapped.request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response_stream:
+                try:
+                    yield response_stream
+                finally:
+                    record_usage(response_stream.usage())
+
+    @asynccontextmanager
+    async def _limit(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> AsyncIterator[Callable[[RequestUsage], None]]:
+        """Wait for capacity to make a request, and yield a function to record the request's actual usage."""
+        reserved_tokens = 0
+        async with AsyncExitStack() as stack:
+            if self._concurrency_limiter is not None:
+                await stack.enter_async_context(self._concurrency_limiter)
+            if self._request_bucket is not None:
+                await self._request_bucket.acquire()
+            if self._token_bucket is not None:
+                if self.count_tokens_before_request:
+                    usage = await self.wrapped.count_tokens(messages, model_settings, model_request_parameters)
+                    reserved_tokens = usage.input_tokens
+                await self._token_bucket.acquire(reserved_tokens)
+
+            def record_usage(usage: RequestUsage) -> None:
+                if self._token_bucket is not None:
+                    self._token_bucket.consume(usage.total_tokens - reserved_tokens)
+
+            yield record_usage
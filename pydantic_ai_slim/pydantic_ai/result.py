@@ -42,6 +42,8 @@ __all__ = (
 T = TypeVar('T')
 """An invariant TypeVar."""
 
+_NO_OUTPUT_SOURCE = object()
+
 
 @dataclass(kw_only=True)
 class AgentStream(Generic[AgentDepsT, OutputDataT]):
@@ -67,13 +69,16 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
             yield deepcopy(self._cached_output)
             return
 
-        last_response: _messages.ModelResponse | None = None
+        # Partial validation of a large structured output is expensive, so we skip ticks where the data the output
+        # depends on (e.g. the output tool call args) hasn't changed, even if other parts of the response have.
+        last_output_source: object = _NO_OUTPUT_SOURCE
         async for response in self.stream_responses(debounce_by=debounce_by):
-            if self._raw_stream_response.final_result_event is None or (
-                last_response and response.parts == last_response.parts
-            ):
+            if self._raw_stream_response.final_result_event is None:
+                continue
+            output_source = self._partial_output_source(response)
+            if output_source == last_output_source:
                 continue
-            last_response = response
+            last_output_source = output_source
 
             try:
                 yield await self.validate_response_output(response, allow_partial=True)
@@ -241,6 +246,16 @@ class AgentStream(Generic[AgentDepsT, OutputDataT]):
                 'Invalid response, unable to process text output'
             )
 
+    def _partial_output_source(self, message: _messages.ModelResponse) -> object:
+        """Return the data from the response that `validate_response_output` depends on."""
+        final_result_event = self._raw_stream_response.final_result_event
+        output_tool_name = final_result_event.tool_name if final_result_event else None
+        if self._output_schema.toolset and output_tool_name is not None:
+            tool_call = next((part for part in message.tool_calls if part.tool_name == output_tool_name), None)
+            if tool_call is not None:  # pragma: no branch
+                return tool_call.args
+        return message.parts
+
     async def _stream_response_text(
         self, *, delta: bool = False, debounce_by: float | None = 0.1
     ) -> AsyncIterator[str]:
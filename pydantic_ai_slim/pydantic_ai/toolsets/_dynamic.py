@@ -43,6 +43,11 @@ class DynamicToolset(AbstractToolset[AgentDepsT]):
     def id(self) -> str | None:
         return self._id
 
+    @property
+    def has_static_tools(self) -> bool:
+        # Tools are only reused while they're the same dictionary, so this also holds when the toolset is rebuilt
+        return self._toolset is not None and self._toolset.has_static_tools
+
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, DynamicToolset)
@@ -95,6 +95,18 @@ class AbstractToolset(ABC, Generic[AgentDepsT]):
         """A hint for how to avoid name conflicts with other toolsets for use in error messages."""
         return 'Rename the tool or wrap the toolset in a `PrefixedToolset` to avoid name conflicts.'
 
+    @property
+    def has_static_tools(self) -> bool:
+        """Whether the tools returned by [`get_tools`][pydantic_ai.toolsets.AbstractToolset.get_tools] don't depend on the run context.
+
+        If this is `True`, `get_tools` must return the same dictionary for as long as the tools are unchanged, and a new
+        dictionary when they change, so that toolsets wrapping or combining this one can reuse the tools they built
+        from it across run steps and runs instead of building them again.
+
+        Defaults to `False`, in which case the tools are built again for each run step.
+        """
+        return False
+
     async def __aenter__(self) -> Self:
         """Enter the toolset context.
 
@@ -34,6 +34,8 @@ class CombinedToolset(AbstractToolset[AgentDepsT]):
     _enter_lock: Lock = field(compare=False, init=False, default_factory=Lock)
     _entered_count: int = field(init=False, default=0)
     _exit_stack: AsyncExitStack | None = field(init=False, default=None)
+    _toolsets_tools: list[dict[str, ToolsetTool[AgentDepsT]]] | None = field(init=False, default=None, repr=False)
+    _tools: dict[str, ToolsetTool[AgentDepsT]] = field(init=False, default_factory=dict, repr=False)
 
     @property
     def id(self) -> str | None:
@@ -43,6 +45,10 @@ class CombinedToolset(AbstractToolset[AgentDepsT]):
     def label(self) -> str:
         return f'{self.__class__.__name__}({", ".join(toolset.label for toolset in self.toolsets)})'  # pragma: no cover
 
+    @property
+    def has_static_tools(self) -> bool:
+        return all(toolset.has_static_tools for toolset in self.toolsets)
+
     async def __aenter__(self) -> Self:
         async with self._enter_lock:
             if self._entered_count == 0:
@@ -62,6 +68,15 @@ class CombinedToolset(AbstractToolset[AgentDepsT]):
 
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
         toolsets_tools = await asyncio.gather(*(toolset.get_tools(ctx) for toolset in self.toolsets))
+        # If all toolsets returned the same tools as last time, the combined tools are unchanged as well
+        previous_toolsets_tools = self._toolsets_tools
+        if (
+            previous_toolsets_tools is not None
+            and len(toolsets_tools) == len(previous_toolsets_tools)
+            and all(tools is previous_tools for tools, previous_tools in zip(toolsets_tools, previous_toolsets_tools))
+        ):
+            return self._tools
+
         all_tools: dict[str, ToolsetTool[AgentDepsT]] = {}
 
         for toolset, tools in zip(self.toolsets, toolsets_tools):
@@ -81,6 +96,9 @@ class CombinedToolset(AbstractToolset[AgentDepsT]):
                     source_toolset=toolset,
                     source_tool=tool,
                 )
+
+        if self.has_static_tools:
+            self._toolsets_tools, self._tools = toolsets_tools, all_tools
         return all_tools
 
     async def call_tool(
@@ -18,6 +18,10 @@ class FilteredToolset(WrapperToolset[AgentDepsT]):
 
     filter_func: Callable[[RunContext[AgentDepsT], ToolDefinition], bool]
 
+    @property
+    def has_static_tools(self) -> bool:
+        return False
+
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
         return {
             name: tool for name, tool in (await super().get_tools(ctx)).items() if self.filter_func(ctx, tool.tool_def)
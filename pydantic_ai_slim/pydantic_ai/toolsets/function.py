@@ -47,6 +47,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
     docstring_format: DocstringFormat
     require_parameter_descriptions: bool
     schema_generator: type[GenerateJsonSchema]
+    _cached_tools: dict[str, ToolsetTool[AgentDepsT]] | None
 
     def __init__(
         self,
@@ -103,6 +104,7 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         self.metadata = metadata
 
         self.tools = {}
+        self._cached_tools = None
         for tool in tools:
             if isinstance(tool, Tool):
                 self.add_tool(tool)  # pyright: ignore[reportUnknownArgumentType]
@@ -113,6 +115,14 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
     def id(self) -> str | None:
         return self._id
 
+    @property
+    def has_static_tools(self) -> bool:
+        """Whether none of the tools are prepared for each run step, so their definitions don't depend on the run context."""
+        return all(
+            tool.prepare is None and type(tool).prepare_tool_def is Tool.prepare_tool_def
+            for tool in self.tools.values()
+        )
+
     @overload
     def tool(self, func: ToolFuncEither[AgentDepsT, ToolParams], /) -> ToolFuncEither[AgentDepsT, ToolParams]: ...
 
@@ -333,8 +343,12 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
         if self.metadata is not None:
             tool.metadata = self.metadata | (tool.metadata or {})
         self.tools[tool.name] = tool
+        self._cached_tools = None
 
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
+        if self._cached_tools is not None:
+            return self._cached_tools
+
         tools: dict[str, ToolsetTool[AgentDepsT]] = {}
         for original_name, tool in self.tools.items():
             max_retries = tool.max_retries if tool.max_retries is not None else self.max_retries
@@ -364,6 +378,9 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
                 is_async=tool.function_schema.is_async,
                 timeout=tool_def.timeout,
             )
+
+        if self.has_static_tools:
+            self._cached_tools = tools
         return tools
 
     async def call_tool(
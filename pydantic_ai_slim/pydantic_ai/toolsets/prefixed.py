@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from .._run_context import AgentDepsT, RunContext
@@ -17,20 +17,32 @@ class PrefixedToolset(WrapperToolset[AgentDepsT]):
 
     prefix: str
 
+    _original_tools: dict[str, ToolsetTool[AgentDepsT]] | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _tools: dict[str, ToolsetTool[AgentDepsT]] = field(init=False, default_factory=dict, repr=False, compare=False)
+
     @property
     def tool_name_conflict_hint(self) -> str:
         return 'Change the `prefix` attribute to avoid name conflicts.'
 
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
-        return {
+        original_tools = await super().get_tools(ctx)
+        if original_tools is self._original_tools:
+            return self._tools
+
+        tools = {
             new_name: replace(
                 tool,
                 toolset=self,
                 tool_def=replace(tool.tool_def, name=new_name),
             )
-            for name, tool in (await super().get_tools(ctx)).items()
+            for name, tool in original_tools.items()
             if (new_name := f'{self.prefix}_{name}')
         }
+        if self.has_static_tools:
+            self._original_tools, self._tools = original_tools, tools
+        return tools
 
     async def call_tool(
         self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
@@ -18,6 +18,10 @@ class PreparedToolset(WrapperToolset[AgentDepsT]):
 
     prepare_func: ToolsPrepareFunc[AgentDepsT]
 
+    @property
+    def has_static_tools(self) -> bool:
+        return False
+
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
         original_tools = await super().get_tools(ctx)
         original_tool_defs = [tool.tool_def for tool in original_tools.values()]
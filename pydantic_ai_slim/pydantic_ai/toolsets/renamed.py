@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from .._run_context import AgentDepsT, RunContext
@@ -17,9 +17,17 @@ class RenamedToolset(WrapperToolset[AgentDepsT]):
 
     name_map: dict[str, str]
 
+    _original_tools: dict[str, ToolsetTool[AgentDepsT]] | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _tools: dict[str, ToolsetTool[AgentDepsT]] = field(init=False, default_factory=dict, repr=False, compare=False)
+
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
-        original_to_new_name_map = {v: k for k, v in self.name_map.items()}
         original_tools = await super().get_tools(ctx)
+        if original_tools is self._original_tools:
+            return self._tools
+
+        original_to_new_name_map = {v: k for k, v in self.name_map.items()}
         tools: dict[str, ToolsetTool[AgentDepsT]] = {}
         for original_name, tool in original_tools.items():
             new_name = original_to_new_name_map.get(original_name, None)
@@ -31,6 +39,9 @@ class RenamedToolset(WrapperToolset[AgentDepsT]):
                 )
             else:
                 tools[original_name] = tool
+
+        if self.has_static_tools:
+            self._original_tools, self._tools = original_tools, tools
         return tools
 
     async def call_tool(
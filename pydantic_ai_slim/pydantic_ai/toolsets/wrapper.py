@@ -27,6 +27,10 @@ class WrapperToolset(AbstractToolset[AgentDepsT]):
     def label(self) -> str:
         return f'{self.__class__.__name__}({self.wrapped.label})'
 
+    @property
+    def has_static_tools(self) -> bool:
+        return self.wrapped.has_static_tools
+
     async def __aenter__(self) -> Self:
         await self.wrapped.__aenter__()
         return self
@@ -5,11 +5,10 @@ from copy import copy
 from dataclasses import dataclass, fields
 from typing import Annotated, Any
 
-from genai_prices.data_snapshot import get_snapshot
 from pydantic import AliasChoices, BeforeValidator, Field
 from typing_extensions import deprecated, overload
 
-from . import _utils
+from . import _prices, _utils
 from .exceptions import UsageLimitExceeded
 
 __all__ = 'RequestUsage', 'RunUsage', 'Usage', 'UsageLimits'
@@ -156,9 +155,8 @@ class RequestUsage(UsageBase):
             details: Becomes the `details` field on the returned `RequestUsage` for convenience.
         """
         details = details or {}
-        for provider_id, provider_api_url in [(None, provider_url), (provider, None), (provider_fallback, None)]:
+        for provider_obj in _prices.find_usage_providers(provider, provider_url, provider_fallback):
             try:
-                provider_obj = get_snapshot().find_provider(None, provider_id, provider_api_url)
                 _model_ref, extracted_usage = provider_obj.extract_usage(data, api_flavor=api_flavor)
                 return cls(**{k: v for k, v in extracted_usage.__dict__.items() if v is not None}, details=details)
             except Exception:
@@ -11,16 +11,20 @@ from __future__ import annotations as _annotations
 
 import functools
 import inspect
+import math
+import multiprocessing
 import sys
 import time
 import traceback
 import warnings
-from collections.abc import Awaitable, Callable, Mapping, Sequence
-from contextlib import AsyncExitStack, nullcontext
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from inspect import iscoroutinefunction
 from pathlib import Path
+from queue import Queue
 from typing import TYPE_CHECKING, Any, Generic, Literal, Union, cast
 
 import anyio
@@ -45,7 +49,14 @@ from .evaluators.evaluator import EvaluatorFailure
 from .evaluators.spec import EvaluatorSpec
 from .otel import SpanTree
 from .otel._context_subtree import context_subtree
-from .reporting import EvaluationReport, ReportCase, ReportCaseAggregate, ReportCaseFailure
+from .reporting import (
+    EvaluationReport,
+    ReportCase,
+    ReportCaseAdapter,
+    ReportCaseAggregate,
+    ReportCaseFailure,
+    ReportCaseFailureAdapter,
+)
 
 if TYPE_CHECKING:
     from pydantic_ai.retries import RetryConfig
@@ -268,6 +279,8 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         *,
         task_name: str | None = None,
         metadata: dict[str, Any] | None = None,
+        checkpoint_path: Path | str | None = None,
+        processes: int | None = None,
     ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
         """Evaluates the test cases in the dataset using the given task.
 
@@ -287,16 +300,194 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             task_name: Optional override to the name of the task being executed, otherwise the name of the task
                 function will be used.
             metadata: Optional dict of experiment metadata.
+            checkpoint_path: Optional path of a JSONL file to append the result of each case to as soon as it
+                completes. If the file already exists, cases whose names are recorded in it are not run again,
+                and their recorded results are included in the report, so that an interrupted evaluation can be
+                resumed. See also [`EvaluationReport.from_checkpoint`][pydantic_evals.reporting.EvaluationReport.from_checkpoint].
+            processes: Optional number of worker processes to shard the cases across, so that CPU-bound tasks and
+                evaluators can make use of multiple cores. Each shard is evaluated with its own event loop, and
+                `max_concurrency` applies within each shard. The task and cases need to be picklable, and as worker
+                processes are started using the `spawn` method, the task's module needs to be importable by them.
+                If None, all cases are evaluated in the current process.
 
         Returns:
             A report containing the results of the evaluation.
         """
+        async with self._evaluate_cases(
+            task,
+            name,
+            max_concurrency,
+            progress,
+            retry_task,
+            retry_evaluators,
+            task_name,
+            metadata,
+            checkpoint_path,
+            processes,
+        ) as run:
+            results = dict(run.recorded_results)
+            async for index, result in run.results:
+                results[index] = result
+
+            cases: list[ReportCase] = []
+            failures: list[ReportCaseFailure] = []
+            for _, item in sorted(results.items()):
+                if isinstance(item, ReportCase):
+                    cases.append(item)
+                else:
+                    failures.append(item)
+            report = EvaluationReport(
+                name=run.name,
+                cases=cases,
+                failures=failures,
+                experiment_metadata=metadata,
+                span_id=run.span_id,
+                trace_id=run.trace_id,
+            )
+            full_experiment_metadata: dict[str, Any] = {'n_cases': len(self.cases)}
+            if metadata is not None:
+                full_experiment_metadata['metadata'] = metadata
+            if (averages := report.averages()) is not None:
+                full_experiment_metadata['averages'] = averages
+                if averages.assertions is not None:
+                    run.span.set_attribute('assertion_pass_rate', averages.assertions)
+            run.span.set_attribute('logfire.experiment.metadata', full_experiment_metadata)
+        return report
+
+    @asynccontextmanager
+    async def evaluate_iter(
+        self,
+        task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+        name: str | None = None,
+        max_concurrency: int | None = None,
+        progress: bool = True,
+        retry_task: RetryConfig | None = None,
+        retry_evaluators: RetryConfig | None = None,
+        *,
+        task_name: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        checkpoint_path: Path | str | None = None,
+        processes: int | None = None,
+    ) -> AsyncIterator[
+        AsyncIterator[ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]]
+    ]:
+        """Evaluates the test cases in the dataset using the given task, streaming the result of each case as it completes.
+
+        Unlike [`evaluate`][pydantic_evals.dataset.Dataset.evaluate], results are not collected into a report, so
+        they don't all need to be held in memory. Cases that haven't completed when the context manager exits are
+        cancelled.
+
+        Example:
+        ```python
+        from pydantic_evals import Case, Dataset
+
+        dataset = Dataset(cases=[Case(name='hello', inputs='hello'), Case(name='world', inputs='world')])
+
+
+        async def uppercase(inputs: str) -> str:
+            return inputs.upper()
+
+
+        async def main():
+            async with dataset.evaluate_iter(uppercase, progress=False) as results:
+                async for result in results:
+                    print(result.name)
+                    #> hello
+                    #> world
+        ```
+
+        Args:
+            task: The task to evaluate. This should be a callable that takes the inputs of the case
+                and returns the output.
+            name: The name of the experiment being run, this is used to identify the experiment in traces.
+                If omitted, the task_name will be used; if that is not specified, the name of the task function is used.
+            max_concurrency: The maximum number of concurrent evaluations of the task to allow.
+                If None, all cases will be evaluated concurrently.
+            progress: Whether to show a progress bar for the evaluation. Defaults to `True`.
+            retry_task: Optional retry configuration for the task execution.
+            retry_evaluators: Optional retry configuration for evaluator execution.
+            task_name: Optional override to the name of the task being executed, otherwise the name of the task
+                function will be used.
+            metadata: Optional dict of experiment metadata.
+            checkpoint_path: Optional path of a JSONL file to append the result of each case to as soon as it
+                completes. If the file already exists, cases whose names are recorded in it are not run again
+                and their results are not yielded, so that an interrupted evaluation can be resumed.
+                A report can be built from the file using
+                [`EvaluationReport.from_checkpoint`][pydantic_evals.reporting.EvaluationReport.from_checkpoint].
+            processes: Optional number of worker processes to shard the cases across, so that CPU-bound tasks and
+                evaluators can make use of multiple cores. Each shard is evaluated with its own event loop, and
+                `max_concurrency` applies within each shard. The task and cases need to be picklable, and as worker
+                processes are started using the `spawn` method, the task's module needs to be importable by them.
+                If None, all cases are evaluated in the current process.
+
+        Yields:
+            An async iterator of the [`ReportCase`][pydantic_evals.reporting.ReportCase] or
+                [`ReportCaseFailure`][pydantic_evals.reporting.ReportCaseFailure] of each case, in the order they complete.
+        """
+        async with self._evaluate_cases(
+            task,
+            name,
+            max_concurrency,
+            progress,
+            retry_task,
+            retry_evaluators,
+            task_name,
+            metadata,
+            checkpoint_path,
+            processes,
+        ) as run:
+            full_experiment_metadata: dict[str, Any] = {'n_cases': len(self.cases)}
+            if metadata is not None:
+                full_experiment_metadata['metadata'] = metadata
+            run.span.set_attribute('logfire.experiment.metadata', full_experiment_metadata)
+
+            yield (result async for _, result in run.results)
+
+    @asynccontextmanager
+    async def _evaluate_cases(
+        self,
+        task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+        name: str | None,
+        max_concurrency: int | None,
+        progress: bool,
+        retry_task: RetryConfig | None,
+        retry_evaluators: RetryConfig | None,
+        task_name: str | None,
+        metadata: dict[str, Any] | None,
+        checkpoint_path: Path | str | None,
+        processes: int | None,
+    ) -> AsyncIterator[_EvaluationRun[InputsT, OutputT, MetadataT]]:
+        """Run the cases in the background, streaming their results along with their index in the dataset."""
+        if processes is not None and processes < 1:
+            raise ValueError(f'`processes` must be at least 1, got {processes}.')
+
         task_name = task_name or get_unwrapped_function_name(task)
         name = name or task_name
-        total_cases = len(self.cases)
-        progress_bar = Progress() if progress else None
+        report_case_names = [case.name or f'Case {i}' for i, case in enumerate(self.cases, 1)]
+
+        checkpoint: _Checkpoint | None = None
+        if checkpoint_path is not None:
+            inputs_type, output_type, metadata_type = type(self)._params()
+            checkpoint = _Checkpoint(
+                Path(checkpoint_path),
+                TypeAdapter(
+                    ReportCase[inputs_type, output_type, metadata_type]
+                    | ReportCaseFailure[inputs_type, output_type, metadata_type]
+                ),
+            )
+        recorded_results: dict[int, ReportCase | ReportCaseFailure] = {}
+        if checkpoint is not None:
+            recorded_by_name = {result.name: result for result in checkpoint.load()}
+            for index, report_case_name in enumerate(report_case_names):
+                if (result := recorded_by_name.get(report_case_name)) is not None:
+                    recorded_results[index] = result
+        pending_cases = [
+            (index, report_case_names[index], case)
+            for index, case in enumerate(self.cases)
+            if index not in recorded_results
+        ]
 
-        limiter = anyio.Semaphore(max_concurrency) if max_concurrency is not None else AsyncExitStack()
+        progress_bar = Progress() if progress else None
 
         extra_attributes: dict[str, Any] = {'gen_ai.operation.name': 'experiment'}
         if metadata is not None:
@@ -312,16 +503,54 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             ) as eval_span,
             progress_bar or nullcontext(),
         ):
-            task_id = progress_bar.add_task(f'Evaluating {task_name}', total=total_cases) if progress_bar else None
+            task_id = (
+                progress_bar.add_task(f'Evaluating {task_name}', total=len(self.cases), completed=len(recorded_results))
+                if progress_bar
+                else None
+            )
 
-            async def _handle_case(case: Case[InputsT, OutputT, MetadataT], report_case_name: str):
-                async with limiter:
-                    result = await _run_task_and_evaluators(
-                        task, case, report_case_name, self.evaluators, retry_task, retry_evaluators
-                    )
-                    if progress_bar and task_id is not None:  # pragma: no branch
-                        progress_bar.update(task_id, advance=1)
-                    return result
+            send_stream, receive_stream = anyio.create_memory_object_stream[
+                tuple[int, ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]]
+            ]()
+
+            async def _handle_result(
+                index: int,
+                result: ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT],
+            ):
+                if checkpoint is not None:
+                    checkpoint.record(result)
+                if progress_bar and task_id is not None:  # pragma: no branch
+                    progress_bar.update(task_id, advance=1)
+                await send_stream.send((index, result))
+
+            async def _handle_cases():
+                async with send_stream:
+                    if processes is None:
+                        await _run_cases(
+                            task,
+                            pending_cases,
+                            self.evaluators,
+                            retry_task,
+                            retry_evaluators,
+                            max_concurrency,
+                            _handle_result,
+                        )
+                    else:
+                        await _run_sharded_cases(
+                            task,
+                            pending_cases,
+                            self.evaluators,
+                            retry_task,
+                            retry_evaluators,
+                            max_concurrency,
+                            processes,
+                            _handle_result,
+                        )
+
+            async def _iter_results():
+                async with receive_stream:
+                    async for item in receive_stream:
+                        yield item
 
             if (context := eval_span.context) is None:  # pragma: no cover
                 trace_id = None
@@ -329,36 +558,22 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             else:
                 trace_id = f'{context.trace_id:032x}'
                 span_id = f'{context.span_id:016x}'
-            cases_and_failures = await task_group_gather(
-                [
-                    lambda case=case, i=i: _handle_case(case, case.name or f'Case {i}')
-                    for i, case in enumerate(self.cases, 1)
-                ]
-            )
-            cases: list[ReportCase] = []
-            failures: list[ReportCaseFailure] = []
-            for item in cases_and_failures:
-                if isinstance(item, ReportCase):
-                    cases.append(item)
-                else:
-                    failures.append(item)
-            report = EvaluationReport(
-                name=name,
-                cases=cases,
-                failures=failures,
-                experiment_metadata=metadata,
-                span_id=span_id,
-                trace_id=trace_id,
-            )
-            full_experiment_metadata: dict[str, Any] = {'n_cases': len(self.cases)}
-            if metadata is not None:
-                full_experiment_metadata['metadata'] = metadata
-            if (averages := report.averages()) is not None:
-                full_experiment_metadata['averages'] = averages
-                if averages.assertions is not None:
-                    eval_span.set_attribute('assertion_pass_rate', averages.assertions)
-            eval_span.set_attribute('logfire.experiment.metadata', full_experiment_metadata)
-        return report
+
+            # The cases are run in a separate task so that results can be consumed while the rest are still running,
+            # and any error that stops them from running is raised when the context manager exits
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(_handle_cases)
+                try:
+                    yield _EvaluationRun(
+                        span=eval_span,
+                        name=name,
+                        trace_id=trace_id,
+                        span_id=span_id,
+                        recorded_results=recorded_results,
+                        results=_iter_results(),
+                    )
+                finally:
+                    tg.cancel_scope.cancel()
 
     def evaluate_sync(
         self,
@@ -371,6 +586,8 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
         *,
         task_name: str | None = None,
         metadata: dict[str, Any] | None = None,
+        checkpoint_path: Path | str | None = None,
+        processes: int | None = None,
     ) -> EvaluationReport[InputsT, OutputT, MetadataT]:
         """Evaluates the test cases in the dataset using the given task.
 
@@ -389,6 +606,14 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
             task_name: Optional override to the name of the task being executed, otherwise the name of the task
                 function will be used.
             metadata: Optional dict of experiment metadata.
+            checkpoint_path: Optional path of a JSONL file to append the result of each case to as soon as it
+                completes. If the file already exists, cases whose names are recorded in it are not run again,
+                and their recorded results are included in the report.
+            processes: Optional number of worker processes to shard the cases across, so that CPU-bound tasks and
+                evaluators can make use of multiple cores. Each shard is evaluated with its own event loop, and
+                `max_concurrency` applies within each shard. The task and cases need to be picklable, and as worker
+                processes are started using the `spawn` method, the task's module needs to be importable by them.
+                If None, all cases are evaluated in the current process.
 
         Returns:
             A report containing the results of the evaluation.
@@ -403,6 +628,8 @@ class Dataset(BaseModel, Generic[InputsT, OutputT, MetadataT], extra='forbid', a
                 retry_evaluators=retry_evaluators,
                 task_name=task_name,
                 metadata=metadata,
+                checkpoint_path=checkpoint_path,
+                processes=processes,
             )
         )
 
@@ -894,6 +1121,175 @@ class _TaskRun:
         self.attributes[name] = value
 
 
+_SHARDS_PER_PROCESS = 4
+"""The number of shards to split the cases into per worker process, so that work is balanced between processes."""
+
+
+async def _run_cases(
+    task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+    cases: list[tuple[int, str, Case[InputsT, OutputT, MetadataT]]],
+    dataset_evaluators: list[Evaluator[InputsT, OutputT, MetadataT]],
+    retry_task: RetryConfig | None,
+    retry_evaluators: RetryConfig | None,
+    max_concurrency: int | None,
+    handle_result: Callable[
+        [int, ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]], Awaitable[None]
+    ],
+) -> None:
+    """Run the cases concurrently, passing the result of each to `handle_result` along with the index of its case."""
+    limiter = anyio.Semaphore(max_concurrency) if max_concurrency is not None else AsyncExitStack()
+
+    async def _handle_case(index: int, report_case_name: str, case: Case[InputsT, OutputT, MetadataT]):
+        async with limiter:
+            result = await _run_task_and_evaluators(
+                task, case, report_case_name, dataset_evaluators, retry_task, retry_evaluators
+            )
+        await handle_result(index, result)
+
+    await task_group_gather(
+        [
+            lambda index=index, report_case_name=report_case_name, case=case: _handle_case(
+                index, report_case_name, case
+            )
+            for index, report_case_name, case in cases
+        ]
+    )
+
+
+async def _run_sharded_cases(
+    task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+    cases: list[tuple[int, str, Case[InputsT, OutputT, MetadataT]]],
+    dataset_evaluators: list[Evaluator[InputsT, OutputT, MetadataT]],
+    retry_task: RetryConfig | None,
+    retry_evaluators: RetryConfig | None,
+    max_concurrency: int | None,
+    processes: int,
+    handle_result: Callable[
+        [int, ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]], Awaitable[None]
+    ],
+) -> None:
+    """Shard the cases across worker processes, passing the result of each case to `handle_result` as it completes."""
+    shard_count = processes * _SHARDS_PER_PROCESS
+    shard_size = max(1, math.ceil(len(cases) / shard_count))
+    shards = [cases[i : i + shard_size] for i in range(0, len(cases), shard_size)]
+    # Each shard is waited on in its own thread, so they shouldn't be limited by the default thread limiter
+    limiter = anyio.CapacityLimiter(max(1, len(shards)))
+    context = multiprocessing.get_context('spawn')
+
+    # Workers send the result of each case back as soon as it completes rather than when their shard completes,
+    # so that they can be checkpointed
+    with context.Manager() as manager:
+        results: Queue[
+            tuple[int, ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]] | None
+        ] = manager.Queue()
+        executor = ProcessPoolExecutor(max_workers=processes, mp_context=context)
+        try:
+            futures = [
+                executor.submit(
+                    _evaluate_shard,
+                    task,
+                    shard,
+                    dataset_evaluators,
+                    retry_task,
+                    retry_evaluators,
+                    max_concurrency,
+                    results,
+                )
+                for shard in shards
+            ]
+
+            async def _wait_for_shards():
+                await task_group_gather(
+                    [
+                        lambda future=future: to_thread.run_sync(future.result, abandon_on_cancel=True, limiter=limiter)
+                        for future in futures
+                    ]
+                )
+                # Workers have put all their results on the queue by the time their shard completes
+                results.put(None)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(_wait_for_shards)
+                while (item := await to_thread.run_sync(results.get, abandon_on_cancel=True)) is not None:
+                    await handle_result(*item)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            executor.shutdown()
+
+
+def _evaluate_shard(
+    task: Callable[[InputsT], Awaitable[OutputT]] | Callable[[InputsT], OutputT],
+    shard: list[tuple[int, str, Case[InputsT, OutputT, MetadataT]]],
+    dataset_evaluators: list[Evaluator[InputsT, OutputT, MetadataT]],
+    retry_task: RetryConfig | None,
+    retry_evaluators: RetryConfig | None,
+    max_concurrency: int | None,
+    results: Queue[
+        tuple[int, ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]] | None
+    ],
+) -> None:
+    """Evaluate a shard of cases in a worker process, putting each result on the queue along with the index of its case."""
+
+    async def _handle_result(
+        index: int, result: ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]
+    ):
+        results.put((index, result))
+
+    anyio.run(
+        _run_cases, task, shard, dataset_evaluators, retry_task, retry_evaluators, max_concurrency, _handle_result
+    )
+
+
+@dataclass
+class _EvaluationRun(Generic[InputsT, OutputT, MetadataT]):
+    """The state of an evaluation whose cases are running in the background."""
+
+    span: logfire_api.LogfireSpan
+    name: str
+    trace_id: str | None
+    span_id: str | None
+    recorded_results: dict[
+        int, ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]
+    ]
+    """Results loaded from the checkpoint file, by the index of their case in the dataset."""
+    results: AsyncIterator[
+        tuple[int, ReportCase[InputsT, OutputT, MetadataT] | ReportCaseFailure[InputsT, OutputT, MetadataT]]
+    ]
+    """Results of the cases that were run, along with the index of their case in the dataset, in the order they complete."""
+
+
+@dataclass
+class _Checkpoint:
+    """A JSONL file that the result of each case is appended to as soon as it completes."""
+
+    path: Path
+    result_adapter: TypeAdapter[ReportCase | ReportCaseFailure]
+
+    def load(self) -> list[ReportCase | ReportCaseFailure]:
+        """Load the recorded results, removing any partially written result left behind by an interrupted run."""
+        if not self.path.exists():
+            return []
+
+        with self.path.open('rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+
+        return [self.result_adapter.validate_json(line) for line in data.split(b'\n')[:-1] if line]
+
+    def record(self, result: ReportCase | ReportCaseFailure) -> None:
+        if isinstance(result, ReportCase):
+            data = ReportCaseAdapter.dump_json(result)
+        else:
+            data = ReportCaseFailureAdapter.dump_json(result)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open('ab') as f:
+            f.write(data + b'\n')
+
+
 async def _run_task(
     task: Callable[[InputsT], Awaitable[OutputT] | OutputT],
     case: Case[InputsT, OutputT, MetadataT],
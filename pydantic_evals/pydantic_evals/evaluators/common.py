@@ -12,6 +12,7 @@ from pydantic_ai.settings import ModelSettings
 from ..otel.span_tree import SpanQuery
 from .context import EvaluatorContext
 from .evaluator import EvaluationReason, EvaluationScalar, Evaluator, EvaluatorOutput
+from .llm_as_a_judge import JudgeCache
 
 __all__ = (
     'Equals',
@@ -188,6 +189,10 @@ class LLMJudge(Evaluator[object, object, object]):
 
     If you do not specify a model, it uses the default model for judging. This starts as 'openai:gpt-4o', but can be
     overridden by calling [`set_default_judge_model`][pydantic_evals.evaluators.llm_as_a_judge.set_default_judge_model].
+
+    If you specify a [`JudgeCache`][pydantic_evals.evaluators.llm_as_a_judge.JudgeCache], grading outputs are reused
+    from it rather than calling the judge model again. Otherwise, the default cache set by calling
+    [`set_default_judge_cache`][pydantic_evals.evaluators.llm_as_a_judge.set_default_judge_cache] is used, if any.
     """
 
     rubric: str
@@ -197,6 +202,7 @@ class LLMJudge(Evaluator[object, object, object]):
     model_settings: ModelSettings | None = None
     score: OutputConfig | Literal[False] = False
     assertion: OutputConfig | Literal[False] = field(default_factory=lambda: OutputConfig(include_reason=True))
+    cache: JudgeCache | None = None
 
     async def evaluate(
         self,
@@ -207,25 +213,33 @@ class LLMJudge(Evaluator[object, object, object]):
                 from .llm_as_a_judge import judge_input_output_expected
 
                 grading_output = await judge_input_output_expected(
-                    ctx.inputs, ctx.output, ctx.expected_output, self.rubric, self.model, self.model_settings
+                    ctx.inputs,
+                    ctx.output,
+                    ctx.expected_output,
+                    self.rubric,
+                    self.model,
+                    self.model_settings,
+                    self.cache,
                 )
             else:
                 from .llm_as_a_judge import judge_input_output
 
                 grading_output = await judge_input_output(
-                    ctx.inputs, ctx.output, self.rubric, self.model, self.model_settings
+                    ctx.inputs, ctx.output, self.rubric, self.model, self.model_settings, self.cache
                 )
         else:
             if self.include_expected_output:
                 from .llm_as_a_judge import judge_output_expected
 
                 grading_output = await judge_output_expected(
-                    ctx.output, ctx.expected_output, self.rubric, self.model, self.model_settings
+                    ctx.output, ctx.expected_output, self.rubric, self.model, self.model_settings, self.cache
                 )
             else:
                 from .llm_as_a_judge import judge_output
 
-                grading_output = await judge_output(ctx.output, self.rubric, self.model, self.model_settings)
+                grading_output = await judge_output(
+                    ctx.output, self.rubric, self.model, self.model_settings, self.cache
+                )
 
         output: dict[str, EvaluationScalar | EvaluationReason] = {}
         include_both = self.score is not False and self.assertion is not False
@@ -250,6 +264,9 @@ class LLMJudge(Evaluator[object, object, object]):
         # Note: this may lead to confusion if you try to serialize-then-deserialize with a custom model.
         # I expect that is rare enough to be worth not solving yet, but common enough that we probably will want to
         # solve it eventually. I'm imagining some kind of model registry, but don't want to work out the details yet.
+
+        # the cache doesn't change the evaluator's results, and its path is specific to the machine it's used on
+        result.pop('cache', None)
         return result
 
 
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import sqlite3
 from collections.abc import Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
+from anyio import to_thread
 from pydantic import BaseModel, Field
 from pydantic_core import to_json
 
@@ -12,15 +18,18 @@ from pydantic_ai.settings import ModelSettings
 
 __all__ = (
     'GradingOutput',
+    'JudgeCache',
     'judge_input_output',
     'judge_input_output_expected',
     'judge_output',
     'judge_output_expected',
+    'set_default_judge_cache',
     'set_default_judge_model',
 )
 
 
 _default_model: models.Model | models.KnownModelName = 'openai:gpt-4o'
+_default_cache: JudgeCache | None = None
 
 
 class GradingOutput(BaseModel, populate_by_name=True):
@@ -31,6 +40,91 @@ class GradingOutput(BaseModel, populate_by_name=True):
     score: float
 
 
+@dataclass
+class JudgeCache:
+    """A persistent cache of grading outputs, stored in a SQLite database.
+
+    Grading outputs are cached by judge, rubric, model, model settings and a hash of the full prompt, so that
+    re-running an experiment only calls the judge model for outputs that haven't been judged before.
+    """
+
+    path: Path | str
+    """The path of the SQLite database file, which will be created if it doesn't exist."""
+    refresh: bool = False
+    """Whether to ignore cached grading outputs and call the judge model again, replacing the cached outputs."""
+
+    async def get(self, key: str) -> GradingOutput | None:
+        """Get the cached grading output for a key, or `None` if there is none or `refresh` is set."""
+        if self.refresh:
+            return None
+        return await to_thread.run_sync(self._get_sync, key)
+
+    async def set(self, key: str, grading_output: GradingOutput) -> None:
+        """Cache a grading output for a key."""
+        await to_thread.run_sync(self._set_sync, key, grading_output)
+
+    def _connect(self) -> sqlite3.Connection:
+        # The cache may be shared by concurrent evaluations and worker processes, so we use WAL mode, which lets
+        # readers and a writer access the database at the same time, and wait for locks instead of failing.
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('CREATE TABLE IF NOT EXISTS grading_outputs (key TEXT PRIMARY KEY, output TEXT NOT NULL)')
+        return connection
+
+    def _get_sync(self, key: str) -> GradingOutput | None:
+        with closing(self._connect()) as connection:
+            row = connection.execute('SELECT output FROM grading_outputs WHERE key = ?', (key,)).fetchone()
+        return None if row is None else GradingOutput.model_validate_json(row[0])
+
+    def _set_sync(self, key: str, grading_output: GradingOutput) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO grading_outputs (key, output) VALUES (?, ?)',
+                (key, grading_output.model_dump_json(by_alias=True)),
+            )
+
+
+def _cache_key(
+    agent: Agent[None, GradingOutput],
+    user_prompt: str | Sequence[str | UserContent],
+    rubric: str,
+    model: models.Model | models.KnownModelName | str,
+    model_settings: ModelSettings | None,
+) -> str:
+    model_name = f'{model.system}:{model.model_name}' if isinstance(model, models.Model) else model
+    prompt_hash = hashlib.sha256(to_json(user_prompt, bytes_mode='base64', fallback=repr)).hexdigest()
+    key_data = {
+        'judge': agent.name,
+        'rubric': rubric,
+        'model': model_name,
+        'model_settings': model_settings,
+        'prompt_hash': prompt_hash,
+    }
+    return hashlib.sha256(to_json(key_data, fallback=repr)).hexdigest()
+
+
+async def _judge(
+    agent: Agent[None, GradingOutput],
+    user_prompt: str | Sequence[str | UserContent],
+    rubric: str,
+    model: models.Model | models.KnownModelName | str | None,
+    model_settings: ModelSettings | None,
+    cache: JudgeCache | None,
+) -> GradingOutput:
+    model = model or _default_model
+    cache = cache or _default_cache
+    if cache is None:
+        return (await agent.run(user_prompt, model=model, model_settings=model_settings)).output
+
+    key = _cache_key(agent, user_prompt, rubric, model, model_settings)
+    if (grading_output := await cache.get(key)) is not None:
+        return grading_output
+
+    grading_output = (await agent.run(user_prompt, model=model, model_settings=model_settings)).output
+    await cache.set(key, grading_output)
+    return grading_output
+
+
 _judge_output_agent = Agent(
     name='judge_output',
     system_prompt=dedent(
@@ -57,16 +151,17 @@ async def judge_output(
     rubric: str,
     model: models.Model | models.KnownModelName | str | None = None,
     model_settings: ModelSettings | None = None,
+    cache: JudgeCache | None = None,
 ) -> GradingOutput:
     """Judge the output of a model based on a rubric.
 
     If the model is not specified, a default model is used. The default model starts as 'openai:gpt-4o',
     but this can be changed using the `set_default_judge_model` function.
+
+    If a cache is not specified, the default cache set using the `set_default_judge_cache` function is used, if any.
     """
     user_prompt = _build_prompt(output=output, rubric=rubric)
-    return (
-        await _judge_output_agent.run(user_prompt, model=model or _default_model, model_settings=model_settings)
-    ).output
+    return await _judge(_judge_output_agent, user_prompt, rubric, model, model_settings, cache)
 
 
 _judge_input_output_agent = Agent(
@@ -98,17 +193,18 @@ async def judge_input_output(
     rubric: str,
     model: models.Model | models.KnownModelName | str | None = None,
     model_settings: ModelSettings | None = None,
+    cache: JudgeCache | None = None,
 ) -> GradingOutput:
     """Judge the output of a model based on the inputs and a rubric.
 
     If the model is not specified, a default model is used. The default model starts as 'openai:gpt-4o',
     but this can be changed using the `set_default_judge_model` function.
+
+    If a cache is not specified, the default cache set using the `set_default_judge_cache` function is used, if any.
     """
     user_prompt = _build_prompt(inputs=inputs, output=output, rubric=rubric)
 
-    return (
-        await _judge_input_output_agent.run(user_prompt, model=model or _default_model, model_settings=model_settings)
-    ).output
+    return await _judge(_judge_input_output_agent, user_prompt, rubric, model, model_settings, cache)
 
 
 _judge_input_output_expected_agent = Agent(
@@ -143,19 +239,18 @@ async def judge_input_output_expected(
     rubric: str,
     model: models.Model | models.KnownModelName | str | None = None,
     model_settings: ModelSettings | None = None,
+    cache: JudgeCache | None = None,
 ) -> GradingOutput:
     """Judge the output of a model based on the inputs and a rubric.
 
     If the model is not specified, a default model is used. The default model starts as 'openai:gpt-4o',
     but this can be changed using the `set_default_judge_model` function.
+
+    If a cache is not specified, the default cache set using the `set_default_judge_cache` function is used, if any.
     """
     user_prompt = _build_prompt(inputs=inputs, output=output, rubric=rubric, expected_output=expected_output)
 
-    return (
-        await _judge_input_output_expected_agent.run(
-            user_prompt, model=model or _default_model, model_settings=model_settings
-        )
-    ).output
+    return await _judge(_judge_input_output_expected_agent, user_prompt, rubric, model, model_settings, cache)
 
 
 _judge_output_expected_agent = Agent(
@@ -187,18 +282,17 @@ async def judge_output_expected(
     rubric: str,
     model: models.Model | models.KnownModelName | str | None = None,
     model_settings: ModelSettings | None = None,
+    cache: JudgeCache | None = None,
 ) -> GradingOutput:
     """Judge the output of a model based on the expected output, output, and a rubric.
 
     If the model is not specified, a default model is used. The default model starts as 'openai:gpt-4o',
     but this can be changed using the `set_default_judge_model` function.
+
+    If a cache is not specified, the default cache set using the `set_default_judge_cache` function is used, if any.
     """
     user_prompt = _build_prompt(output=output, rubric=rubric, expected_output=expected_output)
-    return (
-        await _judge_output_expected_agent.run(
-            user_prompt, model=model or _default_model, model_settings=model_settings
-        )
-    ).output
+    return await _judge(_judge_output_expected_agent, user_prompt, rubric, model, model_settings, cache)
 
 
 def set_default_judge_model(model: models.Model | models.KnownModelName) -> None:
@@ -210,6 +304,18 @@ def set_default_judge_model(model: models.Model | models.KnownModelName) -> None
     _default_model = model
 
 
+def set_default_judge_cache(cache: JudgeCache | None) -> None:
+    """Set the default cache used for judging, or `None` to not cache grading outputs.
+
+    This cache is used by [`LLMJudge`][pydantic_evals.evaluators.LLMJudge] evaluators that don't specify a `cache`,
+    and if `None` is passed to the `cache` argument of the `judge_*` functions. It's only set for the current
+    process, so it isn't used by the worker processes of `Dataset.evaluate(processes=...)`; pass the cache to
+    `LLMJudge` instead.
+    """
+    global _default_cache
+    _default_cache = cache
+
+
 def _stringify(value: Any) -> str:
     if isinstance(value, str):
         return value
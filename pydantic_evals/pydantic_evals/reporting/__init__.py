@@ -4,6 +4,7 @@ from collections import defaultdict
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from io import StringIO
+from pathlib import Path
 from typing import Any, Generic, Literal, Protocol, cast
 
 from pydantic import BaseModel, TypeAdapter
@@ -207,6 +208,43 @@ class EvaluationReport(Generic[InputsT, OutputT, MetadataT]):
     span_id: str | None = None
     """The span ID of the evaluation."""
 
+    @classmethod
+    def from_checkpoint(
+        cls,
+        path: Path | str,
+        *,
+        name: str,
+        experiment_metadata: dict[str, Any] | None = None,
+    ) -> EvaluationReport[Any, Any, Any]:
+        """Build a report from the results recorded in a checkpoint file.
+
+        See the `checkpoint_path` argument of [`Dataset.evaluate`][pydantic_evals.dataset.Dataset.evaluate] for
+        how checkpoint files are written.
+
+        Args:
+            path: The path of the checkpoint file, in which each line is a JSON-serialized
+                [`ReportCase`][pydantic_evals.reporting.ReportCase] or
+                [`ReportCaseFailure`][pydantic_evals.reporting.ReportCaseFailure].
+            name: The name of the report.
+            experiment_metadata: Optional metadata associated with the experiment.
+
+        Returns:
+            A report containing the recorded cases and failures, in the order they were recorded.
+        """
+        cases: list[ReportCase[Any, Any, Any]] = []
+        failures: list[ReportCaseFailure[Any, Any, Any]] = []
+        # A last line without a trailing newline was only partially written before the run was interrupted
+        lines = Path(path).read_bytes().split(b'\n')[:-1]
+        for line in lines:
+            if not line:
+                continue
+            result = _REPORT_CASE_OR_FAILURE_ADAPTER.validate_json(line)
+            if isinstance(result, ReportCase):
+                cases.append(result)
+            else:
+                failures.append(result)
+        return EvaluationReport(name=name, cases=cases, failures=failures, experiment_metadata=experiment_metadata)
+
     def averages(self) -> ReportCaseAggregate | None:
         if self.cases:
             return ReportCaseAggregate.average(self.cases)
@@ -509,6 +547,8 @@ class EvaluationReport(Generic[InputsT, OutputT, MetadataT]):
 
 EvaluationReportAdapter = TypeAdapter(EvaluationReport[Any, Any, Any])
 
+_REPORT_CASE_OR_FAILURE_ADAPTER = TypeAdapter(ReportCase[Any, Any, Any] | ReportCaseFailure[Any, Any, Any])
+
 
 class RenderValueConfig(TypedDict, total=False):
     """A configuration for rendering a values in an Evaluation report."""
@@ -237,6 +237,7 @@ class DecisionBranchBuilder(Generic[StateT, DepsT, OutputT, SourceT, HandledT]):
         *,
         fork_id: str | None = None,
         downstream_join_id: str | None = None,
+        max_concurrency: int | None = None,
     ) -> DecisionBranchBuilder[StateT, DepsT, T, SourceT, HandledT]:
         """Spread the branch's output.
 
@@ -246,6 +247,8 @@ class DecisionBranchBuilder(Generic[StateT, DepsT, OutputT, SourceT, HandledT]):
         Args:
             fork_id: Optional ID for the fork, defaults to a generated value
             downstream_join_id: Optional ID of a downstream join node which is involved when mapping empty iterables
+            max_concurrency: Optional maximum number of items to process at once, defaults to the graph's
+                `max_map_concurrency`
 
         Returns:
             A new DecisionBranchBuilder where mapping is performed prior to generating the final output.
@@ -254,7 +257,9 @@ class DecisionBranchBuilder(Generic[StateT, DepsT, OutputT, SourceT, HandledT]):
             decision=self._decision,
             source=self._source,
             matches=self._matches,
-            path_builder=self._path_builder.map(fork_id=fork_id, downstream_join_id=downstream_join_id),
+            path_builder=self._path_builder.map(
+                fork_id=fork_id, downstream_join_id=downstream_join_id, max_concurrency=max_concurrency
+            ),
         )
 
     def label(self, label: str) -> DecisionBranchBuilder[StateT, DepsT, OutputT, SourceT, HandledT]:
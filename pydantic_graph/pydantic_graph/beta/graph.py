@@ -13,7 +13,7 @@ from contextlib import AbstractContextManager, AsyncExitStack, ExitStack, asyncc
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeGuard, cast, get_args, get_origin, overload
 
-from anyio import BrokenResourceError, CancelScope, create_memory_object_stream, create_task_group
+from anyio import BrokenResourceError, CancelScope, Semaphore, create_memory_object_stream, create_task_group
 from anyio.abc import TaskGroup
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from typing_extensions import TypeVar, assert_never
@@ -540,6 +540,30 @@ class _GraphTaskResult:
     source_is_finished: bool = True
 
 
+@dataclass
+class _BoundedMapRun:
+    """Tracks the items of a run of a map fork with `max_concurrency` that are currently being processed."""
+
+    slots: Semaphore
+    """One slot per item that may be processed at once, acquired before an item is pulled from the iterable."""
+    active_task_counts: dict[int, int] = field(default_factory=dict[int, int])
+    """The number of active tasks for each item being processed, by thread index."""
+    exhausted: bool = False
+    """Whether all items have been pulled from the iterable, or the map has been cancelled."""
+    cancelled: bool = False
+    """Whether the remaining items should be skipped, because the downstream join cancelled its sibling tasks."""
+
+    def task_started(self, thread_index: int) -> None:
+        self.active_task_counts[thread_index] = self.active_task_counts.get(thread_index, 0) + 1
+
+    def task_finished(self, thread_index: int) -> None:
+        self.active_task_counts[thread_index] -= 1
+        if not self.active_task_counts[thread_index]:
+            # The item's branch has completed, so the next item can be pulled
+            del self.active_task_counts[thread_index]
+            self.slots.release()
+
+
 @dataclass
 class _GraphIterator(Generic[StateT, DepsT, OutputT]):
     graph: Graph[StateT, DepsT, Any, OutputT]
@@ -551,14 +575,25 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
 
     cancel_scopes: dict[TaskID, CancelScope] = field(init=False)
     active_tasks: dict[TaskID, GraphTask] = field(init=False)
+    active_tasks_by_fork_run: dict[NodeRunID, dict[TaskID, GraphTask]] = field(init=False)
+    """Active tasks indexed by each fork run in their fork stack, so siblings can be found without scanning all tasks."""
+    active_node_counts_by_fork_run: dict[NodeRunID, dict[NodeID, int]] = field(init=False)
+    """The number of active tasks at each node within each fork run, used to detect when a fork run has completed."""
     active_reducers: dict[tuple[JoinID, NodeRunID], JoinState] = field(init=False)
+    bounded_map_runs: dict[NodeRunID, _BoundedMapRun] = field(init=False)
+    """Runs of map forks with `max_concurrency` that are still pulling items or have items being processed."""
+    join_ids: list[JoinID] = field(init=False)
     iter_stream_sender: MemoryObjectSendStream[_GraphTaskResult] = field(init=False)
     iter_stream_receiver: MemoryObjectReceiveStream[_GraphTaskResult] = field(init=False)
 
     def __post_init__(self):
         self.cancel_scopes = {}
         self.active_tasks = {}
+        self.active_tasks_by_fork_run = {}
+        self.active_node_counts_by_fork_run = {}
         self.active_reducers = {}
+        self.bounded_map_runs = {}
+        self.join_ids = [JoinID(node_id) for node_id, node in self.graph.nodes.items() if isinstance(node, Join)]
         self.iter_stream_sender, self.iter_stream_receiver = create_memory_object_stream[_GraphTaskResult]()
         self._next_node_run_id = 1
 
@@ -568,7 +603,6 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
         async with self.iter_stream_sender:
             try:
                 # Fire off the first task
-                self.active_tasks[first_task.task_id] = first_task
                 self._handle_execution_request([first_task])
 
                 # Handle task results
@@ -619,14 +653,11 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                                     await self._cancel_sibling_tasks(parent_fork_id, fork_run_id)
                             else:
                                 for new_task in maybe_overridden_result:
-                                    self.active_tasks[new_task.task_id] = new_task
+                                    self._add_active_task(new_task)
 
-                            tasks_by_id_values = list(self.active_tasks.values())
                             join_tasks: list[GraphTask] = []
 
-                            for join_id, fork_run_id in self._get_completed_fork_runs(
-                                task_result.source, tasks_by_id_values
-                            ):
+                            for join_id, fork_run_id in self._get_completed_fork_runs(task_result.source):
                                 join_state = self.active_reducers.pop((join_id, fork_run_id))
                                 join_node = self.graph.nodes[join_id]
                                 assert isinstance(join_node, Join), f'Expected a `Join` but got {join_node}'
@@ -635,8 +666,6 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                                 )
                                 join_tasks.extend(new_tasks)
                             if join_tasks:
-                                for new_task in join_tasks:
-                                    self.active_tasks[new_task.task_id] = new_task
                                 self._handle_execution_request(join_tasks)
 
                             if isinstance(maybe_overridden_result, Sequence):
@@ -715,7 +744,7 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                                     self.task_group.cancel_scope.cancel()
                                     return
                                 for new_task in maybe_overridden_result:
-                                    self.active_tasks[new_task.task_id] = new_task
+                                    self._add_active_task(new_task)
                                 new_task_ids = {t.task_id for t in maybe_overridden_result}
                                 for t in new_tasks:
                                     # Same note as above about how this is theoretically reachable but we should
@@ -736,11 +765,49 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
         scope = self.cancel_scopes.pop(task_id, None)
         if scope is not None:
             scope.cancel()
-        self.active_tasks.pop(task_id, None)
+        self._remove_active_task(task_id)
+
+    def _add_active_task(self, task: GraphTask) -> None:
+        existing = self.active_tasks.get(task.task_id)
+        if existing is task:
+            return
+        if existing is not None:  # pragma: no cover
+            self._remove_active_task(task.task_id)
+
+        self.active_tasks[task.task_id] = task
+        for item in task.fork_stack:
+            self.active_tasks_by_fork_run.setdefault(item.node_run_id, {})[task.task_id] = task
+            node_counts = self.active_node_counts_by_fork_run.setdefault(item.node_run_id, {})
+            node_counts[task.node_id] = node_counts.get(task.node_id, 0) + 1
+            if (bounded_map_run := self.bounded_map_runs.get(item.node_run_id)) is not None:
+                bounded_map_run.task_started(item.thread_index)
+
+    def _remove_active_task(self, task_id: TaskID) -> None:
+        task = self.active_tasks.pop(task_id, None)
+        if task is None:
+            return
+
+        for item in task.fork_stack:
+            fork_run_tasks = self.active_tasks_by_fork_run[item.node_run_id]
+            del fork_run_tasks[task_id]
+            if not fork_run_tasks:
+                del self.active_tasks_by_fork_run[item.node_run_id]
+
+            node_counts = self.active_node_counts_by_fork_run[item.node_run_id]
+            node_counts[task.node_id] -= 1
+            if not node_counts[task.node_id]:
+                del node_counts[task.node_id]
+                if not node_counts:
+                    del self.active_node_counts_by_fork_run[item.node_run_id]
+
+            if (bounded_map_run := self.bounded_map_runs.get(item.node_run_id)) is not None:
+                bounded_map_run.task_finished(item.thread_index)
+                if bounded_map_run.exhausted and not bounded_map_run.active_task_counts:
+                    del self.bounded_map_runs[item.node_run_id]
 
     def _handle_execution_request(self, request: Sequence[GraphTask]) -> None:
         for new_task in request:
-            self.active_tasks[new_task.task_id] = new_task
+            self._add_active_task(new_task)
         for new_task in request:
             self.task_group.start_soon(self._run_tracked_task, new_task)
 
@@ -835,23 +902,22 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
         else:
             assert_never(next_node)
 
-    def _get_completed_fork_runs(
-        self,
-        t: GraphTask,
-        active_tasks: Iterable[GraphTask],
-    ) -> list[tuple[JoinID, NodeRunID]]:
+    def _get_completed_fork_runs(self, t: GraphTask) -> list[tuple[JoinID, NodeRunID]]:
         completed_fork_runs: list[tuple[JoinID, NodeRunID]] = []
 
-        fork_run_indices = {fsi.node_run_id: i for i, fsi in enumerate(t.fork_stack)}
-        for join_id, fork_run_id in self.active_reducers.keys():
-            fork_run_index = fork_run_indices.get(fork_run_id)
-            if fork_run_index is None:
-                continue  # The fork_run_id is not in the current task's fork stack, so this task didn't complete it.
-
-            # This reducer _may_ now be ready to finalize:
-            if self._is_fork_run_completed(active_tasks, join_id, fork_run_id):
-                completed_fork_runs.append((join_id, fork_run_id))
-
+        # Only reducers for fork runs in the current task's fork stack can have been completed by it,
+        # so we look those up directly rather than checking every active reducer
+        for fsi in t.fork_stack:
+            for join_id in self.join_ids:
+                key = (join_id, fsi.node_run_id)
+                # This reducer _may_ now be ready to finalize:
+                if key in self.active_reducers and self._is_fork_run_completed(join_id, fsi.node_run_id):
+                    completed_fork_runs.append(key)
+
+        if len(completed_fork_runs) > 1:
+            # Finalize reducers in the order they were created
+            reducer_order = {key: i for i, key in enumerate(self.active_reducers)}
+            completed_fork_runs.sort(key=reducer_order.__getitem__)
         return completed_fork_runs
 
     def _handle_path(self, path: Path, inputs: Any, fork_stack: ForkStack) -> Sequence[GraphTask]:
@@ -903,6 +969,11 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                 assert isinstance(join_node, Join)
                 self.active_reducers[(join_id, node_run_id)] = JoinState(join_node.initial_factory(), fork_stack)
 
+            if node.max_concurrency is not None and (_is_any_iterable(inputs) or _is_any_async_iterable(inputs)):
+                return _GraphTaskAsyncIterable(
+                    self._handle_bounded_map(node, edges[0], inputs, fork_stack, node_run_id), fork_stack
+                )
+
             # Eagerly raise a clear error if the input value is not iterable as expected
             if _is_any_iterable(inputs):
                 for thread_index, input_item in enumerate(inputs):
@@ -930,27 +1001,66 @@ class _GraphIterator(Generic[StateT, DepsT, OutputT]):
                 new_tasks += self._handle_path(path, inputs, fork_stack + (ForkStackItem(node.id, node_run_id, i),))
         return new_tasks
 
-    def _is_fork_run_completed(self, tasks: Iterable[GraphTask], join_id: JoinID, fork_run_id: NodeRunID) -> bool:
-        # Check if any of the tasks in the graph have this fork_run_id in their fork_stack
-        # If this is the case, then the fork run is not yet completed
+    async def _handle_bounded_map(
+        self,
+        node: Fork[Any, Any],
+        path: Path,
+        inputs: Iterable[Any] | AsyncIterable[Any],
+        fork_stack: ForkStack,
+        node_run_id: NodeRunID,
+    ) -> AsyncIterator[Sequence[GraphTask]]:
+        assert node.max_concurrency is not None
+        bounded_map_run = self.bounded_map_runs[node_run_id] = _BoundedMapRun(Semaphore(node.max_concurrency))
+        items = aiter(inputs if _is_any_async_iterable(inputs) else _iter_lazily(inputs))
+        thread_index = 0
+        try:
+            while True:
+                # Only pull the next item once there's a free slot, so the iterable is consumed at the rate that
+                # items are processed rather than all at once
+                await bounded_map_run.slots.acquire()
+                if bounded_map_run.cancelled:
+                    break
+                try:
+                    input_item = await anext(items)
+                except StopAsyncIteration:
+                    break
+                item_tasks = self._handle_path(
+                    path, input_item, fork_stack + (ForkStackItem(node.id, node_run_id, thread_index),)
+                )
+                if not item_tasks:  # pragma: no cover
+                    bounded_map_run.slots.release()
+                yield item_tasks
+                thread_index += 1
+        finally:
+            bounded_map_run.exhausted = True
+            if not bounded_map_run.active_task_counts:
+                self.bounded_map_runs.pop(node_run_id, None)
+
+    def _is_fork_run_completed(self, join_id: JoinID, fork_run_id: NodeRunID) -> bool:
+        bounded_map_run = self.bounded_map_runs.get(fork_run_id)
+        if bounded_map_run is not None and not bounded_map_run.exhausted:
+            # More items may still be pulled from the map's iterable
+            return False
+
+        # Check if any of the active tasks with this fork_run_id in their fork_stack are at a node between the
+        # parent fork and the join. If this is the case, then the fork run is not yet completed.
+        # The per-node counts make this independent of the number of tasks in the fork run.
+        node_counts = self.active_node_counts_by_fork_run.get(fork_run_id)
+        if not node_counts:
+            return True
         parent_fork = self.graph.get_parent_fork(join_id)
-        for t in tasks:
-            if fork_run_id in {x.node_run_id for x in t.fork_stack}:
-                if t.node_id in parent_fork.intermediate_nodes or t.node_id == join_id:
-                    return False
-            else:
-                pass
-        return True
+        return not any(node_id == join_id or node_id in parent_fork.intermediate_nodes for node_id in node_counts)
 
     async def _cancel_sibling_tasks(self, parent_fork_id: ForkID, node_run_id: NodeRunID):
-        task_ids_to_cancel = set[TaskID]()
-        for task_id, t in self.active_tasks.items():
-            for item in t.fork_stack:  # pragma: no branch
-                if item.fork_id == parent_fork_id and item.node_run_id == node_run_id:
-                    task_ids_to_cancel.add(task_id)
-                    break
-                else:
-                    pass
+        if (bounded_map_run := self.bounded_map_runs.get(node_run_id)) is not None:
+            # Don't pull any more items from the map's iterable
+            bounded_map_run.cancelled = True
+        fork_run_tasks = self.active_tasks_by_fork_run.get(node_run_id, {})
+        task_ids_to_cancel = [
+            task_id
+            for task_id, t in fork_run_tasks.items()
+            if any(item.fork_id == parent_fork_id and item.node_run_id == node_run_id for item in t.fork_stack)
+        ]
         for task_id in task_ids_to_cancel:
             await self._finish_task(task_id)
 
@@ -963,6 +1073,11 @@ def _is_any_async_iterable(x: Any) -> TypeGuard[AsyncIterable[Any]]:
     return isinstance(x, AsyncIterable)
 
 
+async def _iter_lazily(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
 @contextmanager
 def _unwrap_exception_groups():
     # I need to use a helper function for this because I can't figure out a way to get pyright
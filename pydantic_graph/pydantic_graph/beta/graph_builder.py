@@ -94,6 +94,9 @@ class GraphBuilder(Generic[StateT, DepsT, GraphInputT, GraphOutputT]):
     auto_instrument: bool
     """Whether to automatically create instrumentation spans."""
 
+    max_map_concurrency: int | None
+    """The default maximum number of items each map may process at once, or `None` for no limit."""
+
     _nodes: dict[NodeID, AnyNode]
     """Internal storage for nodes in the graph."""
 
@@ -115,6 +118,7 @@ class GraphBuilder(Generic[StateT, DepsT, GraphInputT, GraphOutputT]):
         input_type: TypeOrTypeExpression[GraphInputT] = NoneType,
         output_type: TypeOrTypeExpression[GraphOutputT] = NoneType,
         auto_instrument: bool = True,
+        max_map_concurrency: int | None = None,
     ):
         """Initialize a graph builder.
 
@@ -125,6 +129,8 @@ class GraphBuilder(Generic[StateT, DepsT, GraphInputT, GraphOutputT]):
             input_type: The type of the graph input data
             output_type: The type of the graph output data
             auto_instrument: Whether to automatically create instrumentation spans
+            max_map_concurrency: The default maximum number of items each map may process at once, for maps that
+                don't specify their own `max_concurrency`. If not set, all items of a map are processed at once.
         """
         self.name = name
 
@@ -134,6 +140,9 @@ class GraphBuilder(Generic[StateT, DepsT, GraphInputT, GraphOutputT]):
         self.output_type = output_type
 
         self.auto_instrument = auto_instrument
+        if max_map_concurrency is not None and max_map_concurrency < 1:
+            raise GraphBuildingError(f'`max_map_concurrency` must be at least 1, got {max_map_concurrency}.')
+        self.max_map_concurrency = max_map_concurrency
 
         self._nodes = {}
         self._edges_by_source = defaultdict(list)
@@ -354,7 +363,15 @@ class GraphBuilder(Generic[StateT, DepsT, GraphInputT, GraphOutputT]):
                     for path in item.paths:
                         _handle_path(Path(items=[*path.items]))
                 elif isinstance(item, MapMarker):
-                    new_node = Fork[Any, Any](id=item.fork_id, is_map=True, downstream_join_id=item.downstream_join_id)
+                    max_concurrency = item.max_concurrency
+                    if max_concurrency is None:
+                        max_concurrency = self.max_map_concurrency
+                    new_node = Fork[Any, Any](
+                        id=item.fork_id,
+                        is_map=True,
+                        downstream_join_id=item.downstream_join_id,
+                        max_concurrency=max_concurrency,
+                    )
                     self._insert_node(new_node)
                 elif isinstance(item, DestinationMarker):
                     pass
@@ -419,6 +436,7 @@ class GraphBuilder(Generic[StateT, DepsT, GraphInputT, GraphOutputT]):
         post_map_label: str | None = None,
         fork_id: ForkID | None = None,
         downstream_join_id: JoinID | None = None,
+        max_concurrency: int | None = None,
     ) -> None:
         """Add an edge that maps iterable data across parallel paths.
 
@@ -430,11 +448,14 @@ class GraphBuilder(Generic[StateT, DepsT, GraphInputT, GraphOutputT]):
             fork_id: Optional ID for the fork node produced for this map operation
             downstream_join_id: Optional ID of a join node that will always be downstream of this map.
                 Specifying this ensures correct handling if you try to map an empty iterable.
+            max_concurrency: Optional maximum number of items to process at once, defaults to `max_map_concurrency`.
+                Items are pulled from the iterable lazily as earlier items complete, so large (or unbounded) iterables
+                can be mapped without creating a task for every item up front.
         """
         builder = self.edge_from(source)
         if pre_map_label is not None:
             builder = builder.label(pre_map_label)
-        builder = builder.map(fork_id=fork_id, downstream_join_id=downstream_join_id)
+        builder = builder.map(fork_id=fork_id, downstream_join_id=downstream_join_id, max_concurrency=max_concurrency)
         if post_map_label is not None:
             builder = builder.label(post_map_label)
         self.add(builder.to(map_to))
@@ -77,6 +77,11 @@ class Fork(Generic[InputT, OutputT]):
     """
     downstream_join_id: JoinID | None
     """Optional identifier of a downstream join node that should be jumped to if mapping an empty iterable."""
+    max_concurrency: int | None = None
+    """The maximum number of items of a map that may be processed at once, or `None` for no limit.
+
+    When set, items are pulled from the input iterable lazily, only once an earlier item's branch has completed.
+    """
 
     def _force_variance(self, inputs: InputT) -> OutputT:  # pragma: no cover
         """Force type variance for proper generic typing.
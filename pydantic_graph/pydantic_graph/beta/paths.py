@@ -81,6 +81,8 @@ class MapMarker:
     """Unique identifier for the fork created by this map operation."""
     downstream_join_id: JoinID | None
     """Optional identifier of a downstream join node that should be jumped to if mapping an empty iterable."""
+    max_concurrency: int | None = None
+    """The maximum number of items that may be processed at once, or `None` to use the graph's default."""
 
 
 @dataclass
@@ -233,6 +235,7 @@ class PathBuilder(Generic[StateT, DepsT, OutputT]):
         *,
         fork_id: str | None = None,
         downstream_join_id: str | None = None,
+        max_concurrency: int | None = None,
     ) -> PathBuilder[StateT, DepsT, T]:
         """Spread iterable data across parallel execution paths.
 
@@ -242,13 +245,18 @@ class PathBuilder(Generic[StateT, DepsT, OutputT]):
         Args:
             fork_id: Optional ID for the fork, defaults to a generated value
             downstream_join_id: Optional ID of a downstream join node which is involved when mapping empty iterables
+            max_concurrency: Optional maximum number of items to process at once, defaults to the graph's
+                `max_map_concurrency`
 
         Returns:
             A new PathBuilder that operates on individual items from the iterable
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise GraphBuildingError(f'`max_concurrency` must be at least 1, got {max_concurrency}.')
         next_item = MapMarker(
             fork_id=ForkID(NodeID(fork_id or generate_placeholder_node_id('map'))),
             downstream_join_id=JoinID(downstream_join_id) if downstream_join_id is not None else None,
+            max_concurrency=max_concurrency,
         )
         return PathBuilder[StateT, DepsT, T](working_items=[*self.working_items, next_item])
 
@@ -374,12 +382,15 @@ class EdgePathBuilder(Generic[StateT, DepsT, OutputT]):
         *,
         fork_id: str | None = None,
         downstream_join_id: JoinID | None = None,
+        max_concurrency: int | None = None,
     ) -> EdgePathBuilder[StateT, DepsT, T]:
         """Spread iterable data across parallel execution paths.
 
         Args:
             fork_id: Optional ID for the fork, defaults to a generated value
             downstream_join_id: Optional ID of a downstream join node which is involved when mapping empty iterables
+            max_concurrency: Optional maximum number of items to process at once, defaults to the graph's
+                `max_map_concurrency`
 
         Returns:
             A new EdgePathBuilder that operates on individual items from the iterable
@@ -395,7 +406,9 @@ class EdgePathBuilder(Generic[StateT, DepsT, OutputT]):
             )
         return EdgePathBuilder(
             sources=self.sources,
-            path_builder=self._path_builder.map(fork_id=fork_id, downstream_join_id=downstream_join_id),
+            path_builder=self._path_builder.map(
+                fork_id=fork_id, downstream_join_id=downstream_join_id, max_concurrency=max_concurrency
+            ),
         )
 
     def transform(self, func: TransformFunction[StateT, DepsT, OutputT, T], /) -> EdgePathBuilder[StateT, DepsT, T]:
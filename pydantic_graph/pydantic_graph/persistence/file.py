@@ -1,15 +1,18 @@
 from __future__ import annotations as _annotations
 
+import os
 import secrets
 from collections.abc import AsyncIterator
-from contextlib import AsyncExitStack, asynccontextmanager
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from time import perf_counter
-from typing import Any
+from typing import Annotated, Any, Literal
 
 import anyio
 import pydantic
+import pydantic_core
 
 from .. import _utils as _graph_utils, exceptions
 from ..nodes import BaseNode, End
@@ -144,8 +147,7 @@ class FileStatePersistence(BaseStatePersistence[StateT, RunEndT]):
             snapshots.append(snapshot)
             await self._save(snapshots)
 
-    @asynccontextmanager
-    async def _lock(self, *, timeout: float = 1.0) -> AsyncIterator[None]:
+    def _lock(self, *, timeout: float = 1.0) -> AbstractAsyncContextManager[None]:
         """Lock a file by checking and writing a `.pydantic-graph-persistence-lock` to it.
 
         Args:
@@ -153,17 +155,326 @@ class FileStatePersistence(BaseStatePersistence[StateT, RunEndT]):
 
         Returns: an async context manager that holds the lock
         """
-        lock_file = self.json_file.parent / f'{self.json_file.name}.pydantic-graph-persistence-lock'
-        lock_id = secrets.token_urlsafe().encode()
+        return _file_lock(self.json_file, timeout=timeout)
+
+
+_STATUS_CHANGE_FIELDS = ('status', 'start_ts', 'duration')
+"""The snapshot fields set by a status change, when not `None`."""
+
+
+@dataclass(kw_only=True)
+class _StatusChange:
+    """A journal line recording a change to the status of a node snapshot."""
+
+    id: str
+    status: SnapshotStatus
+    start_ts: datetime | None = None
+    duration: float | None = None
+    kind: Literal['status'] = 'status'
+
+    def apply(self, snapshot: NodeSnapshot[Any, Any]) -> None:
+        snapshot.status = self.status
+        if self.start_ts is not None:
+            snapshot.start_ts = self.start_ts
+        if self.duration is not None:
+            snapshot.duration = self.duration
+
+
+@dataclass
+class _JournalIndex:
+    """In-memory index of the snapshots recorded in a journal, up to `size` bytes into the file."""
+
+    file_id: tuple[int, int] | None = None
+    """The device and inode of the indexed file, which change when the journal is compacted by another process."""
+    size: int = 0
+    offsets: dict[str, int] = field(default_factory=dict[str, int])
+    """The offset of the line of each snapshot, by ID."""
+    statuses: dict[str, SnapshotStatus] = field(default_factory=dict[str, SnapshotStatus])
+    """The latest status of each node snapshot, by ID."""
+    created: dict[str, None] = field(default_factory=dict[str, None])
+    """The IDs of node snapshots with status `'created'`, in the order they were added."""
+    status_changes: int = 0
+    last_fsync: float = 0
+
+    def add(self, offset: int, kind: str, snapshot_id: str, status: SnapshotStatus | None) -> None:
+        if kind == 'status':
+            self.status_changes += 1
+            # Like `FileStatePersistence`, status changes apply to the first snapshot with the ID
+            if snapshot_id in self.statuses and status is not None:  # pragma: no branch
+                self.statuses[snapshot_id] = status
+                # Snapshots never go back to `'created'`
+                self.created.pop(snapshot_id, None)
+        elif snapshot_id not in self.offsets:  # pragma: no branch
+            self.offsets[snapshot_id] = offset
+            if kind == 'node' and status is not None:
+                self.statuses[snapshot_id] = status
+                if status == 'created':
+                    self.created[snapshot_id] = None
+
+
+@dataclass
+class JournalFileStatePersistence(BaseStatePersistence[StateT, RunEndT]):
+    """File based state persistence that records graph run state in a [JSON Lines](https://jsonlines.org/) journal.
+
+    [`FileStatePersistence`][pydantic_graph.persistence.file.FileStatePersistence] rewrites the whole file every time
+    a snapshot is added or its status changes, so each step of a graph run gets slower as snapshots accumulate.
+    Instead, this appends a line to the journal for each new snapshot and each status change, and keeps an in-memory
+    index of where each snapshot is in the file and what its latest status is, so each step takes constant time
+    however long the run is.
+
+    Status changes are folded into their snapshots' lines when the journal is compacted, which happens once there
+    are more status changes than snapshots in the journal (and at least `compaction_threshold` of them).
+    Changes appended by other processes are picked up by reading the journal from where the index left off.
+    """
+
+    journal_file: Path
+    """Path to the JSON Lines file where the snapshots and their status changes are recorded.
+
+    As with `FileStatePersistence`, you should use a different file for each graph run, but a single file should be
+    reused for multiple steps of the same run.
+    """
+    compaction_threshold: int = 1000
+    """The minimum number of status changes in the journal before it's compacted."""
+    fsync_interval: float | None = None
+    """The minimum time in seconds between `fsync` calls after appending to the journal.
+
+    By default, flushing writes to disk is left to the operating system. Set this to `0` to `fsync` after every
+    change, or to a larger value to have changes made in quick succession share a single `fsync`, at the risk of
+    losing the changes made since the last one if the machine crashes.
+    """
 
-        with anyio.fail_after(timeout):
-            while not await _file_append_check(lock_file, lock_id):
-                await anyio.sleep(0.01)
+    _record_type_adapter: pydantic.TypeAdapter[Snapshot[StateT, RunEndT] | _StatusChange] | None = field(
+        default=None, init=False, repr=False
+    )
+    _index: _JournalIndex = field(default_factory=_JournalIndex, init=False, repr=False)
+    _process_lock: anyio.Lock = field(default_factory=anyio.Lock, init=False, repr=False)
+
+    async def snapshot_node(self, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]) -> None:
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._append_sync, NodeSnapshot(state=state, node=next_node))
+
+    async def snapshot_node_if_new(
+        self, snapshot_id: str, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]
+    ) -> None:
+        async with self._lock():
+            await _graph_utils.run_in_executor(
+                self._append_if_new_sync, snapshot_id, NodeSnapshot(state=state, node=next_node)
+            )
 
+    async def snapshot_end(self, state: StateT, end: End[RunEndT]) -> None:
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._append_sync, EndSnapshot(state=state, result=end))
+
+    @asynccontextmanager
+    async def record_run(self, snapshot_id: str) -> AsyncIterator[None]:
+        async with self._lock():
+            await _graph_utils.run_in_executor(self._start_run_sync, snapshot_id)
+
+        start = perf_counter()
         try:
             yield
-        finally:
-            await _graph_utils.run_in_executor(lock_file.unlink, missing_ok=True)
+        except Exception:
+            duration = perf_counter() - start
+            async with self._lock():
+                await _graph_utils.run_in_executor(
+                    self._append_sync, _StatusChange(id=snapshot_id, status='error', duration=duration)
+                )
+            raise
+        else:
+            duration = perf_counter() - start
+            async with self._lock():
+                await _graph_utils.run_in_executor(
+                    self._append_sync, _StatusChange(id=snapshot_id, status='success', duration=duration)
+                )
+
+    async def load_next(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        async with self._lock():
+            return await _graph_utils.run_in_executor(self._load_next_sync)
+
+    def should_set_types(self) -> bool:
+        """Whether types need to be set."""
+        return self._record_type_adapter is None
+
+    def set_types(self, state_type: type[StateT], run_end_type: type[RunEndT]) -> None:
+        self._record_type_adapter = pydantic.TypeAdapter(
+            Annotated[
+                NodeSnapshot[state_type, run_end_type] | EndSnapshot[state_type, run_end_type] | _StatusChange,
+                pydantic.Discriminator('kind'),
+            ]
+        )
+
+    async def load_all(self) -> list[Snapshot[StateT, RunEndT]]:
+        return await _graph_utils.run_in_executor(self._load_all_sync)
+
+    def _load_all_sync(self) -> list[Snapshot[StateT, RunEndT]]:
+        assert self._record_type_adapter is not None, 'record type adapter must be set'
+        try:
+            content = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return []
+
+        snapshots: list[Snapshot[StateT, RunEndT]] = []
+        snapshots_by_id: dict[str, Snapshot[StateT, RunEndT]] = {}
+        for line in _complete_lines(content):
+            record = self._record_type_adapter.validate_json(line)
+            if isinstance(record, _StatusChange):
+                snapshot = snapshots_by_id.get(record.id)
+                if isinstance(snapshot, NodeSnapshot):  # pragma: no branch
+                    record.apply(snapshot)
+            else:
+                snapshots.append(record)
+                snapshots_by_id.setdefault(record.id, record)
+        return snapshots
+
+    def _load_next_sync(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        assert self._record_type_adapter is not None, 'record type adapter must be set'
+        self._refresh_index_sync()
+        snapshot_id = next(iter(self._index.created), None)
+        if snapshot_id is None:
+            return None
+
+        with self.journal_file.open('rb') as f:
+            f.seek(self._index.offsets[snapshot_id])
+            snapshot = self._record_type_adapter.validate_json(f.readline())
+        assert isinstance(snapshot, NodeSnapshot), 'Only NodeSnapshot can be loaded'
+        self._append_sync(_StatusChange(id=snapshot_id, status='pending'))
+        snapshot.status = 'pending'
+        return snapshot
+
+    def _start_run_sync(self, snapshot_id: str) -> None:
+        self._refresh_index_sync()
+        if snapshot_id not in self._index.offsets:
+            raise LookupError(f'No snapshot found with id={snapshot_id!r}')
+        status = self._index.statuses.get(snapshot_id)
+        assert status is not None, 'Only NodeSnapshot can be recorded'
+        exceptions.GraphNodeStatusError.check(status)
+        self._append_sync(_StatusChange(id=snapshot_id, status='running', start_ts=_utils.now_utc()))
+
+    def _append_if_new_sync(self, snapshot_id: str, snapshot: Snapshot[StateT, RunEndT]) -> None:
+        self._refresh_index_sync()
+        if snapshot_id not in self._index.offsets:  # pragma: no branch
+            self._append_sync(snapshot)
+
+    def _append_sync(self, record: Snapshot[StateT, RunEndT] | _StatusChange) -> None:
+        assert self._record_type_adapter is not None, 'record type adapter must be set'
+        line = self._record_type_adapter.dump_json(record) + b'\n'
+        size = self._refresh_index_sync()
+        index = self._index
+        if size > index.size:
+            # A write was interrupted part way through a line, which would corrupt the line appended after it
+            os.truncate(self.journal_file, index.size)
+        with self.journal_file.open('ab') as f:
+            f.write(line)
+            f.flush()
+            end = f.tell()
+            if self.fsync_interval is not None:
+                now = perf_counter()
+                if now - index.last_fsync >= self.fsync_interval:
+                    os.fsync(f.fileno())
+                    index.last_fsync = now
+            stat = os.fstat(f.fileno())
+
+        offset = end - len(line)
+        if (stat.st_dev, stat.st_ino) == index.file_id and offset == index.size:
+            # Nothing else has been appended since the journal was last indexed
+            index.add(offset, record.kind, record.id, getattr(record, 'status', None))
+            index.size = end
+        else:
+            self._refresh_index_sync()
+
+        if self._index.status_changes >= max(self.compaction_threshold, len(self._index.offsets)):
+            self._compact_sync()
+
+    def _refresh_index_sync(self) -> int:
+        """Index any lines appended to the journal since it was last indexed, including by other processes.
+
+        Returns: The size of the journal file.
+        """
+        try:
+            stat = self.journal_file.stat()
+        except FileNotFoundError:
+            self._index = _JournalIndex(last_fsync=self._index.last_fsync)
+            return 0
+
+        index = self._index
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != index.file_id or stat.st_size < index.size:
+            # The journal is new to us, or it was compacted by another process, so index it from the start
+            index = self._index = _JournalIndex(file_id=file_id, last_fsync=index.last_fsync)
+        if stat.st_size == index.size:
+            return stat.st_size
+
+        with self.journal_file.open('rb') as f:
+            f.seek(index.size)
+            content = f.read()
+        size = index.size + len(content)
+        for line in _complete_lines(content):
+            record = pydantic_core.from_json(line)
+            index.add(index.size, record['kind'], record['id'], record.get('status'))
+            index.size += len(line)
+        return size
+
+    def _compact_sync(self) -> None:
+        """Rewrite the journal with each status change folded into its snapshot's line."""
+        content = self.journal_file.read_bytes()
+        snapshots: list[dict[str, Any]] = []
+        snapshots_by_id: dict[str, dict[str, Any]] = {}
+        for line in _complete_lines(content):
+            record = pydantic_core.from_json(line)
+            if record['kind'] == 'status':
+                snapshot = snapshots_by_id.get(record['id'])
+                if snapshot is not None:  # pragma: no branch
+                    snapshot.update({k: v for k in _STATUS_CHANGE_FIELDS if (v := record.get(k)) is not None})
+            else:
+                snapshots.append(record)
+                snapshots_by_id.setdefault(record['id'], record)
+
+        index = _JournalIndex(last_fsync=self._index.last_fsync)
+        compacted_file = self.journal_file.with_name(f'{self.journal_file.name}.compacting')
+        with compacted_file.open('wb') as f:
+            for snapshot in snapshots:
+                line = pydantic_core.to_json(snapshot) + b'\n'
+                index.add(index.size, snapshot['kind'], snapshot['id'], snapshot.get('status'))
+                index.size += len(line)
+                f.write(line)
+            f.flush()
+            if self.fsync_interval is not None:
+                os.fsync(f.fileno())
+        os.replace(compacted_file, self.journal_file)
+
+        stat = self.journal_file.stat()
+        index.file_id = (stat.st_dev, stat.st_ino)
+        self._index = index
+
+    @asynccontextmanager
+    async def _lock(self, *, timeout: float = 1.0) -> AsyncIterator[None]:
+        # Operations in this process wait for each other in memory, so only other processes poll the lock file
+        async with self._process_lock:
+            async with _file_lock(self.journal_file, timeout=timeout):
+                yield
+
+
+def _complete_lines(content: bytes) -> list[bytes]:
+    """Split content into lines including their line endings, ignoring a partially written last line."""
+    lines = content.splitlines(keepends=True)
+    if lines and not lines[-1].endswith(b'\n'):
+        lines.pop()
+    return lines
+
+
+@asynccontextmanager
+async def _file_lock(file: Path, *, timeout: float) -> AsyncIterator[None]:
+    lock_file = file.parent / f'{file.name}.pydantic-graph-persistence-lock'
+    lock_id = secrets.token_urlsafe().encode()
+
+    with anyio.fail_after(timeout):
+        while not await _file_append_check(lock_file, lock_id):
+            await anyio.sleep(0.01)
+
+    try:
+        yield
+    finally:
+        await _graph_utils.run_in_executor(lock_file.unlink, missing_ok=True)
 
 
 async def _file_append_check(file: Path, content: bytes) -> bool:
@@ -0,0 +1,243 @@
+from __future__ import annotations as _annotations
+
+import sqlite3
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Annotated, Any
+
+import pydantic
+
+from .. import _utils as _graph_utils, exceptions
+from ..nodes import BaseNode, End
+from . import (
+    BaseStatePersistence,
+    EndSnapshot,
+    NodeSnapshot,
+    RunEndT,
+    Snapshot,
+    SnapshotStatus,
+    StateT,
+    _utils,
+)
+
+__all__ = ('SqliteStatePersistence',)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graph_snapshots (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    snapshot_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    status TEXT,
+    start_ts TEXT,
+    duration REAL,
+    snapshot TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS graph_snapshots_run_snapshot_id ON graph_snapshots (run_id, snapshot_id);
+CREATE INDEX IF NOT EXISTS graph_snapshots_run_status ON graph_snapshots (run_id, status);
+"""
+
+
+@dataclass
+class SqliteStatePersistence(BaseStatePersistence[StateT, RunEndT]):
+    """State persistence that stores the snapshots of graph runs in a SQLite database.
+
+    Unlike [`FileStatePersistence`][pydantic_graph.persistence.file.FileStatePersistence], which needs a file per
+    graph run, many runs can share a database, with each run's snapshots identified by `run_id`, and they can be
+    queried with SQL from the `graph_snapshots` table.
+
+    Status changes are made in transactions rather than using lock files, and the database uses
+    [write-ahead logging](https://www.sqlite.org/wal.html) so runs in different processes can read it while another
+    writes. Instances in the same process using the same database share a connection, and database access runs in
+    a worker thread.
+    """
+
+    database: Path
+    """Path to the SQLite database file, which will be created if it doesn't exist."""
+    run_id: str
+    """The ID of the graph run whose snapshots are stored.
+
+    You should use a different run ID for each graph run, but the same run ID for multiple steps of the same run.
+    """
+
+    _snapshot_type_adapter: pydantic.TypeAdapter[Snapshot[StateT, RunEndT]] | None = field(
+        default=None, init=False, repr=False
+    )
+    _database: _Database | None = field(default=None, init=False, repr=False)
+
+    async def snapshot_node(self, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]) -> None:
+        await _graph_utils.run_in_executor(self._insert_sync, NodeSnapshot(state=state, node=next_node))
+
+    async def snapshot_node_if_new(
+        self, snapshot_id: str, state: StateT, next_node: BaseNode[StateT, Any, RunEndT]
+    ) -> None:
+        await _graph_utils.run_in_executor(
+            self._insert_sync, NodeSnapshot(state=state, node=next_node), if_new=snapshot_id
+        )
+
+    async def snapshot_end(self, state: StateT, end: End[RunEndT]) -> None:
+        await _graph_utils.run_in_executor(self._insert_sync, EndSnapshot(state=state, result=end))
+
+    @asynccontextmanager
+    async def record_run(self, snapshot_id: str) -> AsyncIterator[None]:
+        await _graph_utils.run_in_executor(self._start_run_sync, snapshot_id)
+
+        start = perf_counter()
+        try:
+            yield
+        except Exception:
+            await _graph_utils.run_in_executor(self._finish_run_sync, snapshot_id, perf_counter() - start, 'error')
+            raise
+        else:
+            await _graph_utils.run_in_executor(self._finish_run_sync, snapshot_id, perf_counter() - start, 'success')
+
+    async def load_next(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        return await _graph_utils.run_in_executor(self._load_next_sync)
+
+    def should_set_types(self) -> bool:
+        """Whether types need to be set."""
+        return self._snapshot_type_adapter is None
+
+    def set_types(self, state_type: type[StateT], run_end_type: type[RunEndT]) -> None:
+        self._snapshot_type_adapter = pydantic.TypeAdapter(
+            Annotated[Snapshot[state_type, run_end_type], pydantic.Discriminator('kind')]
+        )
+
+    async def load_all(self) -> list[Snapshot[StateT, RunEndT]]:
+        return await _graph_utils.run_in_executor(self._load_all_sync)
+
+    def _get_database(self) -> _Database:
+        if self._database is None:
+            self._database = _Database.get(self.database)
+        return self._database
+
+    def _insert_sync(self, snapshot: Snapshot[StateT, RunEndT], *, if_new: str | None = None) -> None:
+        assert self._snapshot_type_adapter is not None, 'snapshot type adapter must be set'
+        snapshot_json = self._snapshot_type_adapter.dump_json(snapshot).decode()
+        status = snapshot.status if isinstance(snapshot, NodeSnapshot) else None
+        with self._get_database().transaction() as connection:
+            if if_new is not None and _find_snapshot(connection, self.run_id, if_new) is not None:
+                return
+            connection.execute(
+                'INSERT INTO graph_snapshots (run_id, snapshot_id, kind, status, snapshot) VALUES (?, ?, ?, ?, ?)',
+                (self.run_id, snapshot.id, snapshot.kind, status, snapshot_json),
+            )
+
+    def _start_run_sync(self, snapshot_id: str) -> None:
+        with self._get_database().transaction() as connection:
+            row = _find_snapshot(connection, self.run_id, snapshot_id)
+            if row is None:
+                raise LookupError(f'No snapshot found with id={snapshot_id!r}')
+
+            row_id, kind, status = row
+            assert kind == 'node', 'Only NodeSnapshot can be recorded'
+            exceptions.GraphNodeStatusError.check(status)
+            connection.execute(
+                "UPDATE graph_snapshots SET status = 'running', start_ts = ? WHERE id = ?",
+                (_utils.now_utc().isoformat(), row_id),
+            )
+
+    def _finish_run_sync(self, snapshot_id: str, duration: float, status: SnapshotStatus) -> None:
+        with self._get_database().transaction() as connection:
+            row = _find_snapshot(connection, self.run_id, snapshot_id)
+            assert row is not None, 'snapshot must exist once it has started running'
+            connection.execute(
+                'UPDATE graph_snapshots SET status = ?, duration = ? WHERE id = ?', (status, duration, row[0])
+            )
+
+    def _load_next_sync(self) -> NodeSnapshot[StateT, RunEndT] | None:
+        with self._get_database().transaction() as connection:
+            row = connection.execute(
+                'SELECT id, status, start_ts, duration, snapshot FROM graph_snapshots'
+                " WHERE run_id = ? AND status = 'created' ORDER BY id LIMIT 1",
+                (self.run_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            connection.execute("UPDATE graph_snapshots SET status = 'pending' WHERE id = ?", (row[0],))
+        snapshot = self._load_row(row[1:])
+        assert isinstance(snapshot, NodeSnapshot), 'Only NodeSnapshot can be loaded'
+        snapshot.status = 'pending'
+        return snapshot
+
+    def _load_all_sync(self) -> list[Snapshot[StateT, RunEndT]]:
+        with self._get_database().read() as connection:
+            rows = connection.execute(
+                'SELECT status, start_ts, duration, snapshot FROM graph_snapshots WHERE run_id = ? ORDER BY id',
+                (self.run_id,),
+            ).fetchall()
+        return [self._load_row(row) for row in rows]
+
+    def _load_row(self, row: tuple[Any, ...]) -> Snapshot[StateT, RunEndT]:
+        assert self._snapshot_type_adapter is not None, 'snapshot type adapter must be set'
+        status, start_ts, duration, snapshot_json = row
+        snapshot = self._snapshot_type_adapter.validate_json(snapshot_json)
+        if isinstance(snapshot, NodeSnapshot):
+            # The status and timing are stored in their own columns so they can be updated without rewriting the JSON
+            snapshot.status = status
+            snapshot.start_ts = datetime.fromisoformat(start_ts) if start_ts is not None else None
+            snapshot.duration = duration
+        return snapshot
+
+
+def _find_snapshot(connection: sqlite3.Connection, run_id: str, snapshot_id: str) -> tuple[int, str, Any] | None:
+    """Find the row ID, kind and status of the first snapshot with the given ID in a run."""
+    return connection.execute(
+        'SELECT id, kind, status FROM graph_snapshots WHERE run_id = ? AND snapshot_id = ? ORDER BY id LIMIT 1',
+        (run_id, snapshot_id),
+    ).fetchone()
+
+
+class _Database:
+    """A connection to a SQLite database, shared by all persistence instances in the process that use it."""
+
+    _instances: dict[Path, _Database] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed explicitly, see `transaction`
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        # With write-ahead logging, this is still safe against corruption and only syncs at checkpoints
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, path: Path) -> _Database:
+        path = path.resolve()
+        with cls._instances_lock:
+            database = cls._instances.get(path)
+            if database is None:
+                database = cls._instances[path] = cls(path)
+            return database
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a transaction that holds the database's write lock from the start.
+
+        Starting with `BEGIN IMMEDIATE` means a status read at the start of the transaction can't be changed by
+        another connection before it's updated, so status transitions are atomic across processes.
+        """
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            else:
+                self._connection.execute('COMMIT')
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Use the connection to run a single read statement."""
+        with self._lock:
+            yield self._connection
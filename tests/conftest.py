@@ -274,6 +274,11 @@ def no_instrumentation_by_default():
     Embedder.instrument_all(False)
 
 
+@pytest.fixture(autouse=True)
+def fresh_download_cache():
+    pydantic_ai.models.download_cache_clear()
+
+
 try:
     import logfire
 
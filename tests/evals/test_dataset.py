@@ -2,10 +2,12 @@ from __future__ import annotations as _annotations
 
 import json
 import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
+import anyio
 import pytest
 import yaml
 from dirty_equals import HasRepr, IsNumber
@@ -22,6 +24,7 @@ with try_import() as imports_successful:
     from pydantic_evals import Case, Dataset
     from pydantic_evals.dataset import increment_eval_metric, set_eval_attribute
     from pydantic_evals.evaluators import (
+        EqualsExpected,
         EvaluationResult,
         Evaluator,
         EvaluatorFailure,
@@ -1773,3 +1776,141 @@ async def test_evaluate_with_experiment_metadata(example_dataset: Dataset[TaskIn
 
     # Verify that the report contains the experiment metadata
     assert report.experiment_metadata == experiment_metadata
+
+
+async def test_evaluate_iter(example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata]):
+    """Test that evaluate_iter yields the result of each case as soon as it completes."""
+    case2_done = anyio.Event()
+
+    async def task(inputs: TaskInput) -> TaskOutput:
+        if inputs.query == 'What is 2+2?':
+            await case2_done.wait()
+            raise ValueError('Task error')
+        case2_done.set()
+        return TaskOutput(answer='Paris')
+
+    async with example_dataset.evaluate_iter(task, progress=False) as results:
+        names_and_types = [(result.name, type(result).__name__) async for result in results]
+
+    assert names_and_types == snapshot([('case2', 'ReportCase'), ('case1', 'ReportCaseFailure')])
+
+
+async def test_evaluate_with_checkpoint(example_dataset: Dataset[TaskInput, TaskOutput, TaskMetadata], tmp_path: Path):
+    """Test that an interrupted evaluation can be resumed from its checkpoint file."""
+    checkpoint_path = tmp_path / 'checkpoint.jsonl'
+    never = anyio.Event()
+
+    async def interrupted_task(inputs: TaskInput) -> TaskOutput:
+        if inputs.query == 'What is the capital of France?':
+            await never.wait()
+        return TaskOutput(answer='4')
+
+    async with example_dataset.evaluate_iter(
+        interrupted_task, progress=False, checkpoint_path=checkpoint_path
+    ) as results:
+        async for result in results:
+            assert result.name == 'case1'
+            break
+
+    # Simulate a result that was only partially written when the run was interrupted
+    with checkpoint_path.open('ab') as f:
+        f.write(b'{"name":"case2","inp')
+
+    queries: list[str] = []
+
+    async def task(inputs: TaskInput) -> TaskOutput:
+        queries.append(inputs.query)
+        return TaskOutput(answer='Paris')
+
+    report = await example_dataset.evaluate(task, progress=False, checkpoint_path=checkpoint_path)
+    assert queries == ['What is the capital of France?']
+    assert [(case.name, case.output) for case in report.cases] == snapshot(
+        [
+            ('case1', TaskOutput(answer='4', confidence=1.0)),
+            ('case2', TaskOutput(answer='Paris', confidence=1.0)),
+        ]
+    )
+
+    # Results loaded from the checkpoint are validated without the dataset's types
+    checkpoint_report = EvaluationReport.from_checkpoint(checkpoint_path, name='resumed')
+    assert [(case.name, case.output) for case in checkpoint_report.cases] == snapshot(
+        [('case1', {'answer': '4', 'confidence': 1.0}), ('case2', {'answer': 'Paris', 'confidence': 1.0})]
+    )
+    assert checkpoint_report.failures == []
+
+    # All cases are recorded, so nothing is run again
+    report = await example_dataset.evaluate(task, progress=False, checkpoint_path=checkpoint_path)
+    assert len(queries) == 1
+    assert len(report.cases) == 2
+
+
+def double_or_fail(inputs: int) -> int:
+    """Module-level task so that it can be pickled to worker processes."""
+    if inputs == 3:
+        raise ValueError('Task error')
+    return inputs * 2
+
+
+# The Logfire configuration used for capturing spans in tests can't be sent to the worker processes
+@pytest.mark.filterwarnings('ignore:The Logfire configuration cannot be pickled:UserWarning')
+def test_evaluate_with_processes():
+    """Test that cases sharded across worker processes are merged into a report in dataset order."""
+    dataset = Dataset[int, int, Any](
+        cases=[Case(name=f'case{i}', inputs=i, expected_output=i * 2) for i in range(10)],
+        evaluators=[EqualsExpected()],
+    )
+
+    report = dataset.evaluate_sync(double_or_fail, progress=False, processes=2)
+
+    assert [(case.name, case.output, case.assertions['EqualsExpected'].value) for case in report.cases] == snapshot(
+        [
+            ('case0', 0, True),
+            ('case1', 2, True),
+            ('case2', 4, True),
+            ('case4', 8, True),
+            ('case5', 10, True),
+            ('case6', 12, True),
+            ('case7', 14, True),
+            ('case8', 16, True),
+            ('case9', 18, True),
+        ]
+    )
+    assert [(failure.name, failure.error_message) for failure in report.failures] == snapshot(
+        [('case3', 'ValueError: Task error')]
+    )
+
+    with pytest.raises(ValueError, match=r'`processes` must be at least 1, got 0\.'):
+        dataset.evaluate_sync(double_or_fail, progress=False, processes=0)
+
+
+def wait_for_file(inputs: str) -> str:
+    """Module-level task that waits for the file named by its inputs to exist, if any."""
+    while inputs and not Path(inputs).exists():
+        time.sleep(0.01)
+    return inputs
+
+
+@pytest.mark.filterwarnings('ignore:The Logfire configuration cannot be pickled:UserWarning')
+async def test_evaluate_with_processes_and_checkpoint(tmp_path: Path):
+    """Test that results from worker processes are checkpointed as each case completes, not when its shard does."""
+    checkpoint_path = tmp_path / 'checkpoint.jsonl'
+    flag_path = tmp_path / 'flag'
+    # With one process, the cases are split into shards of two, so the first shard is `case0` and `case1`
+    dataset = Dataset[str, str, Any](
+        cases=[Case(name='case0', inputs=str(flag_path))] + [Case(name=f'case{i}', inputs='') for i in range(1, 5)]
+    )
+
+    with anyio.fail_after(60):
+        async with dataset.evaluate_iter(
+            wait_for_file, progress=False, checkpoint_path=checkpoint_path, processes=1
+        ) as results:
+            first = await anext(results)
+            assert first.name == 'case1'
+            assert [json.loads(line)['name'] for line in checkpoint_path.read_text().splitlines()] == ['case1']
+
+            flag_path.touch()
+            names = [result.name async for result in results]
+
+    assert sorted(names) == ['case0', 'case2', 'case3', 'case4']
+    report = EvaluationReport.from_checkpoint(checkpoint_path, name='wait_for_file')
+    assert sorted(case.name for case in report.cases) == [f'case{i}' for i in range(5)]
@@ -234,7 +234,7 @@ async def test_llm_judge_evaluator(mocker: MockerFixture):
         {'LLMJudge': {'value': True, 'reason': 'Test passed'}}
     )
 
-    mock_judge_output.assert_called_once_with('Hello world', 'Content contains a greeting', None, None)
+    mock_judge_output.assert_called_once_with('Hello world', 'Content contains a greeting', None, None, None)
 
     # Test with input
     evaluator = LLMJudge(rubric='Output contains input', include_input=True, model='openai:gpt-4o')
@@ -243,7 +243,7 @@ async def test_llm_judge_evaluator(mocker: MockerFixture):
     )
 
     mock_judge_input_output.assert_called_once_with(
-        {'prompt': 'Hello'}, 'Hello world', 'Output contains input', 'openai:gpt-4o', None
+        {'prompt': 'Hello'}, 'Hello world', 'Output contains input', 'openai:gpt-4o', None, None
     )
 
     # Test with input and expected output
@@ -255,7 +255,7 @@ async def test_llm_judge_evaluator(mocker: MockerFixture):
     )
 
     mock_judge_input_output_expected.assert_called_once_with(
-        {'prompt': 'Hello'}, 'Hello world', 'Hello', 'Output contains input', 'openai:gpt-4o', None
+        {'prompt': 'Hello'}, 'Hello world', 'Hello', 'Output contains input', 'openai:gpt-4o', None, None
     )
 
     # Test with output and expected output
@@ -267,7 +267,7 @@ async def test_llm_judge_evaluator(mocker: MockerFixture):
     )
 
     mock_judge_output_expected.assert_called_once_with(
-        'Hello world', 'Hello', 'Output contains input', 'openai:gpt-4o', None
+        'Hello world', 'Hello', 'Output contains input', 'openai:gpt-4o', None, None
     )
     # Test with failing result
     mock_grading_output.score = 0.0
@@ -332,7 +332,7 @@ async def test_llm_judge_evaluator_with_model_settings(mocker: MockerFixture):
         {'LLMJudge': {'value': True, 'reason': 'Test passed with settings'}}
     )
     mock_judge_output.assert_called_once_with(
-        'Hello world custom settings', 'Greeting with custom settings', None, custom_model_settings
+        'Hello world custom settings', 'Greeting with custom settings', None, custom_model_settings, None
     )
 
     # Test with input, with custom model_settings
@@ -351,6 +351,7 @@ async def test_llm_judge_evaluator_with_model_settings(mocker: MockerFixture):
         'Output contains input with custom settings',
         'openai:gpt-3.5-turbo',
         custom_model_settings,
+        None,
     )
 
     # Test with input and expected output, with custom model_settings
@@ -371,6 +372,7 @@ async def test_llm_judge_evaluator_with_model_settings(mocker: MockerFixture):
         'Output contains input with custom settings',
         'openai:gpt-3.5-turbo',
         custom_model_settings,
+        None,
     )
 
     # Test with output and expected output
@@ -390,6 +392,7 @@ async def test_llm_judge_evaluator_with_model_settings(mocker: MockerFixture):
         'Output contains input with custom settings',
         'openai:gpt-3.5-turbo',
         custom_model_settings,
+        None,
     )
 
 
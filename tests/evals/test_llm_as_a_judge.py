@@ -1,5 +1,9 @@
 from __future__ import annotations as _annotations
 
+import pickle
+import sqlite3
+from pathlib import Path
+
 import pytest
 from inline_snapshot import snapshot
 from pytest_mock import MockerFixture
@@ -8,14 +12,18 @@ from ..conftest import BinaryContent, try_import
 
 with try_import() as imports_successful:
     from pydantic_ai.settings import ModelSettings
+    from pydantic_evals.evaluators import EvaluationReason, EvaluatorContext, LLMJudge
     from pydantic_evals.evaluators.llm_as_a_judge import (
         GradingOutput,
+        JudgeCache,
         _stringify,  # pyright: ignore[reportPrivateUsage]
         judge_input_output,
         judge_input_output_expected,
         judge_output,
         judge_output_expected,
+        set_default_judge_cache,
     )
+    from pydantic_evals.otel._errors import SpanTreeRecordingError
 
 pytestmark = [pytest.mark.skipif(not imports_successful(), reason='pydantic-evals not installed'), pytest.mark.anyio]
 
@@ -69,6 +77,82 @@ def test_stringify():
     assert _stringify(obj) == 'NonSerializable()'
 
 
+@pytest.mark.anyio
+async def test_judge_cache(mocker: MockerFixture, tmp_path: Path):
+    """Test that grading outputs are cached across judge calls until refreshed."""
+    mock_result = mocker.MagicMock()
+    mock_result.output = GradingOutput(reason='Test passed', pass_=True, score=1.0)
+    mock_run = mocker.patch('pydantic_ai.agent.AbstractAgent.run', return_value=mock_result)
+
+    cache = JudgeCache(tmp_path / 'judge_cache.sqlite')
+
+    assert await judge_output('Hello world', 'Content contains a greeting', cache=cache) == mock_result.output
+    assert mock_run.call_count == 1
+
+    # A new cache object with the same file reuses the cached grading output
+    assert await judge_output(
+        'Hello world', 'Content contains a greeting', cache=JudgeCache(tmp_path / 'judge_cache.sqlite')
+    ) == GradingOutput(reason='Test passed', pass_=True, score=1.0)
+    assert mock_run.call_count == 1
+
+    # Anything that changes the prompt, model, model settings or judge is a cache miss
+    await judge_output('Hello world', 'Content is in English', cache=cache)
+    await judge_output('Hello world', 'Content contains a greeting', model='openai:gpt-4o-mini', cache=cache)
+    await judge_output(
+        'Hello world', 'Content contains a greeting', model_settings=ModelSettings(temperature=0), cache=cache
+    )
+    await judge_input_output('Hi', 'Hello world', 'Content contains a greeting', cache=cache)
+    assert mock_run.call_count == 5
+
+    # Refreshing calls the model again and replaces the cached grading output
+    mock_result.output = GradingOutput(reason='Test failed', pass_=False, score=0.0)
+    refreshed = await judge_output(
+        'Hello world', 'Content contains a greeting', cache=JudgeCache(cache.path, refresh=True)
+    )
+    assert refreshed == mock_result.output
+    assert mock_run.call_count == 6
+
+    # The default cache is used when none is passed
+    set_default_judge_cache(cache)
+    try:
+        assert await judge_output('Hello world', 'Content contains a greeting') == refreshed
+    finally:
+        set_default_judge_cache(None)
+    assert mock_run.call_count == 6
+
+
+async def test_llm_judge_cache(mocker: MockerFixture, tmp_path: Path):
+    """Test that `LLMJudge` uses its own cache, which is kept when the evaluator is sent to a worker process."""
+    mock_result = mocker.MagicMock()
+    mock_result.output = GradingOutput(reason='Test passed', pass_=True, score=1.0)
+    mock_run = mocker.patch('pydantic_ai.agent.AbstractAgent.run', return_value=mock_result)
+
+    ctx = EvaluatorContext[object, object, object](
+        name='test',
+        inputs='Hi',
+        metadata=None,
+        expected_output=None,
+        output='Hello world',
+        duration=0.0,
+        _span_tree=SpanTreeRecordingError('spans were not recorded'),
+        attributes={},
+        metrics={},
+    )
+    evaluator = LLMJudge(rubric='Content contains a greeting', cache=JudgeCache(tmp_path / 'judge_cache.sqlite'))
+    assert await evaluator.evaluate(ctx) == {'LLMJudge': EvaluationReason(value=True, reason='Test passed')}
+    assert await pickle.loads(pickle.dumps(evaluator)).evaluate(ctx) == {
+        'LLMJudge': EvaluationReason(value=True, reason='Test passed')
+    }
+    assert mock_run.call_count == 1
+
+    # The cache doesn't change the results, so it's not part of the evaluator's serialized form
+    assert evaluator.build_serialization_arguments() == snapshot({'rubric': 'Content contains a greeting'})
+
+    # The database can be used by concurrent worker processes
+    with sqlite3.connect(tmp_path / 'judge_cache.sqlite') as connection:
+        assert connection.execute('PRAGMA journal_mode').fetchone() == ('wal',)
+
+
 @pytest.mark.anyio
 async def test_judge_output_mock(mocker: MockerFixture):
     """Test judge_output function with mocked agent."""
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
 
+import anyio
 import pytest
 
 from pydantic_graph.beta import GraphBuilder, StepContext
-from pydantic_graph.beta.join import reduce_list_append
+from pydantic_graph.beta.join import ReducerContext, reduce_list_append
+from pydantic_graph.exceptions import GraphBuildingError
 
 pytestmark = pytest.mark.anyio
 
@@ -78,6 +82,155 @@ async def test_map_over_list():
     assert sorted(result) == [1, 4, 9, 16, 25]
 
 
+async def test_map_over_large_list():
+    """Test mapping a large list, where fork completion must not be checked against every active task."""
+    g = GraphBuilder(state_type=CounterState, output_type=list[int])
+
+    @g.step
+    async def generate_list(ctx: StepContext[CounterState, None, None]) -> list[int]:
+        return list(range(5_000))
+
+    @g.step
+    async def double(ctx: StepContext[CounterState, None, int]) -> int:
+        return ctx.inputs * 2
+
+    collect = g.join(reduce_list_append, initial_factory=list[int])
+
+    g.add_mapping_edge(generate_list, double)
+    g.add(
+        g.edge_from(g.start_node).to(generate_list),
+        g.edge_from(double).to(collect),
+        g.edge_from(collect).to(g.end_node),
+    )
+
+    graph = g.build()
+    result = await graph.run(state=CounterState())
+    assert sorted(result) == [i * 2 for i in range(5_000)]
+
+
+async def test_map_with_max_concurrency():
+    """Test that a map with `max_concurrency` pulls items lazily and limits how many are processed at once."""
+    g = GraphBuilder(state_type=CounterState, output_type=list[int])
+    pulled: list[int] = []
+    running = 0
+    max_running = 0
+
+    def numbers() -> Iterator[int]:
+        for i in range(10):
+            pulled.append(i)
+            yield i
+
+    @g.step
+    async def generate_numbers(ctx: StepContext[CounterState, None, None]) -> Iterator[int]:
+        return numbers()
+
+    @g.step
+    async def slow_square(ctx: StepContext[CounterState, None, int]) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # Items are only pulled from the iterable once there's a free slot
+        assert len(pulled) <= len(ctx.state.values) + 3
+        await anyio.sleep(0.001)
+        ctx.state.values.append(ctx.inputs)
+        running -= 1
+        return ctx.inputs * ctx.inputs
+
+    collect = g.join(reduce_list_append, initial_factory=list[int])
+
+    g.add_mapping_edge(generate_numbers, slow_square, max_concurrency=3)
+    g.add(
+        g.edge_from(g.start_node).to(generate_numbers),
+        g.edge_from(slow_square).to(collect),
+        g.edge_from(collect).to(g.end_node),
+    )
+
+    graph = g.build()
+    result = await graph.run(state=CounterState())
+    assert sorted(result) == [i * i for i in range(10)]
+    assert max_running == 3
+
+
+async def test_map_with_default_max_concurrency():
+    """Test that the graph's `max_map_concurrency` applies to async iterables and maps without their own limit."""
+    g = GraphBuilder(state_type=CounterState, output_type=list[int], max_map_concurrency=2)
+    running = 0
+    max_running = 0
+
+    @g.stream
+    async def generate_stream(ctx: StepContext[CounterState, None, None]) -> AsyncIterator[int]:
+        for i in range(6):
+            yield i
+
+    @g.step
+    async def slow_double(ctx: StepContext[CounterState, None, int]) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await anyio.sleep(0.001)
+        running -= 1
+        return ctx.inputs * 2
+
+    collect = g.join(reduce_list_append, initial_factory=list[int])
+
+    g.add(
+        g.edge_from(g.start_node).to(generate_stream),
+        g.edge_from(generate_stream).map().to(slow_double),
+        g.edge_from(slow_double).to(collect),
+        g.edge_from(collect).to(g.end_node),
+    )
+
+    graph = g.build()
+    result = await graph.run(state=CounterState())
+    assert sorted(result) == [0, 2, 4, 6, 8, 10]
+    assert max_running == 2
+
+
+async def test_map_with_max_concurrency_cancel_sibling_tasks():
+    """Test that no more items are pulled once the downstream join cancels its sibling tasks."""
+    g = GraphBuilder(state_type=CounterState, output_type=list[int])
+
+    @g.step
+    async def generate_numbers(ctx: StepContext[CounterState, None, None]) -> Iterator[int]:
+        return itertools.count()
+
+    @g.step
+    async def record(ctx: StepContext[CounterState, None, int]) -> int:
+        ctx.state.values.append(ctx.inputs)
+        return ctx.inputs
+
+    def reduce_first_three(ctx: ReducerContext[CounterState, None], current: list[int], inputs: int) -> list[int]:
+        current.append(inputs)
+        if len(current) == 3:
+            ctx.cancel_sibling_tasks()
+        return current
+
+    collect = g.join(reduce_first_three, initial_factory=list[int])
+
+    g.add_mapping_edge(generate_numbers, record, max_concurrency=1)
+    g.add(
+        g.edge_from(g.start_node).to(generate_numbers),
+        g.edge_from(record).to(collect),
+        g.edge_from(collect).to(g.end_node),
+    )
+
+    graph = g.build()
+    state = CounterState()
+    result = await graph.run(state=state)
+    assert result == [0, 1, 2]
+    assert state.values == [0, 1, 2]
+
+
+def test_map_max_concurrency_must_be_positive():
+    g = GraphBuilder(state_type=CounterState, output_type=list[int])
+
+    with pytest.raises(GraphBuildingError, match='`max_concurrency` must be at least 1, got 0.'):
+        g.edge_from(g.start_node).map(max_concurrency=0)
+
+    with pytest.raises(GraphBuildingError, match='`max_map_concurrency` must be at least 1, got 0.'):
+        GraphBuilder(max_map_concurrency=0)
+
+
 async def test_map_with_labels():
     """Test map operation with labeled edges."""
     g = GraphBuilder(state_type=CounterState, output_type=list[str])
@@ -16,7 +16,7 @@ from pydantic_graph import (
     GraphRunContext,
     NodeSnapshot,
 )
-from pydantic_graph.persistence.file import FileStatePersistence
+from pydantic_graph.persistence.file import FileStatePersistence, JournalFileStatePersistence
 
 from ..conftest import IsFloat, IsNow
 
@@ -201,3 +201,159 @@ async def test_record_lookup_error(tmp_path: Path):
     with pytest.raises(LookupError, match="No snapshot found with id='foobar'"):
         async with persistence.record_run('foobar'):
             pass
+
+
+async def test_journal_run(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalFileStatePersistence(p)
+    result = await my_graph.run(Float2String(3.14), persistence=persistence)
+    assert result.output == 8
+    assert await persistence.load_all() == snapshot(
+        [
+            NodeSnapshot(
+                state=None,
+                node=Float2String(input_data=3.14),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Float2String:1',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=String2Length(input_data='3.14'),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='String2Length:2',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=Double(input_data=4),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Double:3',
+            ),
+            EndSnapshot(state=None, result=End(data=8), ts=IsNow(tz=timezone.utc), id='end:4'),
+        ]
+    )
+    # Each snapshot and each status change was appended as a line
+    assert len(p.read_bytes().splitlines()) == 4 + 3 * 2
+
+
+async def test_journal_next_from_persistence(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalFileStatePersistence(p)
+
+    async with my_graph.iter(Float2String(3.14), persistence=persistence) as run:
+        node = await run.next()
+        assert node == snapshot(String2Length(input_data='3.14'))
+
+    # A new instance, e.g. in another process, picks up the run from the journal
+    persistence = JournalFileStatePersistence(p)
+    async with my_graph.iter_from_persistence(persistence) as run:
+        node = await run.next()
+        assert node == snapshot(Double(input_data=4))
+
+        node = await run.next()
+        assert node == snapshot(End(data=8))
+
+    snapshots = await persistence.load_all()
+    assert [(s.id, getattr(s, 'status', None)) for s in snapshots] == snapshot(
+        [
+            ('Float2String:1', 'success'),
+            ('String2Length:2', 'success'),
+            ('Double:3', 'success'),
+            ('end:4', None),
+        ]
+    )
+    assert await persistence.load_next() is None
+
+
+async def test_journal_node_error(tmp_path: Path, mock_snapshot_id: object):
+    @dataclass
+    class Foo(BaseNode):
+        async def run(self, ctx: GraphRunContext) -> Bar:
+            return Bar()
+
+    @dataclass
+    class Bar(BaseNode[None, None, None]):
+        async def run(self, ctx: GraphRunContext) -> End[None]:
+            raise RuntimeError('test error')
+
+    g = Graph(nodes=(Foo, Bar))
+    persistence = JournalFileStatePersistence(tmp_path / 'test_graph.jsonl')
+    with pytest.raises(RuntimeError, match='test error'):
+        await g.run(Foo(), persistence=persistence)
+
+    snapshots = await persistence.load_all()
+    assert [(s.id, s.status) for s in snapshots if isinstance(s, NodeSnapshot)] == snapshot(
+        [('Foo:1', 'success'), ('Bar:2', 'error')]
+    )
+
+
+@dataclass
+class CountDownState:
+    counter: int
+
+
+@dataclass
+class CountDown(BaseNode[CountDownState, None, int]):
+    async def run(self, ctx: GraphRunContext[CountDownState]) -> Union[CountDown, End[int]]:  # noqa: UP007
+        ctx.state.counter -= 1
+        if ctx.state.counter > 0:
+            return CountDown()
+        return End(ctx.state.counter)
+
+
+async def test_journal_compaction(tmp_path: Path):
+    g = Graph(nodes=(CountDown,))
+    p = tmp_path / 'count_down.jsonl'
+    persistence = JournalFileStatePersistence(p, compaction_threshold=5, fsync_interval=0)
+    result = await g.run(CountDown(), state=CountDownState(20), persistence=persistence)
+    assert result.output == 0
+
+    snapshots = await persistence.load_all()
+    assert [s.state.counter for s in snapshots] == [*range(20, 0, -1), 0]
+    assert all(s.status == 'success' for s in snapshots if isinstance(s, NodeSnapshot))
+    # Status changes were folded into the snapshots' lines when the journal was compacted
+    assert len(p.read_bytes().splitlines()) < 21 + 20 * 2
+    # The compacted journal can still be loaded by a fresh instance
+    fresh = JournalFileStatePersistence(p)
+    fresh.set_graph_types(g)
+    assert await fresh.load_all() == snapshots
+
+
+async def test_journal_ignores_partial_line(tmp_path: Path, mock_snapshot_id: object):
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    p = tmp_path / 'test_graph.jsonl'
+    persistence = JournalFileStatePersistence(p)
+    persistence.set_graph_types(my_graph)
+    await persistence.snapshot_node(None, Float2String(3.14))
+    # Simulate a process being part way through appending a line, or having crashed while doing so
+    with p.open('ab') as f:
+        f.write(b'{"kind": "status", "id": "Float2Str')
+
+    assert [s.id for s in await persistence.load_all()] == ['Float2String:1']
+    next_snapshot = await persistence.load_next()
+    assert next_snapshot is not None
+    assert next_snapshot.node == Float2String(3.14)
+    assert next_snapshot.status == 'pending'
+    # The partial line was discarded before appending the status change
+    assert [(s.id, s.status) for s in await persistence.load_all() if isinstance(s, NodeSnapshot)] == [
+        ('Float2String:1', 'pending')
+    ]
+
+
+async def test_journal_record_lookup_error(tmp_path: Path):
+    persistence = JournalFileStatePersistence(tmp_path / 'test_graph.jsonl')
+    my_graph = Graph(nodes=(Float2String, String2Length, Double))
+    persistence.set_graph_types(my_graph)
+
+    assert await persistence.load_all() == []
+    assert await persistence.load_next() is None
+    with pytest.raises(LookupError, match="No snapshot found with id='foobar'"):
+        async with persistence.record_run('foobar'):
+            pass
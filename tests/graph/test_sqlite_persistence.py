@@ -0,0 +1,195 @@
+from __future__ import annotations as _annotations
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import timezone
+from pathlib import Path
+from typing import Union
+
+import pytest
+from inline_snapshot import snapshot
+
+from pydantic_graph import (
+    BaseNode,
+    End,
+    EndSnapshot,
+    Graph,
+    GraphRunContext,
+    NodeSnapshot,
+)
+from pydantic_graph.exceptions import GraphNodeStatusError
+from pydantic_graph.persistence.sqlite import SqliteStatePersistence
+
+from ..conftest import IsFloat, IsNow
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class Float2String(BaseNode):
+    input_data: float
+
+    async def run(self, ctx: GraphRunContext) -> String2Length:
+        return String2Length(str(self.input_data))
+
+
+@dataclass
+class String2Length(BaseNode):
+    input_data: str
+
+    async def run(self, ctx: GraphRunContext) -> Double:
+        return Double(len(self.input_data))
+
+
+@dataclass
+class Double(BaseNode[None, None, int]):
+    input_data: int
+
+    async def run(self, ctx: GraphRunContext) -> Union[String2Length, End[int]]:  # noqa: UP007
+        if self.input_data == 7:  # pragma: no cover
+            return String2Length('x' * 21)
+        else:
+            return End(self.input_data * 2)
+
+
+my_graph = Graph(nodes=(Float2String, String2Length, Double))
+
+
+async def test_run(tmp_path: Path, mock_snapshot_id: object):
+    persistence = SqliteStatePersistence(tmp_path / 'graph.db', run_id='run_1')
+    result = await my_graph.run(Float2String(3.14), persistence=persistence)
+    assert result.output == 8
+    assert await persistence.load_all() == snapshot(
+        [
+            NodeSnapshot(
+                state=None,
+                node=Float2String(input_data=3.14),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Float2String:1',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=String2Length(input_data='3.14'),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='String2Length:2',
+            ),
+            NodeSnapshot(
+                state=None,
+                node=Double(input_data=4),
+                start_ts=IsNow(tz=timezone.utc),
+                duration=IsFloat(),
+                status='success',
+                id='Double:3',
+            ),
+            EndSnapshot(state=None, result=End(data=8), ts=IsNow(tz=timezone.utc), id='end:4'),
+        ]
+    )
+
+
+async def test_next_from_persistence(tmp_path: Path, mock_snapshot_id: object):
+    database = tmp_path / 'graph.db'
+    persistence = SqliteStatePersistence(database, run_id='run_1')
+
+    async with my_graph.iter(Float2String(3.14), persistence=persistence) as run:
+        node = await run.next()
+        assert node == snapshot(String2Length(input_data='3.14'))
+
+    persistence = SqliteStatePersistence(database, run_id='run_1')
+    async with my_graph.iter_from_persistence(persistence) as run:
+        node = await run.next()
+        assert node == snapshot(Double(input_data=4))
+
+        node = await run.next()
+        assert node == snapshot(End(data=8))
+
+    snapshots = await persistence.load_all()
+    assert [(s.id, getattr(s, 'status', None)) for s in snapshots] == snapshot(
+        [
+            ('Float2String:1', 'success'),
+            ('String2Length:2', 'success'),
+            ('Double:3', 'success'),
+            ('end:4', None),
+        ]
+    )
+    assert await persistence.load_next() is None
+
+
+async def test_concurrent_runs(tmp_path: Path):
+    database = tmp_path / 'graph.db'
+    persistences = [SqliteStatePersistence(database, run_id=f'run_{i}') for i in range(3)]
+    for i, persistence in enumerate(persistences):
+        result = await my_graph.run(Float2String(i + 0.5), persistence=persistence)
+        assert result.output == 6
+
+    for i, persistence in enumerate(persistences):
+        snapshots = await persistence.load_all()
+        assert [s.node for s in snapshots] == [
+            Float2String(i + 0.5),
+            String2Length(str(i + 0.5)),
+            Double(3),
+            End(6),
+        ]
+
+    # All runs are stored in one table that can be queried directly
+    with sqlite3.connect(database) as connection:
+        rows = connection.execute(
+            'SELECT run_id, COUNT(*) FROM graph_snapshots GROUP BY run_id ORDER BY run_id'
+        ).fetchall()
+    assert rows == [('run_0', 4), ('run_1', 4), ('run_2', 4)]
+
+
+async def test_node_error(tmp_path: Path, mock_snapshot_id: object):
+    @dataclass
+    class Foo(BaseNode):
+        async def run(self, ctx: GraphRunContext) -> Bar:
+            return Bar()
+
+    @dataclass
+    class Bar(BaseNode[None, None, None]):
+        async def run(self, ctx: GraphRunContext) -> End[None]:
+            raise RuntimeError('test error')
+
+    g = Graph(nodes=(Foo, Bar))
+    persistence = SqliteStatePersistence(tmp_path / 'graph.db', run_id='run_1')
+    with pytest.raises(RuntimeError, match='test error'):
+        await g.run(Foo(), persistence=persistence)
+
+    snapshots = await persistence.load_all()
+    assert [(s.id, s.status) for s in snapshots if isinstance(s, NodeSnapshot)] == snapshot(
+        [('Foo:1', 'success'), ('Bar:2', 'error')]
+    )
+
+
+async def test_status_transitions(tmp_path: Path, mock_snapshot_id: object):
+    persistence = SqliteStatePersistence(tmp_path / 'graph.db', run_id='run_1')
+    persistence.set_graph_types(my_graph)
+
+    await persistence.snapshot_node_if_new('Float2String:1', None, Float2String(1.0))
+    await persistence.snapshot_node_if_new('Float2String:1', None, Float2String(1.0))
+    assert [s.id for s in await persistence.load_all()] == ['Float2String:1']
+
+    snapshot_ = await persistence.load_next()
+    assert snapshot_ is not None
+    assert snapshot_.status == 'pending'
+    # A snapshot can only be claimed once
+    assert await persistence.load_next() is None
+
+    async with persistence.record_run('Float2String:1'):
+        pass
+    with pytest.raises(GraphNodeStatusError, match="Incorrect snapshot status 'success'"):
+        async with persistence.record_run('Float2String:1'):
+            pass
+
+
+async def test_record_lookup_error(tmp_path: Path):
+    persistence = SqliteStatePersistence(tmp_path / 'graph.db', run_id='run_1')
+    persistence.set_graph_types(my_graph)
+
+    assert await persistence.load_all() == []
+    with pytest.raises(LookupError, match="No snapshot found with id='foobar'"):
+        async with persistence.record_run('foobar'):
+            pass
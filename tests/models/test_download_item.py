@@ -1,7 +1,19 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
 import pytest
+from inline_snapshot import snapshot
 
-from pydantic_ai import AudioUrl, DocumentUrl, ImageUrl, VideoUrl
-from pydantic_ai.models import UserError, download_item
+from pydantic_ai import AudioUrl, BinaryContent, DocumentUrl, ImageUrl, VideoUrl
+from pydantic_ai.models import (
+    DownloadCacheInfo,
+    UserError,
+    configure_download_cache,
+    download_cache_clear,
+    download_cache_info,
+    download_item,
+)
 
 from ..conftest import IsInstance, IsStr
 
@@ -75,3 +87,108 @@ async def test_download_item_no_content_type() -> None:
     )
     assert downloaded_item['data_type'] == 'text/markdown'
     assert downloaded_item['data'] == IsStr()
+
+
+class _FileServer:
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+        self.content = b'%PDF-1.4 content'
+        self.requests: list[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = self.headers.get('etag')
+        if etag is not None and request.headers.get('if-none-match') == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, headers={'content-type': 'application/pdf', **self.headers}, content=self.content)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+
+def _spilled_files(path: Path) -> list[Path]:
+    return list(path.glob('*.download'))
+
+
+@pytest.fixture
+def restore_download_cache():
+    yield
+    configure_download_cache()
+
+
+async def test_download_item_cached(restore_download_cache: None) -> None:
+    server = _FileServer({'etag': '"v1"'})
+    document = DocumentUrl(url='https://example.com/document.pdf')
+
+    with patch('pydantic_ai.models.cached_async_http_client', return_value=server.client()):
+        configure_download_cache(ttl=60)
+        first = await download_item(document, data_format='base64')
+        second = await download_item(document, data_format='base64_uri')
+        assert len(server.requests) == 1
+        assert first['data'] == BinaryContent(server.content, media_type='application/pdf').base64
+        assert second['data'] == f'data:application/pdf;base64,{first["data"]}'
+
+        # Once stale, the content is revalidated using its ETag rather than downloaded again
+        configure_download_cache(ttl=0)
+        await download_item(document, data_format='bytes')
+        await download_item(document, data_format='bytes')
+        assert [request.headers.get('if-none-match') for request in server.requests] == [None, None, '"v1"']
+        assert download_cache_info() == snapshot(
+            DownloadCacheInfo(hits=0, revalidations=1, misses=1, max_bytes=67108864, currbytes=16)
+        )
+
+        # Changed content is downloaded again
+        server.headers['etag'] = '"v2"'
+        server.content = b'%PDF-1.4 changed'
+        assert (await download_item(document, data_format='bytes'))['data'] == b'%PDF-1.4 changed'
+
+
+async def test_download_item_cache_control(restore_download_cache: None) -> None:
+    server = _FileServer({'cache-control': 'no-store'})
+    image = ImageUrl(url='https://example.com/image.png')
+
+    with patch('pydantic_ai.models.cached_async_http_client', return_value=server.client()):
+        await download_item(image)
+        await download_item(image)
+        assert len(server.requests) == 2
+
+        # Content that can't be revalidated is only cached if the response says for how long
+        server.headers['cache-control'] = 'public'
+        await download_item(image)
+        await download_item(image)
+        assert len(server.requests) == 4
+
+        server.headers['cache-control'] = 'public, max-age=3600'
+        configure_download_cache(ttl=0)
+        await download_item(image)
+        await download_item(image)
+        assert len(server.requests) == 5
+
+        # The cache can be disabled entirely
+        configure_download_cache(max_bytes=0)
+        assert download_cache_info() is None
+        await download_item(image)
+        assert len(server.requests) == 6
+
+
+async def test_download_item_cache_disk_spill(tmp_path: Path, restore_download_cache: None) -> None:
+    server = _FileServer({'etag': '"v1"'})
+    first = DocumentUrl(url='https://example.com/first.pdf')
+    second = DocumentUrl(url='https://example.com/second.pdf')
+
+    with patch('pydantic_ai.models.cached_async_http_client', return_value=server.client()):
+        configure_download_cache(max_bytes=20, disk_path=tmp_path)
+        await download_item(first)
+        await download_item(second)
+        assert len(_spilled_files(tmp_path)) == 1
+
+        # The first document was spilled to disk when the second was cached, and is read back from there
+        assert (await download_item(first))['data'] == server.content
+        assert len(server.requests) == 2
+
+        # Spilled content is bounded by size too, and cleared along with the cache
+        configure_download_cache(max_bytes=1, disk_path=tmp_path, max_disk_bytes=200)
+        await download_item(ImageUrl(url='https://example.com/image.png'))
+        assert len(_spilled_files(tmp_path)) == 1
+        download_cache_clear()
+        assert _spilled_files(tmp_path) == []
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import gc
+import json
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Literal
 
+import anyio
 import pytest
 from inline_snapshot import snapshot
 from inline_snapshot.extra import warns
@@ -1789,3 +1792,135 @@ async def test_instrumented_model_count_tokens(capfire: CaptureLogfire):
         messages, model_settings=ModelSettings(), model_request_parameters=ModelRequestParameters()
     )
     assert usage == RequestUsage(input_tokens=10)
+
+
+def test_cached_otel_messages_json():
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[SystemPromptPart('system'), UserPromptPart('user_prompt')]),
+        ModelResponse(parts=[TextPart('text'), ToolCallPart('my_tool', {'a': 13})], finish_reason='tool_call'),
+        ModelRequest(parts=[ToolReturnPart('my_tool', 'tool_return', tool_call_id='tool_call_id')]),
+    ]
+    settings = InstrumentationSettings(cache_messages=True)
+    expected = json.dumps(settings.messages_to_otel_messages(messages))
+    assert settings.otel_messages_json(messages) == expected
+    assert settings.otel_messages_json(messages) == expected
+    assert settings.otel_messages_json([]) == '[]'
+
+    # Replacing the parts of a message, like reevaluating dynamic system prompts does, invalidates its cache entry
+    messages[0].parts = [SystemPromptPart('new system'), UserPromptPart('user_prompt')]
+    assert settings.otel_messages_json(messages) == json.dumps(settings.messages_to_otel_messages(messages))
+    assert 'new system' in settings.otel_messages_json(messages)
+
+    del messages[0]
+    gc.collect()
+    assert len(settings._otel_message_cache) == 2  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.parametrize('stream', [False, True])
+async def test_instrumented_model_incremental_messages(capfire: CaptureLogfire, stream: bool):
+    model = InstrumentedModel(MyModel(), InstrumentationSettings(cache_messages=True, incremental_messages=True))
+    parameters = ModelRequestParameters()
+
+    async def request(messages: list[ModelMessage]) -> ModelResponse:
+        if not stream:
+            return await model.request(messages, None, parameters)
+        async with model.request_stream(messages, None, parameters) as response_stream:
+            async for _ in response_stream:
+                pass
+        # The response that ends up in the message history is a different object than the one that was recorded
+        return response_stream.get()
+
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart('first')])]
+    messages.extend([await request(messages), ModelRequest(parts=[UserPromptPart('second')])])
+    messages.extend([await request(messages), ModelRequest(parts=[UserPromptPart('third')])])
+    await request(messages)
+    # Requests that don't continue from the last recorded response record all messages
+    await request(messages[:1])
+
+    spans = capfire.exporter.exported_spans_as_dict(parse_json_attributes=True)
+    assert [[m['parts'][0].get('content') for m in span['attributes']['gen_ai.input.messages']] for span in spans] == [
+        ['first'],
+        ['second'],
+        ['third'],
+        ['first'],
+    ]
+    assert [span['attributes'].get('pydantic_ai.previous_request.span_id') for span in spans] == [
+        None,
+        format(spans[0]['context']['span_id'], '016x'),
+        format(spans[1]['context']['span_id'], '016x'),
+        None,
+    ]
+    finished_spans = [
+        span
+        for span in capfire.exporter.exported_spans
+        if (span.attributes or {}).get('logfire.span_type') != 'pending_span'
+    ]
+    assert [[link.context.span_id for link in span.links] for span in finished_spans] == [
+        [],
+        [spans[0]['context']['span_id']],
+        [spans[1]['context']['span_id']],
+        [],
+    ]
+
+
+class FixedTimestampModel(MyModel):
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        response = await super().request(messages, model_settings, model_request_parameters)
+        # Like providers that report response timestamps with a resolution of a second
+        response.timestamp = datetime(2022, 1, 1)
+        return response
+
+
+@pytest.mark.parametrize('stream', [False, True])
+async def test_instrumented_model_incremental_messages_concurrent(capfire: CaptureLogfire, stream: bool):
+    model = InstrumentedModel(
+        FixedTimestampModel(), InstrumentationSettings(cache_messages=True, incremental_messages=True)
+    )
+    parameters = ModelRequestParameters()
+
+    async def request(messages: list[ModelMessage]) -> ModelResponse:
+        if not stream:
+            return await model.request(messages, None, parameters)
+        async with model.request_stream(messages, None, parameters) as response_stream:
+            async for _ in response_stream:
+                pass
+        return response_stream.get()
+
+    # Two conversations get identical responses with the same timestamp
+    conversations: dict[str, list[ModelMessage]] = {name: [ModelRequest(parts=[UserPromptPart(name)])] for name in 'ab'}
+
+    async def converse(messages: list[ModelMessage]) -> None:
+        messages.append(await request(messages))
+
+    async with anyio.create_task_group() as tg:
+        for messages in conversations.values():
+            tg.start_soon(converse, messages)
+
+    conversations['a'].append(ModelRequest(parts=[UserPromptPart('a2')]))
+    await request(conversations['a'])
+
+    spans = capfire.exporter.exported_spans_as_dict(parse_json_attributes=True)
+    first_span_ids = {
+        span['attributes']['gen_ai.input.messages'][0]['parts'][0]['content']: format(
+            span['context']['span_id'], '016x'
+        )
+        for span in spans[:2]
+    }
+    last_span = spans[2]
+    if stream:
+        # Rebuilt streamed responses can't be told apart, so all messages are recorded rather than linking to the
+        # wrong conversation
+        assert 'pydantic_ai.previous_request.span_id' not in last_span['attributes']
+        assert [m['parts'][0].get('content') for m in last_span['attributes']['gen_ai.input.messages']] == [
+            'a',
+            'text1text2',
+            'a2',
+        ]
+    else:
+        assert last_span['attributes']['pydantic_ai.previous_request.span_id'] == first_span_ids['a']
+        assert [m['parts'][0].get('content') for m in last_span['attributes']['gen_ai.input.messages']] == ['a2']
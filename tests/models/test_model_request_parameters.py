@@ -1,6 +1,7 @@
 from inline_snapshot import snapshot
 from pydantic import TypeAdapter
 
+from pydantic_ai._json_schema import JsonSchema
 from pydantic_ai.builtin_tools import (
     CodeExecutionTool,
     ImageGenerationTool,
@@ -10,7 +11,15 @@ from pydantic_ai.builtin_tools import (
     WebSearchTool,
     WebSearchUserLocation,
 )
-from pydantic_ai.models import ModelRequestParameters, ToolDefinition
+from pydantic_ai.models import (
+    JsonSchemaTransformCacheInfo,
+    ModelRequestParameters,
+    ToolDefinition,
+    json_schema_transform_cache_clear,
+    json_schema_transform_cache_info,
+)
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.profiles import JsonSchemaTransformer, ModelProfile
 
 ta = TypeAdapter(ModelRequestParameters)
 
@@ -142,3 +151,45 @@ def test_model_request_parameters_are_serializable():
         }
     )
     assert ta.validate_python(dumped) == params
+
+
+def test_customize_request_parameters_reuses_transformed_schemas():
+    walked: list[JsonSchema] = []
+
+    class RecordingTransformer(JsonSchemaTransformer):
+        def transform(self, schema: JsonSchema) -> JsonSchema:
+            walked.append(schema)
+            return {**schema, 'description': 'transformed'}
+
+    model = TestModel(profile=ModelProfile(json_schema_transformer=RecordingTransformer))
+    json_schema_transform_cache_clear()
+
+    def make_params() -> ModelRequestParameters:
+        # Equal but freshly built schemas, as tool definitions are rebuilt for each step
+        return ModelRequestParameters(
+            function_tools=[
+                ToolDefinition(name='a', parameters_json_schema={'type': 'object', 'properties': {}}),
+                ToolDefinition(name='b', parameters_json_schema={'type': 'object', 'properties': {}}, strict=True),
+            ],
+        )
+
+    first = model.customize_request_parameters(make_params())
+    assert len(walked) == 2
+    assert json_schema_transform_cache_info() == snapshot(
+        JsonSchemaTransformCacheInfo(hits=0, misses=2, maxsize=1024, currsize=2)
+    )
+
+    second = model.customize_request_parameters(make_params())
+    assert len(walked) == 2
+    assert second.function_tools == first.function_tools
+    assert second.function_tools[0].parameters_json_schema == snapshot(
+        {'type': 'object', 'properties': {}, 'description': 'transformed'}
+    )
+    assert json_schema_transform_cache_info() == snapshot(
+        JsonSchemaTransformCacheInfo(hits=2, misses=2, maxsize=1024, currsize=2)
+    )
+
+    json_schema_transform_cache_clear()
+    assert json_schema_transform_cache_info() == snapshot(
+        JsonSchemaTransformCacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+    )
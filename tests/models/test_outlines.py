@@ -7,10 +7,12 @@ from __future__ import annotations as _annotations
 
 import json
 import os
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import anyio
 import pytest
 from inline_snapshot import snapshot
 from pydantic import BaseModel
@@ -44,7 +46,7 @@ from ..conftest import IsDatetime, IsInstance, IsStr, try_import
 with try_import() as imports_successful:
     import outlines
 
-    from pydantic_ai.models.outlines import OutlinesAsyncBaseModel, OutlinesModel
+    from pydantic_ai.models.outlines import OutlinesAsyncBaseModel, OutlinesBaseModel, OutlinesModel, Transformers
     from pydantic_ai.providers.outlines import OutlinesProvider
 
 with try_import() as transformer_imports_successful:
@@ -431,6 +433,111 @@ async def test_request_streaming_async_model(mock_async_model: OutlinesModel) ->
             assert len(text) > 0
 
 
+class MockOutlinesSyncModel(OutlinesBaseModel):
+    """Mock a synchronous local Outlines model, recording the thread each generation runs in."""
+
+    def __init__(self):
+        self.threads: list[threading.Thread] = []
+
+    def __call__(self, model_input: Any, output_type: Any, backend: Any, **inference_kwargs: Any) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
+        self.threads.append(threading.current_thread())
+        return 'test'
+
+    def stream(self, model_input: Any, output_type: Any, backend: Any, **inference_kwargs: Any):  # pyright: ignore[reportIncompatibleMethodOverride]
+        for _ in range(2):
+            self.threads.append(threading.current_thread())
+            yield 'test'
+
+    def generate(self, model_input: Any, output_type: Any, **inference_kwargs: Any): ...  # pragma: no cover
+
+    def generate_batch(self, model_input: Any, output_type: Any, **inference_kwargs: Any): ...  # pragma: no cover
+
+    def generate_stream(self, model_input: Any, output_type: Any, **inference_kwargs: Any): ...  # pragma: no cover
+
+
+async def test_request_sync_model_runs_in_thread() -> None:
+    outlines_model = MockOutlinesSyncModel()
+    agent = Agent(OutlinesModel(outlines_model, provider=OutlinesProvider()))
+
+    result = await agent.run('What is the capital of France?')
+    assert result.output == 'test'
+    assert outlines_model.threads and threading.main_thread() not in outlines_model.threads
+
+
+async def test_request_streaming_sync_model_runs_in_thread() -> None:
+    outlines_model = MockOutlinesSyncModel()
+    agent = Agent(OutlinesModel(outlines_model, provider=OutlinesProvider()))
+
+    async with agent.run_stream('What is the capital of the UK?') as response:
+        assert await response.get_output() == 'testtest'
+    assert len(outlines_model.threads) == 2
+    assert threading.main_thread() not in outlines_model.threads
+
+
+async def test_request_batching() -> None:
+    class MockTransformers(Transformers):
+        def __init__(self):
+            self.batches: list[int] = []
+
+        def __call__(self, model_input: Any, output_type: Any, backend: Any, **inference_kwargs: Any) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
+            self.batches.append(1)
+            return 'single'
+
+        def batch(self, model_input: list[Any], output_type: Any, backend: Any, **inference_kwargs: Any) -> list[str]:  # pyright: ignore[reportIncompatibleMethodOverride]
+            self.batches.append(len(model_input))
+            return [f'batched {i}' for i in range(len(model_input))]
+
+    outlines_model = MockTransformers()
+    agent = Agent(OutlinesModel(outlines_model, provider=OutlinesProvider(), max_batch_size=3, batch_wait=10))
+
+    outputs: list[str] = []
+
+    async def run(prompt: str) -> None:
+        outputs.append((await agent.run(prompt)).output)
+
+    async with anyio.create_task_group() as tg:
+        for prompt in ['a', 'b', 'c']:
+            tg.start_soon(run, prompt)
+
+    assert outlines_model.batches == [3]
+    assert sorted(outputs) == ['batched 0', 'batched 1', 'batched 2']
+
+    # A request that doesn't get joined by any others is generated on its own once `batch_wait` has passed
+    agent = Agent(OutlinesModel(outlines_model, provider=OutlinesProvider(), max_batch_size=3, batch_wait=0.01))
+    assert (await agent.run('d')).output == 'single'
+    assert outlines_model.batches == [3, 1]
+
+
+async def test_request_batching_error() -> None:
+    class FailingTransformers(Transformers):
+        def __init__(self):
+            pass
+
+        def batch(self, model_input: list[Any], output_type: Any, backend: Any, **inference_kwargs: Any) -> list[str]:  # pyright: ignore[reportIncompatibleMethodOverride]
+            raise RuntimeError('Generation failed')
+
+    agent = Agent(OutlinesModel(FailingTransformers(), provider=OutlinesProvider(), max_batch_size=2, batch_wait=10))
+
+    errors: list[str] = []
+
+    async def run(prompt: str) -> None:
+        try:
+            await agent.run(prompt)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    async with anyio.create_task_group() as tg:
+        for prompt in ['a', 'b']:
+            tg.start_soon(run, prompt)
+
+    assert errors == ['Generation failed', 'Generation failed']
+
+
+def test_request_batching_unsupported_model() -> None:
+    with pytest.raises(UserError, match='Request batching is only supported for Transformers and vLLM offline'):
+        OutlinesModel(MockOutlinesSyncModel(), provider=OutlinesProvider(), max_batch_size=2)
+
+
 async def test_tool_definition_error_async_model(mock_async_model: OutlinesModel) -> None:
     """Test that function tools raise UserError with async model."""
     agent = Agent(mock_async_model)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+
+import anyio
+import pytest
+from inline_snapshot import snapshot
+
+from pydantic_ai import Agent, ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.rate_limited import RateLimitedModel, RateLimitedModelSettings
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.usage import RequestUsage
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_max_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_response(_messages: list[ModelMessage], _info: AgentInfo) -> ModelResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await anyio.sleep(0.01)
+        in_flight -= 1
+        return ModelResponse(parts=[TextPart('success')])
+
+    agent = Agent(RateLimitedModel(FunctionModel(slow_response), max_concurrency=2))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(6):
+            tg.start_soon(agent.run, 'Hello')
+
+    assert max_in_flight == 2
+
+
+async def test_max_concurrency_streaming():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_stream(_messages: list[ModelMessage], _info: AgentInfo) -> AsyncIterator[str]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        yield 'hello '
+        await anyio.sleep(0.01)
+        yield 'world'
+        in_flight -= 1
+
+    agent = Agent(RateLimitedModel(FunctionModel(stream_function=slow_stream), max_concurrency=1))
+
+    async def run_stream():
+        async with agent.run_stream('Hello') as result:
+            assert await result.get_output() == 'hello world'
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(run_stream)
+
+    assert max_in_flight == 1
+
+
+async def test_requests_per_minute():
+    # 6000 requests per minute refill at 100 per second, so once the bucket is drained each request waits ~10ms
+    model = RateLimitedModel(TestModel(), requests_per_minute=6000)
+    agent = Agent(model)
+    assert model._request_bucket is not None  # pyright: ignore[reportPrivateUsage]
+    model._request_bucket.consume(6000)  # pyright: ignore[reportPrivateUsage]
+
+    start = time.monotonic()
+    for _ in range(3):
+        await agent.run('Hello')
+    assert time.monotonic() - start >= 0.025
+
+
+async def test_tokens_per_minute():
+    def expensive_response(_messages: list[ModelMessage], _info: AgentInfo) -> ModelResponse:
+        return ModelResponse(parts=[TextPart('success')], usage=RequestUsage(input_tokens=6_000, output_tokens=10))
+
+    # 6000 tokens per minute refill at 100 per second, so the second request has to wait for the overspend to recover
+    model = RateLimitedModel(FunctionModel(expensive_response), tokens_per_minute=6000)
+    agent = Agent(model)
+
+    start = time.monotonic()
+    await agent.run('Hello')
+    assert time.monotonic() - start < 0.1
+    await agent.run('Hello')
+    assert time.monotonic() - start >= 0.1
+
+
+async def test_count_tokens_before_request():
+    counted: list[int] = []
+
+    class CountingTestModel(TestModel):
+        async def count_tokens(self, *args: object, **kwargs: object) -> RequestUsage:
+            counted.append(100)
+            return RequestUsage(input_tokens=100)
+
+    model = RateLimitedModel(CountingTestModel(), tokens_per_minute=100_000, count_tokens_before_request=True)
+    result = await Agent(model).run('Hello')
+
+    assert result.output == snapshot('success (no tool calls)')
+    assert counted == [100]
+
+
+def test_limits_from_settings():
+    model = RateLimitedModel(
+        TestModel(settings=RateLimitedModelSettings(rate_limit_max_concurrency=3, rate_limit_requests_per_minute=60)),
+        tokens_per_minute=1000,
+    )
+    assert (model.max_concurrency, model.requests_per_minute, model.tokens_per_minute) == (3, 60, 1000)
+    assert model.model_name == 'test'
@@ -50,6 +50,7 @@ from pydantic_ai import (
     VideoUrl,
     capture_run_messages,
 )
+from pydantic_ai._agent_graph import build_agent_graph
 from pydantic_ai._output import (
     NativeOutput,
     NativeOutputSchema,
@@ -826,6 +827,30 @@ class Bar(BaseModel):
     assert got_tool_call_name == snapshot('final_result_Bar')
 
 
+def test_agent_graph_reused_across_runs():
+    agent = Agent(TestModel(), name='my_agent')
+
+    graph = build_agent_graph(agent.name, agent.deps_type, str)
+    assert build_agent_graph(agent.name, agent.deps_type, int) is graph
+    assert build_agent_graph('other_agent', agent.deps_type, str) is not graph
+    assert agent.run_sync('Hello').output == 'success (no tool calls)'
+
+
+def test_run_output_type_schema_reused():
+    agent = Agent(TestModel())
+    prepare_output_schema = agent._prepare_output_schema  # pyright: ignore[reportPrivateUsage]
+
+    assert prepare_output_schema(Foo) is prepare_output_schema(Foo)
+    assert prepare_output_schema([Foo, str]) is prepare_output_schema([Foo, str])
+
+    # Unhashable output specs are built for each run
+    output_type = [ToolOutput(Foo)]
+    assert prepare_output_schema(output_type) is not prepare_output_schema(output_type)
+
+    result = agent.run_sync('Hello', output_type=Foo)
+    assert isinstance(result.output, Foo)
+
+
 def test_output_type_generic_class_name_sanitization():
     """Test that generic class names with brackets are properly sanitized."""
     # This will have a name like "ResultGeneric[StringData]" which needs sanitization
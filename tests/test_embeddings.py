@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import base64
 import os
 import sys
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from dataclasses import replace
 from decimal import Decimal
+from pathlib import Path
 from typing import Any, get_args
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
 from inline_snapshot import snapshot
 
@@ -24,6 +28,12 @@ from pydantic_ai.embeddings import (
     TestEmbeddingModel,
     infer_embedding_model,
 )
+from pydantic_ai.embeddings.cache import (
+    InMemoryEmbeddingCache,
+    SQLiteEmbeddingCache,
+    embedding_cache_key,
+)
+from pydantic_ai.embeddings.result import EmbedInputType
 from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError, UserError
 from pydantic_ai.models.instrumented import InstrumentationSettings
 from pydantic_ai.usage import RequestUsage
@@ -37,6 +47,9 @@ pytestmark = [
 with try_import() as logfire_imports_successful:
     from logfire.testing import CaptureLogfire
 
+with try_import() as numpy_imports_successful:
+    import numpy as np
+
 with try_import() as openai_imports_successful:
     from pydantic_ai.embeddings.openai import LatestOpenAIEmbeddingModelNames, OpenAIEmbeddingModel
     from pydantic_ai.providers.gateway import GATEWAY_BASE_URL
@@ -114,6 +127,8 @@ class TestOpenAI:
         assert 'azure.com' in model.base_url
 
         assert await model.max_input_tokens() is None
+        assert model.max_batch_size is None
+        assert model.max_batch_tokens is None
         with pytest.raises(UserError, match='Counting tokens is not supported for non-OpenAI embedding models'):
             await model.count_tokens('Hello, world!')
 
@@ -1552,6 +1567,227 @@ async def test_settings():
     )
 
 
+async def test_embed_in_batches():
+    batches: list[list[str]] = []
+
+    class BatchRecordingModel(TestEmbeddingModel):
+        async def embed(
+            self, inputs: str | Sequence[str], *, input_type: EmbedInputType, settings: EmbeddingSettings | None = None
+        ) -> EmbeddingResult:
+            batches.append(list(inputs))
+            return await super().embed(inputs, input_type=input_type, settings=settings)
+
+    model = BatchRecordingModel(settings={'max_batch_size': 3})
+    embedder = Embedder(model)
+    inputs = [f'input {i}' for i in range(7)]
+
+    result = await embedder.embed_documents(inputs)
+    assert batches == snapshot([['input 0', 'input 1', 'input 2'], ['input 3', 'input 4', 'input 5'], ['input 6']])
+    assert result.inputs == inputs
+    assert len(result.embeddings) == 7
+    assert result.usage == RequestUsage(input_tokens=14)
+    assert result.provider_response_id is None
+
+    # Inputs that fit in a single batch are embedded in a single request
+    batches.clear()
+    result = await embedder.embed_documents(inputs[:3])
+    assert batches == [inputs[:3]]
+    assert result.provider_response_id is not None
+
+    # Token limits are estimated using the UTF-8 byte length, and an input exceeding the limit is sent on its own
+    batches.clear()
+    await embedder.embed_documents(['aaaa', 'bb', 'cc', 'd' * 10, 'é'], settings={'max_batch_tokens': 6})
+    assert batches == snapshot([['aaaa', 'bb'], ['cc'], ['dddddddddd'], ['é']])
+
+
+async def test_embed_in_batches_max_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    class SlowModel(TestEmbeddingModel):
+        async def embed(
+            self, inputs: str | Sequence[str], *, input_type: EmbedInputType, settings: EmbeddingSettings | None = None
+        ) -> EmbeddingResult:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await anyio.sleep(0.01)
+            in_flight -= 1
+            return await super().embed(inputs, input_type=input_type, settings=settings)
+
+    embedder = Embedder(SlowModel(), settings={'max_batch_size': 1, 'max_concurrency': 2})
+    result = await embedder.embed_query([str(i) for i in range(6)])
+    assert result.inputs == ['0', '1', '2', '3', '4', '5']
+    assert max_in_flight == 2
+
+
+@pytest.mark.skipif(not openai_imports_successful(), reason='OpenAI not installed')
+def test_openai_batch_limits():
+    model = OpenAIEmbeddingModel('text-embedding-3-small', provider=OpenAIProvider(api_key='test'))
+    assert model.max_batch_size == 2048
+    assert model.max_batch_tokens == 300_000
+
+
+async def test_embed_cached():
+    embedded: list[list[str]] = []
+
+    class RecordingModel(TestEmbeddingModel):
+        async def embed(
+            self, inputs: str | Sequence[str], *, input_type: EmbedInputType, settings: EmbeddingSettings | None = None
+        ) -> EmbeddingResult:
+            embedded.append(list(inputs))
+            return await super().embed(inputs, input_type=input_type, settings=settings)
+
+    cache = InMemoryEmbeddingCache()
+    embedder = Embedder(RecordingModel(), cache=cache)
+
+    result = await embedder.embed_documents(['a', 'bb', 'a'])
+    assert embedded == [['a', 'bb']]
+    assert result.inputs == ['a', 'bb', 'a']
+    assert len(result.embeddings) == 3
+    assert result.usage == RequestUsage(input_tokens=2)
+    assert len(cache) == 2
+
+    # Only cache misses are sent to the model, and usage only reflects them
+    result = await embedder.embed_documents(['bb', 'ccc', 'a'])
+    assert embedded == [['a', 'bb'], ['ccc']]
+    assert result.inputs == ['bb', 'ccc', 'a']
+    assert len(result.embeddings) == 3
+    assert result.usage == RequestUsage(input_tokens=1)
+
+    # Full cache hits don't call the model at all
+    result = await embedder.embed_documents(['a', 'ccc'])
+    assert embedded == [['a', 'bb'], ['ccc']]
+    assert result.inputs == ['a', 'ccc']
+    assert result.usage == RequestUsage()
+    assert result.model_name == 'test'
+    assert result.provider_name == 'test'
+
+    # The input type and dimensions are part of the cache key
+    await embedder.embed_query('a')
+    await embedder.embed_documents('a', settings={'dimensions': 4})
+    assert embedded == [['a', 'bb'], ['ccc'], ['a'], ['a']]
+    result = await embedder.embed_documents('a', settings={'dimensions': 4})
+    assert len(embedded) == 4
+    assert len(result.embeddings[0]) == 4
+
+
+async def test_in_memory_embedding_cache_eviction():
+    cache = InMemoryEmbeddingCache(max_size=2)
+    await cache.set({'a': [1.0], 'b': [2.0]})
+    assert await cache.get(['a']) == [[1.0]]
+    await cache.set({'c': [3.0]})
+    assert await cache.get(['a', 'b', 'c']) == [[1.0], None, [3.0]]
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+async def test_sqlite_embedding_cache(tmp_path: Path):
+    path = tmp_path / 'cache' / 'embeddings.sqlite'
+    cache = SQLiteEmbeddingCache(path)
+    embedder = Embedder(TestEmbeddingModel(), cache=cache)
+    result = await embedder.embed_documents(['hello', 'world'])
+    cache.close()
+
+    # A new cache using the same file reuses the stored embeddings
+    cache = SQLiteEmbeddingCache(path, memory_cache_size=0)
+    keys = [
+        embedding_cache_key(provider_name='test', model_name='test', dimensions=None, input_type='document', text=text)
+        for text in ['hello', 'world', 'unknown']
+    ]
+    assert await cache.get(keys) == [result.embeddings[0], result.embeddings[1], None]
+
+    await cache.set({keys[2]: [0.1, 0.2]})
+    await cache.set({})
+    assert await SQLiteEmbeddingCache(path).get(keys[2:]) == [[0.1, 0.2]]
+    cache.close()
+
+
+@pytest.mark.skipif(not numpy_imports_successful(), reason='numpy not installed')
+async def test_numpy_embeddings():
+    model = TestEmbeddingModel(dimensions=4)
+    embedder = Embedder(model, settings={'numpy_embeddings': True, 'max_batch_size': 2})
+
+    result = await embedder.embed_documents(['a', 'b', 'c'])
+    assert isinstance(result.embeddings, np.ndarray)
+    assert result.embeddings.dtype == np.float32
+    assert result.embeddings.shape == (3, 4)
+    assert list(result['b']) == [1.0, 1.0, 1.0, 1.0]
+
+    # Results that are already arrays are concatenated without being converted to lists
+    class NumpyModel(TestEmbeddingModel):
+        async def embed(
+            self, inputs: str | Sequence[str], *, input_type: EmbedInputType, settings: EmbeddingSettings | None = None
+        ) -> EmbeddingResult:
+            result = await super().embed(inputs, input_type=input_type, settings=settings)
+            return replace(result, embeddings=np.arange(len(result.inputs), dtype=np.float32).reshape(-1, 1))
+
+    result = await Embedder(NumpyModel(), settings={'numpy_embeddings': True, 'max_batch_size': 2}).embed_query(
+        ['a', 'b', 'c']
+    )
+    assert result.embeddings.tolist() == [[0.0], [1.0], [0.0]]  # pyright: ignore[reportAttributeAccessIssue]
+
+    # Cache hits are merged into the array
+    embedder = Embedder(model, settings={'numpy_embeddings': True}, cache=InMemoryEmbeddingCache())
+    await embedder.embed_documents(['a'])
+    result = await embedder.embed_documents(['a', 'b'])
+    assert isinstance(result.embeddings, np.ndarray)
+    assert result.embeddings.shape == (2, 4)
+
+
+@pytest.mark.skipif(not numpy_imports_successful(), reason='numpy not installed')
+def test_similarity_and_top_k():
+    documents = EmbeddingResult(
+        embeddings=[[1.0, 0.0], [0.0, 2.0], [1.0, 1.0], [0.0, 0.0]],
+        inputs=['x', 'y', 'xy', 'zero'],
+        input_type='document',
+        model_name='test',
+        provider_name='test',
+    )
+    queries = EmbeddingResult(
+        embeddings=np.array([[3.0, 0.0], [0.0, 1.0]], dtype=np.float32),
+        inputs=['x?', 'y?'],
+        input_type='query',
+        model_name='test',
+        provider_name='test',
+    )
+
+    similarity = queries.similarity(documents)
+    assert similarity.shape == (2, 4)
+    np.testing.assert_allclose(similarity, [[1.0, 0.0, 0.7071, 0.0], [0.0, 1.0, 0.7071, 0.0]], atol=1e-4)
+    assert queries.similarity([[1.0, 0.0]]).tolist() == [[1.0], [0.0]]
+
+    top = queries.top_k(documents, k=2)
+    assert [[(documents.inputs[i], round(score, 4)) for i, score in row] for row in top] == snapshot(
+        [[('x', 1.0), ('xy', 0.7071)], [('y', 1.0), ('xy', 0.7071)]]
+    )
+    assert len(queries.top_k(documents, k=10)[0]) == 4
+    assert queries.top_k(documents, k=0) == [[], []]
+
+
+@pytest.mark.skipif(
+    not numpy_imports_successful() or not openai_imports_successful(), reason='numpy or OpenAI not installed'
+)
+def test_openai_numpy_embeddings():
+    from openai.types import Embedding
+
+    from pydantic_ai.embeddings.openai import _numpy_embeddings  # pyright: ignore[reportPrivateUsage]
+
+    vectors = np.array([[0.5, -1.0, 2.0], [1.0, 0.0, 0.25]], dtype=np.float32)
+    data = [
+        Embedding.model_construct(embedding=base64.b64encode(vector.tobytes()).decode(), index=i, object='embedding')
+        for i, vector in enumerate(vectors)
+    ]
+    embeddings = _numpy_embeddings(data)
+    assert isinstance(embeddings, np.ndarray)
+    assert embeddings.tolist() == vectors.tolist()
+
+    # OpenAI-compatible APIs may return floats even when base64 is supported
+    data = [Embedding(embedding=vector.tolist(), index=i, object='embedding') for i, vector in enumerate(vectors)]
+    assert _numpy_embeddings(data).tolist() == vectors.tolist()  # pyright: ignore[reportAttributeAccessIssue]
+
+
 def test_result():
     result = EmbeddingResult(
         embeddings=[[-1.0], [-0.5], [0.0], [0.5], [1.0]],
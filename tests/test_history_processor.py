@@ -1,4 +1,5 @@
 from collections.abc import AsyncIterator
+from dataclasses import replace
 from typing import Any
 
 import pytest
@@ -6,19 +7,27 @@ from inline_snapshot import snapshot
 
 from pydantic_ai import (
     Agent,
+    IncrementalHistoryProcessor,
     ModelMessage,
     ModelRequest,
     ModelRequestPart,
     ModelResponse,
     SystemPromptPart,
     TextPart,
+    ThinkingPart,
+    ToolCallPart,
+    ToolReturnPart,
     UserPromptPart,
     capture_run_messages,
 )
+from pydantic_ai._agent_graph import (
+    _clean_message_history,  # pyright: ignore[reportPrivateUsage]
+    _MessageHistoryCache,  # pyright: ignore[reportPrivateUsage]
+)
 from pydantic_ai.exceptions import UserError
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.tools import RunContext
-from pydantic_ai.usage import RequestUsage
+from pydantic_ai.usage import RequestUsage, RunUsage
 
 from .conftest import IsDatetime, IsStr
 
@@ -879,3 +888,121 @@ async def test_callable_class_history_processor_with_ctx_no_op(
         ]
     )
     assert result.new_messages() == result.all_messages()[-2:]
+
+
+async def test_incremental_history_processor():
+    def return_model(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(messages) < 7:
+            return ModelResponse(parts=[ToolCallPart('get_value', {}, tool_call_id=f'call_{len(messages)}')])
+        return ModelResponse(parts=[TextPart(content='done')])
+
+    calls: list[tuple[int, int]] = []
+
+    class FilterThinking(IncrementalHistoryProcessor[None]):
+        async def process_new_messages(
+            self, ctx: RunContext[None], previous_output: list[ModelMessage], new_messages: list[ModelMessage]
+        ) -> list[ModelMessage]:
+            calls.append((len(previous_output), len(new_messages)))
+            return previous_output + [
+                replace(m, parts=[p for p in m.parts if not isinstance(p, ThinkingPart)])
+                if isinstance(m, ModelResponse)
+                else m
+                for m in new_messages
+            ]
+
+    agent = Agent(FunctionModel(return_model), history_processors=[FilterThinking()])
+
+    @agent.tool_plain
+    def get_value() -> int:
+        return 1
+
+    message_history: list[ModelMessage] = [
+        ModelRequest(parts=[UserPromptPart(content='Previous question')]),
+        ModelResponse(parts=[ThinkingPart(content='Thinking'), TextPart(content='Previous answer')]),
+    ]
+    result = await agent.run('New question', message_history=message_history)
+    assert result.output == 'done'
+
+    # Only the first model request processes the whole history, the next ones only get the response and tool return
+    assert calls == [(0, 3), (3, 2), (5, 2)]
+    assert [part.part_kind for message in result.all_messages() for part in message.parts] == snapshot(
+        [
+            'user-prompt',
+            'text',
+            'user-prompt',
+            'tool-call',
+            'tool-return',
+            'tool-call',
+            'tool-return',
+            'text',
+        ]
+    )
+
+    # Used as a regular history processor, it processes all messages
+    calls.clear()
+    run_context = RunContext[None](deps=None, model=FunctionModel(return_model), usage=RunUsage())
+    assert len(await FilterThinking()(run_context, message_history)) == 2
+    assert calls == [(0, 2)]
+
+
+async def test_incremental_history_processor_after_replacing_processor():
+    calls: list[tuple[int, int]] = []
+
+    class NoOp(IncrementalHistoryProcessor[None]):
+        async def process_new_messages(
+            self, ctx: RunContext[None], previous_output: list[ModelMessage], new_messages: list[ModelMessage]
+        ) -> list[ModelMessage]:
+            calls.append((len(previous_output), len(new_messages)))
+            return previous_output + new_messages
+
+    def keep_last_message(messages: list[ModelMessage]) -> list[ModelMessage]:
+        return messages[-1:]
+
+    def return_model(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        if len(calls) < 3:
+            return ModelResponse(parts=[ToolCallPart('get_value', {})])
+        return ModelResponse(parts=[TextPart(content='done')])
+
+    agent = Agent(FunctionModel(return_model), history_processors=[NoOp(), keep_last_message])
+
+    @agent.tool_plain
+    def get_value() -> int:
+        return 1
+
+    await agent.run('Question')
+    # After the second request, the history was replaced by another processor, so the previous output can't be reused
+    assert calls == [(0, 1), (1, 2), (0, 3)]
+
+
+def test_message_history_cache_clean():
+    cache = _MessageHistoryCache()
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[UserPromptPart(content='Question')]),
+        ModelResponse(parts=[ToolCallPart('tool', {}, tool_call_id='1')]),
+        ModelRequest(parts=[UserPromptPart(content='Interruption')]),
+        ModelRequest(parts=[ToolReturnPart('tool', 'result', tool_call_id='1')]),
+    ]
+    assert cache.clean(messages) == _clean_message_history(messages)
+
+    messages += [
+        ModelResponse(parts=[TextPart(content='Answer')]),
+        ModelRequest(parts=[UserPromptPart(content='Next question')]),
+    ]
+    clean_messages = cache.clean(messages)
+    assert clean_messages == _clean_message_history(messages)
+    assert clean_messages[2].parts == snapshot(
+        [
+            ToolReturnPart(tool_name='tool', content='result', tool_call_id='1', timestamp=IsDatetime()),
+            UserPromptPart(content='Interruption', timestamp=IsDatetime()),
+        ]
+    )
+
+    # Modifying a message that was merged into another one invalidates the cache
+    messages[2].parts = [UserPromptPart(content='Changed interruption')]
+    clean_messages = cache.clean(messages)
+    assert clean_messages == _clean_message_history(messages)
+    assert clean_messages[2].parts[1] == UserPromptPart(content='Changed interruption', timestamp=IsDatetime())
+
+    # As does replacing messages
+    messages = messages[:1]
+    assert cache.clean(messages) == messages
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import re
 from datetime import timezone
@@ -129,6 +130,31 @@ async def test_context_manager_initialization_error() -> None:
     assert server._write_stream._closed  # pyright: ignore[reportPrivateUsage]
 
 
+async def test_stdio_server_session_pool(run_context: RunContext[int]):
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'], pool_size=3)
+    async with server:
+        sessions = server._sessions  # pyright: ignore[reportPrivateUsage]
+        assert len(sessions) == 3
+        assert sessions[0].client is server._client  # pyright: ignore[reportPrivateUsage]
+        assert len({id(session.client) for session in sessions}) == 3
+
+        tools = await server.get_tools(run_context)
+        assert len(tools) == snapshot(20)
+
+        results = await asyncio.gather(
+            *[server.direct_call_tool('celsius_to_fahrenheit', {'celsius': celsius}) for celsius in (0, 10, 20, 30)]
+        )
+        assert results == snapshot([32.0, 50.0, 68.0, 86.0])
+        assert [session.active_requests for session in sessions] == [0, 0, 0]
+
+    assert server._sessions == []  # pyright: ignore[reportPrivateUsage]
+
+
+def test_session_pool_size_validation():
+    with pytest.raises(ValueError, match='`pool_size` must be at least 1, got 0.'):
+        MCPServerStdio('python', ['-m', 'tests.mcp_server'], pool_size=0)
+
+
 async def test_aexit_called_more_times_than_aenter():
     server = MCPServerStdio('python', ['-m', 'tests.mcp_server'])
 
@@ -2320,6 +2346,28 @@ async def test_tools_cache_invalidation_on_notification() -> None:
         assert 'hidden_tool' in tool_names2
 
 
+async def test_toolset_tools_reused_until_notification(run_context: RunContext[int]) -> None:
+    """Test that the toolset tools are reused until a ToolListChangedNotification is received."""
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'])
+    assert server.has_static_tools
+    async with server:
+        tools1 = await server.get_tools(run_context)
+        assert await server.get_tools(run_context) is tools1
+        assert 'hidden_tool' not in tools1
+
+        # Enable the hidden tool (server sends ToolListChangedNotification)
+        await server.direct_call_tool('enable_hidden_tool', {})
+
+        tools2 = await server.get_tools(run_context)
+        assert tools2 is not tools1
+        assert 'hidden_tool' in tools2
+
+    server = MCPServerStdio('python', ['-m', 'tests.mcp_server'], cache_tools=False)
+    assert not server.has_static_tools
+    async with server:
+        assert await server.get_tools(run_context) is not await server.get_tools(run_context)
+
+
 async def test_resources_caching_enabled_by_default() -> None:
     """Test that list_resources() caches results by default."""
     server = MCPServerStdio('python', ['-m', 'tests.mcp_server'])
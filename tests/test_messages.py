@@ -326,6 +326,19 @@ def test_binary_content_base64():
     assert bc.data_uri == 'data:image/png;base64,SGVsbG8sIHdvcmxkIQ=='
 
 
+def test_binary_content_base64_memoized():
+    bc = BinaryContent(data=b'Hello, world!', media_type='image/png')
+    assert bc.base64 is bc.base64
+    assert bc.data_uri is bc.data_uri
+
+    # The encodings follow the data and media type if they're reassigned
+    bc.data = b'Bye!'
+    assert bc.base64 == 'QnllIQ=='
+    bc.media_type = 'image/jpeg'
+    assert bc.data_uri == 'data:image/jpeg;base64,QnllIQ=='
+    assert bc == BinaryContent(data=b'Bye!', media_type='image/jpeg')
+
+
 @pytest.mark.xdist_group(name='url_formats')
 @pytest.mark.parametrize(
     'video_url,media_type,format',
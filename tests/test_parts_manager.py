@@ -707,3 +707,66 @@ def test_get_part_by_vendor_id():
     assert part == snapshot(TextPart(content='hello', part_kind='text'))
 
     assert manager.get_part_by_vendor_id('missing') is None
+
+
+def test_long_streams_are_joined_lazily():
+    manager = ModelResponsePartsManager()
+
+    for _ in manager.handle_thinking_delta(vendor_part_id='thinking', content='a'):
+        pass
+    for _ in manager.handle_text_delta(vendor_part_id='content', content='b'):
+        pass
+    manager.handle_tool_call_delta(vendor_part_id='tool', tool_name='tool1', args='{"x": "', tool_call_id='call_1')
+
+    thinking_part, text_part, tool_call_part = manager._parts  # pyright: ignore[reportPrivateUsage]
+    for _ in range(20_000):
+        for _ in manager.handle_thinking_delta(vendor_part_id='thinking', content='a'):
+            pass
+        for _ in manager.handle_text_delta(vendor_part_id='content', content='b'):
+            pass
+        manager.handle_tool_call_delta(vendor_part_id='tool', args='c')
+
+    # Deltas are buffered rather than rebuilding the parts on every token
+    assert manager._parts == [thinking_part, text_part, tool_call_part]  # pyright: ignore[reportPrivateUsage]
+
+    event = manager.handle_tool_call_delta(vendor_part_id='tool', args='"}')
+    assert event == snapshot(PartDeltaEvent(index=2, delta=ToolCallPartDelta(args_delta='"}', tool_call_id='call_1')))
+
+    assert manager.get_parts() == [
+        ThinkingPart(content='a' * 20_001),
+        TextPart(content='b' * 20_001),
+        ToolCallPart(tool_name='tool1', args='{"x": "' + 'c' * 20_000 + '"}', tool_call_id='call_1'),
+    ]
+    assert manager.get_part_by_vendor_id('content') == TextPart(content='b' * 20_001)
+
+
+def test_buffered_deltas_with_metadata_changes():
+    manager = ModelResponsePartsManager()
+
+    for _ in manager.handle_text_delta(vendor_part_id='content', content='hello', provider_name='a'):
+        pass
+    for _ in manager.handle_text_delta(vendor_part_id='content', content=' world', provider_name='a'):
+        pass
+    for _ in manager.handle_text_delta(
+        vendor_part_id='content', content='!', provider_name='a', provider_details={'foo': 'bar'}
+    ):
+        pass
+    for _ in manager.handle_thinking_delta(vendor_part_id='thinking', content='think'):
+        pass
+    for _ in manager.handle_thinking_delta(vendor_part_id='thinking', content='ing'):
+        pass
+    for _ in manager.handle_thinking_delta(vendor_part_id='thinking', signature='sig'):
+        pass
+
+    assert manager.get_parts() == snapshot(
+        [
+            TextPart(content='hello world!', provider_name='a', provider_details={'foo': 'bar'}),
+            ThinkingPart(content='thinking', signature='sig'),
+        ]
+    )
+
+    # Overwriting a part discards any deltas buffered for it
+    manager.handle_tool_call_delta(vendor_part_id='tool', tool_name='tool1', args='{"a": ', tool_call_id='call_1')
+    manager.handle_tool_call_delta(vendor_part_id='tool', args='1}')
+    manager.handle_tool_call_part(vendor_part_id='tool', tool_name='tool1', args='{}', tool_call_id='call_2')
+    assert manager.get_parts()[-1] == snapshot(ToolCallPart(tool_name='tool1', args='{}', tool_call_id='call_2'))
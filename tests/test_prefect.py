@@ -7,7 +7,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Literal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
@@ -45,7 +45,7 @@ try:
         PrefectMCPServer,
         PrefectModel,
     )
-    from pydantic_ai.durable_exec.prefect._cache_policies import PrefectAgentInputs
+    from pydantic_ai.durable_exec.prefect._cache_policies import PrefectAgentInputs, hashing_message_history
 except ImportError:  # pragma: lax no cover
     pytest.skip('Prefect is not installed', allow_module_level=True)
 
@@ -1168,6 +1168,45 @@ async def test_cache_policy_empty_inputs():
     assert result is None
 
 
+async def test_cache_policy_hashes_each_message_once():
+    """Test that within an agent run, message histories are hashed incrementally."""
+    cache_policy = PrefectAgentInputs()
+    mock_task_ctx = MagicMock()
+
+    messages: list[ModelMessage] = [
+        ModelRequest(parts=[UserPromptPart(content='What is the capital of France?')]),
+        ModelResponse(parts=[TextPart(content='The capital of France is Paris.')]),
+        ModelRequest(parts=[UserPromptPart(content='And of Spain?')]),
+    ]
+
+    def compute_key(messages: list[ModelMessage]) -> str | None:
+        return cache_policy.compute_key(task_ctx=mock_task_ctx, inputs={'messages': messages}, flow_parameters={})
+
+    # Keys computed outside of an agent run, from scratch
+    expected_keys = [compute_key(messages[:1]), compute_key(messages)]
+
+    from pydantic_ai.durable_exec.prefect import _cache_policies
+
+    with (
+        patch.object(_cache_policies, '_message_digest', wraps=_cache_policies._message_digest) as message_digest,
+        hashing_message_history(),
+    ):
+        assert compute_key(messages[:1]) == expected_keys[0]
+        assert message_digest.call_count == 1
+
+        assert compute_key(messages) == expected_keys[1]
+        assert message_digest.call_count == 3
+
+        # A history that doesn't extend the previous one reuses the hashes of messages that were already seen
+        assert compute_key(messages[1:]) != expected_keys[1]
+        assert message_digest.call_count == 3
+
+        # A message that had parts added to it is hashed again
+        messages[2].parts = [*messages[2].parts, UserPromptPart(content='And of Italy?')]
+        assert compute_key(messages) != expected_keys[1]
+        assert message_digest.call_count == 4
+
+
 # Test custom model settings
 class CustomModelSettings(ModelSettings, total=False):
     custom_setting: str
@@ -857,6 +857,29 @@ class TestPartialOutput:
             ]
         )
 
+    async def test_output_validator_structured_skips_unchanged_output(self):
+        """Test that partial validation is skipped when only parts other than the output tool call change."""
+        call_log: list[tuple[Foo, bool]] = []
+
+        async def sf(_: list[ModelMessage], info: AgentInfo) -> AsyncIterator[DeltaToolCalls]:
+            assert info.output_tools is not None
+            yield {0: DeltaToolCall(name=info.output_tools[0].name, json_args='{"a": 42, "b": "foo"}')}
+            yield {1: DeltaToolCall(name=info.output_tools[0].name, json_args='{"a": 1')}
+            yield {1: DeltaToolCall(json_args=', "b": "bar"}')}
+
+        agent = Agent(FunctionModel(stream_function=sf), output_type=Foo)
+
+        @agent.output_validator
+        def validate_output(ctx: RunContext[None], output: Foo) -> Foo:
+            call_log.append((output, ctx.partial_output))
+            return output
+
+        async with agent.run_stream('test') as result:
+            outputs = [output async for output in result.stream_output(debounce_by=None)]
+
+        assert outputs == snapshot([Foo(a=42, b='foo'), Foo(a=42, b='foo')])
+        assert call_log == snapshot([(Foo(a=42, b='foo'), True), (Foo(a=42, b='foo'), False)])
+
     async def test_output_function_text(self):
         """Test that output functions receive correct value for `partial_output` with text output."""
         call_log: list[tuple[str, bool]] = []
@@ -885,6 +908,21 @@ class TestPartialOutput:
             ]
         )
 
+    async def test_stream_output_text_yields_each_delta(self):
+        """Test that a long text output is yielded after every delta, not only once it has grown substantially."""
+        chunks = ['x' * 8] * 400
+
+        async def sf(_: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+            for chunk in chunks:
+                yield chunk
+
+        agent = Agent(FunctionModel(stream_function=sf))
+
+        async with agent.run_stream('test') as result:
+            outputs = [output async for output in result.stream_output(debounce_by=None)]
+
+        assert [len(output) for output in outputs] == [8 * i for i in range(1, 401)] + [3200]
+
     async def test_output_function_structured(self):
         """Test that output functions receive correct value for `partial_output` with structured output."""
         call_log: list[tuple[Foo, bool]] = []
@@ -7,6 +7,7 @@ from collections.abc import AsyncIterable, AsyncIterator, Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
+from pathlib import Path
 from typing import Any, Literal
 
 import pytest
@@ -72,6 +73,7 @@ try:
 
     from pydantic_ai.durable_exec.temporal import (
         AgentPlugin,
+        FileMessageStore,
         LogfirePlugin,
         PydanticAIPlugin,
         PydanticAIWorkflow,
@@ -1394,6 +1396,66 @@ async def test_temporal_agent_run_sync_in_workflow(allow_model_requests: None, c
             )
 
 
+def get_mexico_capital() -> str:
+    return 'Mexico City'
+
+
+def message_store_model_function(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+    if len(messages) == 1:
+        return ModelResponse(parts=[ToolCallPart('get_mexico_capital', {})])
+    return ModelResponse(parts=[TextPart(f'The model received {len(messages)} messages.')])
+
+
+message_store_agent = Agent(
+    FunctionModel(message_store_model_function), name='message_store_agent', tools=[get_mexico_capital]
+)
+message_store = FileMessageStore(Path('.'))
+message_store_temporal_agent = TemporalAgent(
+    message_store_agent, activity_config=BASE_ACTIVITY_CONFIG, message_store=message_store
+)
+
+
+@workflow.defn
+class MessageStoreAgentWorkflow:
+    @workflow.run
+    async def run(self, prompt: str) -> str:
+        result = await message_store_temporal_agent.run(prompt)
+        return result.output
+
+
+async def test_temporal_agent_with_message_store(client: Client, tmp_path: Path):
+    message_store.directory = tmp_path
+
+    async with Worker(
+        client,
+        task_queue=TASK_QUEUE,
+        workflows=[MessageStoreAgentWorkflow],
+        plugins=[AgentPlugin(message_store_temporal_agent)],
+    ):
+        output = await client.execute_workflow(
+            MessageStoreAgentWorkflow.run,
+            args=['What is the capital of Mexico?'],
+            id=MessageStoreAgentWorkflow.__name__,
+            task_queue=TASK_QUEUE,
+        )
+        assert output == snapshot('The model received 3 messages.')
+
+    # The first request and the response and request with the tool result were each stored once
+    assert len(list(tmp_path.glob('*/*.json'))) == 3
+
+
+async def test_file_message_store(tmp_path: Path):
+    store = FileMessageStore(tmp_path / 'messages')
+    assert await store.load('abc123') is None
+
+    await store.store('abc123', b'[]')
+    await store.store('abc123', b'[]')
+    assert await store.load('abc123') == b'[]'
+    assert [path.relative_to(tmp_path).as_posix() for path in tmp_path.glob('**/*.json')] == snapshot(
+        ['messages/ab/abc123.json']
+    )
+
+
 def drop_first_message(msgs: list[ModelMessage]) -> list[ModelMessage]:
     return msgs[1:] if len(msgs) > 1 else msgs
 
@@ -545,6 +545,57 @@ async def test_tool_manager_reuse_self():
     assert tool_manager != updated_tool_manager
 
 
+async def test_static_tools_reused_across_run_steps():
+    def add(a: int, b: int) -> int:
+        return a + b  # pragma: no cover
+
+    def subtract(a: int, b: int) -> int:
+        return a - b  # pragma: no cover
+
+    function_toolset = FunctionToolset[None]([add])
+    other_toolset = FunctionToolset[None]([subtract])
+    toolset = CombinedToolset[None]([function_toolset.prefixed('math'), other_toolset.renamed({'minus': 'subtract'})])
+    assert toolset.has_static_tools
+
+    step_1_tools = await toolset.get_tools(build_run_context(None, run_step=1))
+    step_2_tools = await toolset.get_tools(build_run_context(None, run_step=2))
+    assert step_2_tools is step_1_tools
+    assert list(step_2_tools) == snapshot(['math_add', 'minus'])
+
+    tool_manager = await ToolManager[None](toolset).for_run_step(build_run_context(None, run_step=1))
+    tool_manager = await tool_manager.for_run_step(build_run_context(None, run_step=2))
+    assert tool_manager.tools is step_1_tools
+
+    # Adding a tool invalidates the tools of the toolset and those wrapping and combining it
+    def multiply(a: int, b: int) -> int:
+        return a * b  # pragma: no cover
+
+    function_toolset.add_function(multiply)
+    step_3_tools = await toolset.get_tools(build_run_context(None, run_step=3))
+    assert step_3_tools is not step_1_tools
+    assert list(step_3_tools) == snapshot(['math_add', 'math_multiply', 'minus'])
+    assert await toolset.get_tools(build_run_context(None, run_step=4)) is step_3_tools
+
+
+async def test_dynamic_tools_not_reused():
+    async def prepare_tool(ctx: RunContext[None], tool_def: ToolDefinition) -> ToolDefinition | None:
+        return tool_def if ctx.run_step > 1 else None
+
+    function_toolset = FunctionToolset[None]()
+
+    @function_toolset.tool(prepare=prepare_tool)
+    def add(a: int, b: int) -> int:
+        return a + b  # pragma: no cover
+
+    toolset = CombinedToolset[None]([function_toolset, FunctionToolset[None]()])
+    assert not function_toolset.has_static_tools
+    assert not toolset.has_static_tools
+    assert not function_toolset.filtered(lambda ctx, tool_def: True).has_static_tools
+
+    assert await toolset.get_tools(build_run_context(None, run_step=1)) == {}
+    assert list(await toolset.get_tools(build_run_context(None, run_step=2))) == snapshot(['add'])
+
+
 async def test_tool_manager_retry_logic():
     """Test the retry logic with failed_tools and for_run_step method."""
 
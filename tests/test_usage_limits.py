@@ -2,11 +2,14 @@ import asyncio
 import functools
 import operator
 import re
+from dataclasses import replace
 from datetime import timezone
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from genai_prices import Usage as GenaiPricesUsage, calc_price
+from genai_prices.data_snapshot import DataSnapshot
 from inline_snapshot import snapshot
 from inline_snapshot.extra import warns
 from pydantic import BaseModel
@@ -428,3 +431,46 @@ async def test_parallel_tool_calls_limit_enforced():
 
 def test_usage_unknown_provider():
     assert RequestUsage.extract({}, provider='unknown', provider_url='', provider_fallback='') == RequestUsage()
+
+
+def test_usage_extract_provider_lookups_cached():
+    data = {'model': 'gpt-4o', 'usage': {'prompt_tokens': 10, 'completion_tokens': 20}}
+    with patch.object(DataSnapshot, 'find_provider', autospec=True, side_effect=DataSnapshot.find_provider) as mock:
+        usage = RequestUsage.extract(
+            data,
+            provider='cached-provider',
+            provider_url='https://cached.example.com/v1',
+            provider_fallback='openai',
+            api_flavor='chat',
+        )
+        assert usage == snapshot(RequestUsage(input_tokens=10, output_tokens=20))
+        assert mock.call_count == 3
+
+        assert (
+            RequestUsage.extract(
+                data,
+                provider='cached-provider',
+                provider_url='https://cached.example.com/v1',
+                provider_fallback='openai',
+                api_flavor='chat',
+            )
+            == usage
+        )
+        assert mock.call_count == 3
+
+
+def test_response_cost_lookups_cached():
+    response = ModelResponse(
+        parts=[], usage=RequestUsage(input_tokens=1000), model_name='gpt-4o', provider_name='openai'
+    )
+    unknown_response = replace(response, model_name='unknown-cached-model')
+
+    with patch('pydantic_ai._prices._calc_price', side_effect=calc_price) as mock:
+        assert response.cost().total_price == snapshot(Decimal('0.0025'))
+        assert response.cost().total_price == snapshot(Decimal('0.0025'))
+        assert mock.call_count == 2
+
+        for _ in range(2):
+            with pytest.raises(LookupError, match="Unable to find model with model_ref='unknown-cached-model'"):
+                unknown_response.cost()
+        assert mock.call_count == 3
@@ -4,9 +4,11 @@ import asyncio
 import contextvars
 import functools
 import os
-from collections.abc import AsyncIterator
+import threading
+from collections.abc import AsyncIterator, Iterator
 from importlib.metadata import distributions
 
+import anyio
 import pytest
 from inline_snapshot import snapshot
 
@@ -15,8 +17,10 @@ from pydantic_ai._utils import (
     UNSET,
     PeekableAsyncStream,
     check_object_json_schema,
+    disable_threads,
     group_by_temporal,
     is_async_callable,
+    iterate_in_thread,
     merge_json_schema_defs,
     run_in_executor,
     strip_markdown_fences,
@@ -188,6 +192,67 @@ async def test_run_in_executor_with_disable_threads() -> None:
         assert calls == ['called']
 
 
+async def test_iterate_in_thread() -> None:
+    thread_ids: set[int] = set()
+
+    def numbers() -> Iterator[int]:
+        for i in range(100):
+            thread_ids.add(threading.get_ident())
+            yield i
+
+    async with iterate_in_thread(numbers()) as stream:
+        assert [i async for i in stream] == list(range(100))
+
+    # All items were read by the same thread, which isn't the event loop's
+    assert len(thread_ids) == 1
+    assert thread_ids != {threading.get_ident()}
+
+
+async def test_iterate_in_thread_error() -> None:
+    def numbers() -> Iterator[int]:
+        yield 1
+        yield 2
+        raise ValueError('broken stream')
+
+    received: list[int] = []
+    with pytest.raises(ValueError, match='broken stream'):
+        async with iterate_in_thread(numbers()) as stream:
+            async for i in stream:
+                received.append(i)
+    assert received == [1, 2]
+
+
+async def test_iterate_in_thread_stop_while_blocked() -> None:
+    release = threading.Event()
+
+    def numbers() -> Iterator[int]:
+        yield 1
+        release.wait()
+        yield 2  # pragma: lax no cover
+
+    with anyio.fail_after(5):
+        async with iterate_in_thread(numbers()) as stream:
+            async for i in stream:  # pragma: no branch
+                assert i == 1
+                break
+    # Exiting didn't wait for the blocked thread, which stops once it's unblocked
+    release.set()
+
+
+async def test_iterate_in_thread_with_disable_threads() -> None:
+    thread_ids: set[int] = set()
+
+    def numbers() -> Iterator[int]:
+        for i in range(3):
+            thread_ids.add(threading.get_ident())
+            yield i
+
+    with disable_threads():
+        async with iterate_in_thread(numbers()) as stream:
+            assert [i async for i in stream] == [0, 1, 2]
+    assert thread_ids == {threading.get_ident()}
+
+
 def test_is_async_callable():
     def sync_func(): ...  # pragma: no branch
 